@@ -15,6 +15,10 @@ load_dotenv()
 # Base directories
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
+LLM_CACHE_DIR = DATA_DIR / "llm_cache"
+LLM_CACHE_DB = LLM_CACHE_DIR / "responses.sqlite3"
+COMPANIES_JSONL = DATA_DIR / "companies" / "companies.jsonl"
+OUTREACH_JSONL = DATA_DIR / "outreach" / "messages.jsonl"
 
 # Create required directories if they don't exist
 for dir_path in [
@@ -23,7 +27,8 @@ for dir_path in [
     DATA_DIR / "companies", 
     DATA_DIR / "stakeholders",
     DATA_DIR / "outreach",
-    DATA_DIR / "usage_reports"
+    DATA_DIR / "usage_reports",
+    LLM_CACHE_DIR
 ]:
     dir_path.mkdir(exist_ok=True)
 
@@ -66,7 +71,7 @@ LLM_CONFIG = {
     },
     "stakeholder_identification": {
         "provider": "openai",
-        "model": "gpt-4-turbo",  # Strong organizational understanding
+        "model": "gpt-4o-mini",  # Strong organizational understanding at low cost
         "temperature": 0.4,      # Some creativity for role inference
         "max_tokens": 1200,
     },
@@ -82,7 +87,9 @@ LLM_CONFIG = {
 TOKEN_PRICING = {
     "gpt-3.5-turbo": {"input": 0.0005, "output": 0.0015},
     "gpt-4-turbo": {"input": 0.01, "output": 0.03},
+    "gpt-4o-mini": {"input": 0.00015, "cached_input": 0.000075, "output": 0.0006},
     "claude-3-opus": {"input": 0.015, "output": 0.075},
+    "text-embedding-3-small": {"input": 0.00002, "output": 0.0},
     "perplexity": {"request": 0.01}  # Per request estimate
 }
 
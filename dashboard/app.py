@@ -148,13 +148,22 @@ def load_outreach_messages():
     messages = []
     outreach_dir = DATA_DIR / "outreach"
     if outreach_dir.exists():
+        # Messages are appended to one JSONL file; older runs wrote one file per message
+        message_records = []
+        outreach_jsonl = outreach_dir / "messages.jsonl"
+        if outreach_jsonl.exists():
+            with open(outreach_jsonl, "r") as f:
+                message_records.extend(line for line in f if line.strip())
         for message_file in outreach_dir.glob("*.json"):
+            with open(message_file, "r") as f:
+                message_records.append(f.read())
+        
+        for record in message_records:
             try:
-                with open(message_file, "r") as f:
-                    message_data = json.load(f)
-                    # Only include messages with complete data
-                    if all(message_data.get(k) for k in ["subject", "message_body", "stakeholder_name", "company_name"]):
-                        messages.append(message_data)
+                message_data = json.loads(record)
+                # Only include messages with complete data
+                if all(message_data.get(k) for k in ["subject", "message_body", "stakeholder_name", "company_name"]):
+                    messages.append(message_data)
             except Exception as e:
                 pass
     
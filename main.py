@@ -12,7 +12,7 @@ import json
 from pathlib import Path
 from datetime import datetime
 from src.utils.cost_tracker import get_current_usage, log_usage_report
-from config.config import DATA_DIR
+from config.config import DATA_DIR, OUTREACH_JSONL
 
 def init_project():
     """
@@ -68,6 +68,9 @@ def show_project_status():
     company_count = len(list(Path(DATA_DIR / "companies").glob("*.json")))
     stakeholder_count = len(list(Path(DATA_DIR / "stakeholders").glob("*.json")))
     outreach_count = len(list(Path(DATA_DIR / "outreach").glob("*.json")))
+    if OUTREACH_JSONL.exists():
+        with open(OUTREACH_JSONL, "rb") as f:
+            outreach_count += sum(1 for line in f if line.strip())
     
     print("\n===== DATA STATUS =====")
     print(f"Events researched: {event_count}")
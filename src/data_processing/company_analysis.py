@@ -13,20 +13,36 @@ emphasizing conversion potential over mere awareness.
 
 import os
 import json
-import time
 import uuid
 from pathlib import Path
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import random
 
-from config.config import TEDLAR_CONTEXT, LLM_CONFIG, DATA_DIR, LEAD_SCORING
+from config.config import TEDLAR_CONTEXT, LLM_CONFIG, DATA_DIR, COMPANIES_JSONL
 from src.llm.llm_client import call_openai_api
-from src.llm.prompt_templates import BASE_TEDLAR_CONTEXT
+from src.llm.prompt_schemas import COMPANY_QUALIFICATION_SCHEMA, COMPANY_QUALIFICATION_BATCH_SCHEMA, response_format_for
+from src.llm.prompt_templates import (
+    BASE_TEDLAR_CONTEXT, LEAD_SCORING_JSON,
+    COMPANY_QUALIFICATION_BATCH_SYSTEM_PROMPT, COMPANY_QUALIFICATION_BATCH_USER_PROMPT,
+    build_prompt_messages
+)
 from src.utils.cost_tracker import is_budget_available, log_usage_report
 from src.utils.data_models import Company
 from src.utils.lead_scoring import calculate_lead_score, get_lead_priority, should_use_premium_model, generate_qualification_rationale
 
+# Prefer orjson for parsing LLM responses (falls back to stdlib json if unavailable)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Companies qualified per LLM call; the shared instructions and scoring
+# rubric are sent once per batch instead of once per company
+QUALIFICATION_BATCH_SIZE = 8
+
 def load_events_and_associations() -> List[Dict[str, Any]]:
     """
     Load analyzed events and associations data.
@@ -79,11 +95,14 @@ def load_events_and_associations() -> List[Dict[str, Any]]:
         -float(g.get("relevance_score", 0))
     ))
     
+    type_counts = Counter(g.get("type") for g in gatherings)
+    priority_counts = Counter(g.get("priority") for g in gatherings)
+    
     print(f"Loaded {len(gatherings)} industry gatherings:")
-    print(f"- Events: {sum(1 for g in gatherings if g.get('type') == 'event')}")
-    print(f"- Associations: {sum(1 for g in gatherings if g.get('type') == 'association')}")
-    print(f"- High priority: {sum(1 for g in gatherings if g.get('priority') == 'high')}")
-    print(f"- Medium priority: {sum(1 for g in gatherings if g.get('priority') == 'medium')}")
+    print(f"- Events: {type_counts['event']}")
+    print(f"- Associations: {type_counts['association']}")
+    print(f"- High priority: {priority_counts['high']}")
+    print(f"- Medium priority: {priority_counts['medium']}")
     
     return gatherings
 
@@ -195,7 +214,7 @@ def discover_companies_for_gathering(gathering: Dict[str, Any]) -> List[Dict[str
         # First, try standard JSON parsing for complete responses
         try:
             # Try parsing directly first
-            discovered_companies = json.loads(content)
+            discovered_companies = _json_loads(content)
             # Check if it's already an array
             if not isinstance(discovered_companies, list):
                 # If it's an object with a companies field, use that
@@ -225,7 +244,7 @@ def discover_companies_for_gathering(gathering: Dict[str, Any]) -> List[Dict[str
                         if not company_str.strip().endswith('}'):
                             company_str += '}'
                         try:
-                            company_obj = json.loads(company_str)
+                            company_obj = _json_loads(company_str)
                             company_objects.append(company_obj)
                         except:
                             pass
@@ -335,30 +354,14 @@ def qualify_company(company: Dict[str, Any]) -> Dict[str, Any]:
     print(f"Qualifying company: {company['name']}...")
     
     # Budget check - using premium models only for promising leads
-    # Check initial qualification score to determine if premium model is justified
-    initial_score = company.get("qualification_score", 0.0)
-    
-    # Only use premium model if initial score suggests a good fit
-    model_tier = "qualification" if initial_score >= 6.0 else "initial_screening"
-    estimated_cost = 0.10 if model_tier == "qualification" else 0.02
+    model_config, operation, estimated_cost = select_qualification_model(company)
     
     if not is_budget_available("company_analysis", estimated_cost):
         print(f"WARNING: Insufficient budget for detailed qualification of {company['name']}.")
         return company
     
     # Format company details for the prompt
-    company_details = f"""
-    Company Name: {company['name']}
-    Industry: {company['industry']}
-    Description: {company['description']}
-    Estimated Revenue: {company['revenue_estimate']}
-    Estimated Size: {company['size_estimate']}
-    Website: {company.get('website', 'Unknown')}
-    
-    Initial Assessment: {company.get('qualification_rationale', '')}
-    
-    Found through: {company['source_gathering_type']} - {company['source_gathering_name']}
-    """
+    company_details = format_company_details(company)
     
     # Direct prompt construction
     prompt = f"""
@@ -371,7 +374,7 @@ def qualify_company(company: Dict[str, Any]) -> Dict[str, Any]:
     DETAILS: {company_details}
 
     Evaluate this company against our lead scoring criteria:
-    {json.dumps(LEAD_SCORING, indent=2)}
+    {LEAD_SCORING_JSON}
 
     For each criterion:
 
@@ -409,37 +412,82 @@ def qualify_company(company: Dict[str, Any]) -> Dict[str, Any]:
     Calculate a weighted qualification score and provide a comprehensive qualification rationale.
     Focus on conversion potential rather than general awareness.
 
-    FORMAT YOUR RESPONSE AS JSON with scores, justifications, and detailed analysis.
+    FORMAT YOUR RESPONSE AS JSON with the keys industry_relevance, product_fit, decision_maker_access,
+    current_engagement and market_presence, each an object with a score and a justification, plus
+    use_cases and pain_points as lists of strings.
     """
     
-    # Use appropriate model based on initial qualification
-    if model_tier == "qualification":
-        # Premium model for promising leads - use GPT-4 instead of Claude
-        model_config = {
-            "model": "gpt-4-turbo",
-            "temperature": 0.3,
-            "max_tokens": 1500,
-        }
-        operation = "detailed_qualification"
-    else:
-        # Cost-effective model for basic qualification
-        model_config = LLM_CONFIG["company_analysis"]["initial_screening"]
-        operation = "basic_qualification"
-    
     response = call_openai_api(
         messages=[{"role": "system", "content": prompt}],
         model=model_config["model"],
         temperature=model_config["temperature"],
         max_tokens=model_config["max_tokens"],
         module="company_analysis",
-        operation=operation
+        operation=operation,
+        response_format=response_format_for(model_config["model"], "company_qualification", COMPANY_QUALIFICATION_SCHEMA)
     )
     
-    # Extract and parse the qualification results
-    # Extract and parse the qualification results
-    try:
-        content = response["content"]
+    qualification = parse_qualification_response(company, response["content"])
+    return apply_qualification(company, qualification)
+
+def select_qualification_model(company: Dict[str, Any]) -> Tuple[Dict[str, Any], str, float]:
+    """
+    Choose the qualification model for a company from its initial score.
+    
+    Args:
+        company: Basic company information
         
+    Returns:
+        Tuple of (model configuration, operation name, estimated cost per company)
+    """
+    # Only use premium model if initial score suggests a good fit
+    if company.get("qualification_score", 0.0) >= 6.0:
+        # Premium model for promising leads - use GPT-4 instead of Claude
+        model_config = {
+            "model": "gpt-4-turbo",
+            "temperature": 0.3,
+            "max_tokens": 1500,
+        }
+        return model_config, "detailed_qualification", 0.10
+    
+    # Cost-effective model for basic qualification
+    return LLM_CONFIG["company_analysis"]["initial_screening"], "basic_qualification", 0.02
+
+def format_company_details(company: Dict[str, Any]) -> str:
+    """
+    Format company details for a qualification prompt.
+    
+    Args:
+        company: Basic company information
+        
+    Returns:
+        Company details text
+    """
+    return f"""
+    Company Name: {company['name']}
+    Industry: {company['industry']}
+    Description: {company['description']}
+    Estimated Revenue: {company['revenue_estimate']}
+    Estimated Size: {company['size_estimate']}
+    Website: {company.get('website', 'Unknown')}
+    
+    Initial Assessment: {company.get('qualification_rationale', '')}
+    
+    Found through: {company['source_gathering_type']} - {company['source_gathering_name']}
+    """
+
+def parse_qualification_response(company: Dict[str, Any], content: str) -> Dict[str, Any]:
+    """
+    Parse a single-company qualification response into a qualification dictionary.
+    
+    Args:
+        company: Basic company information
+        content: Raw LLM response content
+        
+    Returns:
+        Qualification dictionary keyed by criterion
+    """
+    try:
         # Debug the raw content
         print(f"DEBUG - Response for {company['name']} - First 100 chars: {content[:100]}")
         
@@ -451,7 +499,7 @@ def qualify_company(company: Dict[str, Any]) -> Dict[str, Any]:
         if json_matches:
             # Use the first JSON block found
             try:
-                qualification = json.loads(json_matches[0])
+                qualification = _json_loads(json_matches[0])
                 print(f"Successfully parsed JSON from markdown block for {company['name']}")
             except json.JSONDecodeError:
                 # If that fails, try standard JSON extraction
@@ -461,7 +509,7 @@ def qualify_company(company: Dict[str, Any]) -> Dict[str, Any]:
                 if json_start >= 0 and json_end > json_start:
                     json_content = content[json_start:json_end]
                     try:
-                        qualification = json.loads(json_content)
+                        qualification = _json_loads(json_content)
                         print(f"Successfully parsed JSON from content for {company['name']}")
                     except:
                         # If both methods fail, create an empty qualification with minimal data
@@ -483,7 +531,7 @@ def qualify_company(company: Dict[str, Any]) -> Dict[str, Any]:
             
             if json_start >= 0 and json_end > json_start:
                 json_content = content[json_start:json_end]
-                qualification = json.loads(json_content)
+                qualification = _json_loads(json_content)
                 print(f"Parsed standard JSON for {company['name']}")
             else:
                 # Handle case where JSON isn't properly formatted
@@ -501,6 +549,19 @@ def qualify_company(company: Dict[str, Any]) -> Dict[str, Any]:
         }
         print(f"Created default qualification data for {company['name']} after error")
     
+    return qualification
+
+def apply_qualification(company: Dict[str, Any], qualification: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Score a company from its qualification analysis.
+    
+    Args:
+        company: Basic company information
+        qualification: Qualification dictionary keyed by criterion
+        
+    Returns:
+        Enhanced company data with detailed qualification analysis
+    """
     # Update company with qualification results
     qualified_company = company.copy()
     
@@ -612,6 +673,147 @@ def qualify_company(company: Dict[str, Any]) -> Dict[str, Any]:
     
     return qualified_company
 
+def qualify_companies_batch(companies: List[Dict[str, Any]], batch_size: int = QUALIFICATION_BATCH_SIZE) -> List[Dict[str, Any]]:
+    """
+    Qualify companies several at a time, one LLM call per batch.
+    
+    Companies are grouped by the model their initial score selects, so each
+    batch keeps the same model tier as qualify_company. Companies missing from
+    a batch response are qualified individually.
+    
+    Args:
+        companies: Basic company information
+        batch_size: Maximum number of companies per LLM call
+        
+    Returns:
+        Qualified companies in input order
+    """
+    # Group company positions by model tier
+    positions_by_operation = {}
+    for position, company in enumerate(companies):
+        _, operation, _ = select_qualification_model(company)
+        positions_by_operation.setdefault(operation, []).append(position)
+    
+    qualified_companies = list(companies)
+    for positions in positions_by_operation.values():
+        for start in range(0, len(positions), batch_size):
+            batch_positions = positions[start:start + batch_size]
+            batch = [companies[position] for position in batch_positions]
+            for position, qualified_company in zip(batch_positions, qualify_company_batch(batch)):
+                qualified_companies[position] = qualified_company
+    
+    return qualified_companies
+
+def qualify_company_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Qualify one batch of companies that share a model tier.
+    
+    Args:
+        batch: Companies to qualify
+        
+    Returns:
+        Qualified companies in batch order
+    """
+    if len(batch) == 1:
+        return [qualify_company(batch[0])]
+    
+    model_config, operation, estimated_cost = select_qualification_model(batch[0])
+    if not is_budget_available("company_analysis", estimated_cost * len(batch)):
+        print(f"WARNING: Insufficient budget for batch qualification of {len(batch)} companies.")
+        return batch
+    
+    print(f"Qualifying {len(batch)} companies in one batch: {', '.join(company['name'] for company in batch)}...")
+    
+    messages = build_prompt_messages(
+        COMPANY_QUALIFICATION_BATCH_SYSTEM_PROMPT,
+        COMPANY_QUALIFICATION_BATCH_USER_PROMPT,
+        companies_json=format_company_batch(batch)
+    )
+    response = call_openai_api(
+        messages=messages,
+        model=model_config["model"],
+        temperature=model_config["temperature"],
+        # Justifications are kept short in batches; 4096 is the completion limit
+        max_tokens=min(4096, 600 * len(batch)),
+        module="company_analysis",
+        operation=f"batch_{operation}",
+        response_format=response_format_for(model_config["model"], "company_qualifications", COMPANY_QUALIFICATION_BATCH_SCHEMA)
+    )
+    
+    qualifications = parse_batch_qualifications(response["content"])
+    qualified_batch = []
+    for idx, company in enumerate(batch, 1):
+        if idx in qualifications:
+            qualified_batch.append(apply_qualification(company, qualifications[idx]))
+        else:
+            print(f"WARNING: No batch qualification returned for {company['name']}; qualifying individually.")
+            qualified_batch.append(qualify_company(company))
+    
+    return qualified_batch
+
+def format_company_batch(batch: List[Dict[str, Any]]) -> str:
+    """
+    Serialize a batch of companies for the batch qualification prompt.
+    
+    Companies are numbered from 1 so the response can be matched back.
+    
+    Args:
+        batch: Companies to qualify
+        
+    Returns:
+        JSON array of company details
+    """
+    return json.dumps([
+        {
+            "id": idx,
+            "name": company["name"],
+            "industry": company.get("industry", ""),
+            "description": company.get("description", ""),
+            "revenue_estimate": company.get("revenue_estimate", ""),
+            "size_estimate": company.get("size_estimate", ""),
+            "website": company.get("website", "Unknown"),
+            "initial_assessment": company.get("qualification_rationale", ""),
+            "found_through": f"{company.get('source_gathering_type', '')} - {company.get('source_gathering_name', '')}"
+        }
+        for idx, company in enumerate(batch, 1)
+    ], indent=2)
+
+def parse_batch_qualifications(content: str) -> Dict[int, Dict[str, Any]]:
+    """
+    Parse a batch qualification response.
+    
+    Args:
+        content: Raw LLM response content
+        
+    Returns:
+        Dictionary mapping company number (from 1) to its qualification
+    """
+    try:
+        entries = _json_loads(content)["qualifications"]
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        print(f"Error parsing batch qualification response: {str(e)}")
+        return {}
+    
+    qualifications = {}
+    for entry in entries:
+        try:
+            qualifications[int(entry["id"])] = entry
+        except (KeyError, TypeError, ValueError):
+            continue
+    return qualifications
+
+# Keywords that point to each customer segment, flattened to (keyword, segment)
+# pairs so segment matching runs in a single loop
+_SEGMENT_KEYWORDS = {
+    "Large Format Print Providers": ["large format", "print provider", "wide format", "banner", "printing service"],
+    "Fleet Graphics Specialists": ["fleet", "vehicle wrap", "automotive graphic", "transit", "car wrap"],
+    "Architectural Graphics Manufacturers": ["architectural", "building", "facade", "interior", "wayfinding"],
+    "Outdoor Advertising Companies": ["billboard", "outdoor advertising", "signage company", "out-of-home"],
+    "Sign Manufacturing Companies": ["sign manufacturer", "signage", "sign maker", "display", "visual communication"],
+    "Material Distributors & Converters": ["distributor", "converter", "supplier", "reseller", "wholesale"]
+}
+_SEGMENT_PAIRS = tuple((keyword, segment) for segment, keywords in _SEGMENT_KEYWORDS.items() for keyword in keywords)
+
 def identify_customer_segment(industry: str, description: str) -> str:
     """
     Identify which of Tedlar's customer segments the company belongs to.
@@ -625,29 +827,14 @@ def identify_customer_segment(industry: str, description: str) -> str:
     """
     combined_text = f"{industry} {description}".lower()
     
-    segment_keywords = {
-        "Large Format Print Providers": ["large format", "print provider", "wide format", "banner", "printing service"],
-        "Fleet Graphics Specialists": ["fleet", "vehicle wrap", "automotive graphic", "transit", "car wrap"],
-        "Architectural Graphics Manufacturers": ["architectural", "building", "facade", "interior", "wayfinding"],
-        "Outdoor Advertising Companies": ["billboard", "outdoor advertising", "signage company", "out-of-home"],
-        "Sign Manufacturing Companies": ["sign manufacturer", "signage", "sign maker", "display", "visual communication"],
-        "Material Distributors & Converters": ["distributor", "converter", "supplier", "reseller", "wholesale"]
-    }
-    
-    # Count keyword matches for each segment
-    match_counts = {segment: 0 for segment in segment_keywords}
-    
-    for segment, keywords in segment_keywords.items():
-        for keyword in keywords:
-            if keyword in combined_text:
-                match_counts[segment] += 1
-    
-    # Find segment with highest match count
-    best_match = max(match_counts.items(), key=lambda x: x[1])
+    # Count keyword matches for each segment, in segment order so most_common
+    # breaks ties toward the first segment listed
+    match_counts = Counter(segment for keyword, segment in _SEGMENT_PAIRS if keyword in combined_text)
     
     # Return the best matching segment, or a default if no good matches
-    if best_match[1] > 0:
-        return best_match[0]
+    top = match_counts.most_common(1)
+    if top:
+        return top[0][0]
     
     # If no clear match, make an educated guess based on industry
     if "print" in industry.lower():
@@ -708,6 +895,8 @@ def save_company_data(companies: List[Dict[str, Any]]):
     
     Structured data storage is essential for the downstream stakeholder
     identification module, ensuring data integrity throughout the pipeline.
+    Each company is also appended to COMPANIES_JSONL so downstream modules
+    can load every company with a single read.
     
     Args:
         companies: List of qualified and prioritized companies
@@ -724,71 +913,75 @@ def save_company_data(companies: List[Dict[str, Any]]):
                 return obj.isoformat()
             return super().default(obj)
     
-    # Save each company as a separate JSON file
-    for company in companies:
-        try:
-            # Create Company object for validation
-            company_obj = Company(
-                id=company["id"],
-                name=company["name"],
-                industry=company["industry"],
-                description=company["description"],
-                revenue_estimate=company.get("revenue_estimate", ""),
-                size_estimate=company.get("size_estimate", ""),
-                website=company.get("website", ""),
-                qualification_score=company.get("qualification_score", 0.0),
-                qualification_rationale=company.get("qualification_rationale", "")
-            )
+    # Save each company as a separate JSON file and append it to the JSONL stream
+    with open(COMPANIES_JSONL, "a") as jsonl_file:
+        for company in companies:
+            try:
+                # Create Company object for validation
+                company_obj = Company(
+                    id=company["id"],
+                    name=company["name"],
+                    industry=company["industry"],
+                    description=company["description"],
+                    revenue_estimate=company.get("revenue_estimate", ""),
+                    size_estimate=company.get("size_estimate", ""),
+                    website=company.get("website", ""),
+                    qualification_score=company.get("qualification_score", 0.0),
+                    qualification_rationale=company.get("qualification_rationale", "")
+                )
             
-            # Convert to dictionary for saving
-            company_dict = company_obj.model_dump()
+                # Convert to dictionary for saving
+                company_dict = company_obj.model_dump()
             
-            # Add additional fields
-            if "customer_segment" in company:
-                company_dict["customer_segment"] = company["customer_segment"]
+                # Add additional fields
+                if "customer_segment" in company:
+                    company_dict["customer_segment"] = company["customer_segment"]
                 
-            if "lead_priority" in company:
-                company_dict["lead_priority"] = company["lead_priority"]
+                if "lead_priority" in company:
+                    company_dict["lead_priority"] = company["lead_priority"]
                 
-            if "source_gathering_id" in company:
-                company_dict["source_gathering_id"] = company["source_gathering_id"]
+                if "source_gathering_id" in company:
+                    company_dict["source_gathering_id"] = company["source_gathering_id"]
                 
-            if "source_gathering_name" in company:
-                company_dict["source_gathering_name"] = company["source_gathering_name"]
+                if "source_gathering_name" in company:
+                    company_dict["source_gathering_name"] = company["source_gathering_name"]
                 
-            if "source_gathering_type" in company:
-                company_dict["source_gathering_type"] = company["source_gathering_type"]
+                if "source_gathering_type" in company:
+                    company_dict["source_gathering_type"] = company["source_gathering_type"]
                 
-            if "detailed_qualification" in company:
-                company_dict["detailed_qualification"] = company["detailed_qualification"]
+                if "detailed_qualification" in company:
+                    company_dict["detailed_qualification"] = company["detailed_qualification"]
                 
-            # Save to file
-            company_file = companies_dir / f"{company['id']}.json"
-
-            # Ensure priority is set if missing
-            # Always set the priority based on the current qualification score
-            if "qualification_score" in company_dict:
-                if company_dict["qualification_score"] >= 9.0:
-                    company_dict["lead_priority"] = "exceptional"
-                elif company_dict["qualification_score"] >= 8.0:
-                    company_dict["lead_priority"] = "high_priority"
-                elif company_dict["qualification_score"] >= 6.0:
-                    company_dict["lead_priority"] = "qualified"
+                # Save to file
+                company_file = companies_dir / f"{company['id']}.json"
+
+                # Ensure priority is set if missing
+                # Always set the priority based on the current qualification score
+                if "qualification_score" in company_dict:
+                    if company_dict["qualification_score"] >= 9.0:
+                        company_dict["lead_priority"] = "exceptional"
+                    elif company_dict["qualification_score"] >= 8.0:
+                        company_dict["lead_priority"] = "high_priority"
+                    elif company_dict["qualification_score"] >= 6.0:
+                        company_dict["lead_priority"] = "qualified"
+                    else:
+                        company_dict["lead_priority"] = "low_priority"
                 else:
-                    company_dict["lead_priority"] = "low_priority"
-            else:
-                company_dict["lead_priority"] = "unknown"
+                    company_dict["lead_priority"] = "unknown"
                 
-            print(f"Set priority to {company_dict['lead_priority']} based on score {company_dict.get('qualification_score', 'unknown')}")
+                print(f"Set priority to {company_dict['lead_priority']} based on score {company_dict.get('qualification_score', 'unknown')}")
                     
-            with open(company_file, "w") as f:
-                json.dump(company_dict, f, indent=2, cls=CustomEncoder)
+                with open(company_file, "w") as f:
+                    json.dump(company_dict, f, indent=2, cls=CustomEncoder)
+            
+                jsonl_file.write(json.dumps(company_dict, cls=CustomEncoder) + "\n")
                 
-            print(f"Saved company data for: {company['name']} (Priority: {company.get('lead_priority', 'unknown')})")
-        except Exception as e:
-            print(f"Error saving company {company.get('name', 'unknown')}: {str(e)}")
+                print(f"Saved company data for: {company['name']} (Priority: {company.get('lead_priority', 'unknown')})")
+            except Exception as e:
+                print(f"Error saving company {company.get('name', 'unknown')}: {str(e)}")
 
-def run_company_analysis(limit_gatherings=None, limit_companies_per_gathering=None, debug=False):
+def run_company_analysis(limit_gatherings=None, limit_companies_per_gathering=None, debug=False,
+                         qualification_batch_size=QUALIFICATION_BATCH_SIZE):
     """
     Run the complete company analysis process:
     1. Load events and associations from prior analysis
@@ -804,6 +997,7 @@ def run_company_analysis(limit_gatherings=None, limit_companies_per_gathering=No
         limit_gatherings: Optional limit on number of gatherings to process
         limit_companies_per_gathering: Optional limit on companies per gathering
         debug: Whether to print debug information
+        qualification_batch_size: Companies qualified per LLM call (1 disables batching)
     """
     print("Starting company analysis process...")
     
@@ -830,9 +1024,6 @@ def run_company_analysis(limit_gatherings=None, limit_companies_per_gathering=No
             print(f"Limiting to {limit_companies_per_gathering} companies for {gathering['name']}.")
         
         all_companies.extend(companies)
-        
-        # Small delay to avoid API rate limits
-        time.sleep(0.5)
     
     # De-duplicate companies by name
     unique_companies = {}
@@ -851,19 +1042,14 @@ def run_company_analysis(limit_gatherings=None, limit_companies_per_gathering=No
     print(f"Discovered {len(all_companies)} unique companies across all gatherings.")
     
     # Step 3: Qualify each company with detailed analysis
-    qualified_companies = []
-    for company in all_companies:
-        qualified_company = qualify_company(company)
-        qualified_companies.append(qualified_company)
-        
-        if debug:
+    qualified_companies = qualify_companies_batch(all_companies, batch_size=max(1, qualification_batch_size))
+    
+    if debug:
+        for company, qualified_company in zip(all_companies, qualified_companies):
             print(f"Qualification for {company['name']}:")
             print(f"Score: {qualified_company.get('qualification_score', 0.0)}")
             print(f"Priority: {qualified_company.get('lead_priority', 'unknown')}")
             print(f"Segment: {qualified_company.get('customer_segment', 'unknown')}")
-        
-        # Small delay to avoid API rate limits
-        time.sleep(0.5)
     
     # Step 4: Prioritize companies based on qualification score
     prioritized_companies = prioritize_companies(qualified_companies)
@@ -886,6 +1072,8 @@ def parse_arguments():
     parser.add_argument("--limit-gatherings", type=int, default=None, help="Limit the number of gatherings to process")
     parser.add_argument("--limit-companies", type=int, default=None, help="Limit the number of companies per gathering")
     parser.add_argument("--debug", action="store_true", help="Enable debug output")
+    parser.add_argument("--batch-size", type=int, default=QUALIFICATION_BATCH_SIZE,
+                        help="Companies qualified per LLM call (1 disables batching)")
     return parser.parse_args()
 
 if __name__ == "__main__":
@@ -893,5 +1081,6 @@ if __name__ == "__main__":
     run_company_analysis(
         limit_gatherings=args.limit_gatherings,
         limit_companies_per_gathering=args.limit_companies,
-        debug=args.debug
+        debug=args.debug,
+        qualification_batch_size=args.batch_size
     )
\ No newline at end of file
@@ -13,7 +13,6 @@ concentration of qualified leads.
 
 import os
 import json
-import time
 import uuid
 from pathlib import Path
 from datetime import datetime
@@ -21,10 +20,18 @@ from typing import Dict, Any, List, Optional
 
 from config.config import TEDLAR_CONTEXT, LLM_CONFIG, DATA_DIR
 from src.llm.llm_client import query_perplexity, call_openai_api
-from src.llm.prompt_templates import EVENT_DISCOVERY_PROMPT, EVENT_QUALIFICATION_PROMPT, customize_prompt
+from src.llm.prompt_schemas import EVENT_QUALIFICATION_SCHEMA, response_format_for
+from src.llm.prompt_templates import BASE_TEDLAR_CONTEXT, EVENT_DISCOVERY_PROMPT, EVENT_QUALIFICATION_SYSTEM_PROMPT, EVENT_QUALIFICATION_USER_PROMPT, build_prompt_messages
 from src.utils.cost_tracker import is_budget_available, log_usage_report
 from src.utils.data_models import Event
 
+# Prefer orjson for parsing LLM responses (falls back to stdlib json if unavailable)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 def discover_industry_gatherings() -> List[Dict[str, Any]]:
     """
     Discover relevant industry events, trade associations, and professional bodies
@@ -53,9 +60,10 @@ def discover_industry_gatherings() -> List[Dict[str, Any]]:
         print("WARNING: Insufficient budget for discovery. Using pre-researched gatherings only.")
         return []
     
-    # Query Perplexity with our specialized prompt
+    # Query Perplexity with our specialized prompt (a single query, so the
+    # shared context is prepended here rather than sent as its own message)
     perplexity_response = query_perplexity(
-        enhanced_prompt,
+        BASE_TEDLAR_CONTEXT + enhanced_prompt,
         module="event_research",
         operation="initial_discovery"
     )
@@ -74,7 +82,7 @@ def discover_industry_gatherings() -> List[Dict[str, Any]]:
         
         if json_start >= 0 and json_end > json_start:
             json_content = response_text[json_start:json_end]
-            discovered_gatherings = json.loads(json_content)
+            discovered_gatherings = _json_loads(json_content)
         else:
             # Handle case where JSON isn't properly formatted in the response
             print("WARNING: Could not extract JSON from Perplexity response.")
@@ -143,9 +151,10 @@ def discover_industry_gatherings() -> List[Dict[str, Any]]:
             "source": "Perplexity discovery"
         })
     
+    types = [g["type"] for g in all_gatherings]
     print(f"Discovered {len(all_gatherings)} industry gatherings:")
-    print(f"- Events: {sum(1 for g in all_gatherings if g.get('type') == 'event')}")
-    print(f"- Associations/Organizations: {sum(1 for g in all_gatherings if g.get('type') == 'association')}")
+    print(f"- Events: {types.count('event')}")
+    print(f"- Associations/Organizations: {types.count('association')}")
     return all_gatherings
 
 def analyze_gathering_relevance(gathering: Dict[str, Any]) -> Dict[str, Any]:
@@ -184,25 +193,26 @@ def analyze_gathering_relevance(gathering: Dict[str, Any]) -> Dict[str, Any]:
     
     # Adjust qualification prompt based on whether this is an event or association
     if gathering['type'] == 'association':
-        qualification_prompt = EVENT_QUALIFICATION_PROMPT.replace(
+        qualification_prompt = EVENT_QUALIFICATION_SYSTEM_PROMPT.replace(
             "Evaluate this event on the following criteria:",
             "Evaluate this industry association/organization on the following criteria:"
         )
     else:
-        qualification_prompt = EVENT_QUALIFICATION_PROMPT
+        qualification_prompt = EVENT_QUALIFICATION_SYSTEM_PROMPT
     
-    # Customize the prompt with gathering details
-    prompt = customize_prompt(qualification_prompt, event_details=gathering_details)
+    # Gathering details go in the user message, after the static system prompt
+    messages = build_prompt_messages(qualification_prompt, EVENT_QUALIFICATION_USER_PROMPT, event_details=gathering_details)
     
     # Premium model analysis - justified for this high-value qualification task
     gpt4_config = LLM_CONFIG["event_research"]["relevance_analysis"]
     response = call_openai_api(
-        messages=[{"role": "system", "content": prompt}],
+        messages=messages,
         model=gpt4_config["model"],
         temperature=gpt4_config["temperature"],
         max_tokens=gpt4_config["max_tokens"],
         module="event_research",
-        operation="relevance_analysis"
+        operation="relevance_analysis",
+        response_format=response_format_for(gpt4_config["model"], "event_qualification", EVENT_QUALIFICATION_SCHEMA)
     )
     
     # Extract and parse the analysis results
@@ -215,7 +225,7 @@ def analyze_gathering_relevance(gathering: Dict[str, Any]) -> Dict[str, Any]:
         
         if json_start >= 0 and json_end > json_start:
             json_content = content[json_start:json_end]
-            analysis = json.loads(json_content)
+            analysis = _json_loads(json_content)
         else:
             # Handle case where JSON isn't properly formatted
             print("WARNING: Could not extract JSON from GPT-4 response.")
@@ -383,9 +393,6 @@ def run_event_association_research(limit=None, debug=False):
         if debug:
             print(f"Analysis for {gathering['name']}:")
             print(json.dumps(analyzed_gathering.get("detailed_analysis", {}), indent=2))
-        
-        # Small delay to avoid API rate limits
-        time.sleep(0.5)
     
     # Step 3: Prioritize gatherings based on conversion potential
     prioritized_gatherings = prioritize_gatherings(analyzed_gatherings)
@@ -396,13 +403,16 @@ def run_event_association_research(limit=None, debug=False):
     # Track budget usage
     log_usage_report()
     
-    # Print summary
-    high_priority = sum(1 for g in prioritized_gatherings if g.get("priority") == "high")
-    medium_priority = sum(1 for g in prioritized_gatherings if g.get("priority") == "medium")
-    low_priority = sum(1 for g in prioritized_gatherings if g.get("priority") == "low")
+    # Print summary - collect priorities and types once, then count in C
+    priorities = [g["priority"] for g in prioritized_gatherings]
+    types = [g.get("type") for g in prioritized_gatherings]
+    
+    high_priority = priorities.count("high")
+    medium_priority = priorities.count("medium")
+    low_priority = priorities.count("low")
     
-    events_count = sum(1 for g in prioritized_gatherings if g.get("type") == "event")
-    associations_count = sum(1 for g in prioritized_gatherings if g.get("type") == "association")
+    events_count = types.count("event")
+    associations_count = types.count("association")
     
     print("\nEvent & Association Research Summary:")
     print(f"Total gatherings analyzed: {len(prioritized_gatherings)}")
@@ -4,35 +4,130 @@ Stakeholder Identification Module for DuPont Tedlar Lead Generation System.
 This module identifies key decision-makers at qualified companies who would be involved
 in purchasing protective films for graphics and signage applications. It implements 
 a tiered LLM approach:
-- GPT-3.5 Turbo for initial stakeholder discovery (lower cost)
-- GPT-4 Turbo for detailed analysis of high-priority stakeholders (premium model)
+- GPT-4o mini for standard stakeholder discovery (lower cost)
+- GPT-4o mini with a larger response budget for high-priority companies
 
 The focus is on identifying 1-2 high-value stakeholders per company rather than 
 an exhaustive list, emphasizing quality over quantity for conversion-focused outreach.
 """
 
 import os
+import re
 import json
-import time
+import logging
 import uuid
 import random
+import string
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
-from config.config import TEDLAR_CONTEXT, LLM_CONFIG, DATA_DIR
-from src.llm.llm_client import call_openai_api
-from src.llm.prompt_templates import BASE_TEDLAR_CONTEXT, STAKEHOLDER_IDENTIFICATION_PROMPT, LINKEDIN_QUERY_TEMPLATE
+import numpy as np
+from pydantic import TypeAdapter, ValidationError
+
+from config.config import TEDLAR_CONTEXT, LLM_CONFIG, DATA_DIR, COMPANIES_JSONL
+from src.llm.llm_client import call_openai_api, call_openai_batch, call_openai_concurrent
+from src.llm.prompt_schemas import STAKEHOLDER_IDENTIFICATION_SCHEMA, LINKEDIN_BATCH_QUERY_SCHEMA, response_format_for
+from src.llm import semantic_cache
+from src.llm.prompt_templates import (
+    BASE_TEDLAR_CONTEXT,
+    STAKEHOLDER_IDENTIFICATION_SYSTEM_PROMPT, STAKEHOLDER_IDENTIFICATION_USER_PROMPT,
+    LINKEDIN_BATCH_QUERY_SYSTEM_PROMPT, LINKEDIN_BATCH_QUERY_USER_PROMPT,
+    SALES_NAVIGATOR_CONTEXT, TEDLAR_CORE_CONTEXT, build_prompt_messages
+)
 from src.utils.cost_tracker import is_budget_available, log_usage_report
 from src.utils.data_models import Stakeholder
 
+# Validates a whole list of stakeholders in one pydantic-core call
+_STAKEHOLDER_LIST_ADAPTER = TypeAdapter(List[Stakeholder])
+
+logger = logging.getLogger(__name__)
+
+# Prefer orjson for parsing company files and LLM responses (falls back to stdlib json if unavailable)
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Field name variants seen in LLM stakeholder responses, in priority order
+STAKEHOLDER_FIELD_ALIASES = {
+    "name": ["name", "Name", "contact", "Contact", "person", "Person"],
+    "title": ["title", "Title", "jobTitle", "JobTitle", "role", "Role", "position", "Position"],
+    "score": [
+        "decision_maker_score", "decisionMakerScore", "DecisionMakerScore",
+        "score", "Score", "relevance", "Relevance", "priority_score", "PriorityScore"
+    ],
+    "rationale": [
+        "rationale", "Rationale", "decision_maker_rationale", "decisionMakerRationale",
+        "justification", "Justification", "reason", "Reason", "explanation", "Explanation",
+        "JobChallengesAddressed", "jobChallengesAddressed"
+    ],
+    "linkedin_url": [
+        "linkedin_url", "linkedinUrl", "LinkedinUrl", "linkedin", "Linkedin",
+        "linkedInProfile", "LinkedInProfile"
+    ],
+    "responsibilities": ["responsibilities", "Responsibilities", "duties", "Duties", "role_details", "RoleDetails"],
+    "influence": ["influence", "Influence", "influenceInPurchasing", "InfluenceInPurchasing"],
+    "relevant_benefits": [
+        "relevant_benefits", "relevantBenefits", "tedlarBenefits", "TedlarBenefits",
+        "benefits", "Benefits"
+    ]
+}
+
+# Stakeholder responses are factual extractions, so responses from the detailed
+# tier (temperature 0.4) are cached too; the default cache limit is 0.3
+STAKEHOLDER_CACHE_MAX_TEMPERATURE = 0.4
+
+# Sort rank for qualified lead priorities; anything else sorts last
+LEAD_PRIORITY_RANK = {"exceptional": 0, "high_priority": 1, "qualified": 2}
+
+# Stakeholder priority by score band (see prioritize_stakeholders): scores below
+# 6.0 are low, below 8.0 medium, anything else high
+PRIORITY_BANDS = ("low", "medium", "high")
+PRIORITY_THRESHOLDS = np.array([6.0, 8.0])
+
+# Company names generated for unnamed companies (see normalize_company_data)
+_PLACEHOLDER_COMPANY_RE = re.compile(r"^(?:Company-|Unknown Company$)")
+
+# Alphanumeric characters used in Sales Navigator profile IDs
+LINKEDIN_ID_CHARACTERS = string.ascii_letters + string.digits
+LINKEDIN_ID_ARRAY = np.array(list(LINKEDIN_ID_CHARACTERS))
+_RNG = np.random.default_rng()
+
+# Industry keyword -> customer segment, checked in order when a company has no segment
+INDUSTRY_SEGMENT_KEYWORDS = [
+    ("print", "Large Format Print Providers"),
+    ("fleet", "Fleet Graphics Specialists"),
+    ("vehicle", "Fleet Graphics Specialists"),
+    ("architect", "Architectural Graphics Manufacturers"),
+    ("outdoor", "Outdoor Advertising Companies"),
+    ("billboard", "Outdoor Advertising Companies"),
+    ("sign", "Sign Manufacturing Companies"),
+    ("distribut", "Material Distributors & Converters"),
+    ("supply", "Material Distributors & Converters")
+]
+
+# Reverse lookup: alias -> (canonical field, priority rank)
+_ALIAS_TO_FIELD = {
+    alias: (field, rank)
+    for field, aliases in STAKEHOLDER_FIELD_ALIASES.items()
+    for rank, alias in enumerate(aliases)
+}
+
+# Decoder for salvaging stakeholder JSON from free-form LLM responses
+_JSON_DECODER = json.JSONDecoder()
+
 """
 API INTEGRATION PROVISIONS:
 
 This module is designed for future integration with external APIs:
 
 1. LinkedIn Sales Navigator API Integration:
-   - Would replace the `generate_random_linkedin_id()` function with actual API calls
+   - Would replace the `generate_random_linkedin_ids()` function with actual API calls
    - Integration point: After stakeholder identification, before generating the outreach
    - API endpoint would be: https://api.linkedin.com/v2/salesNavigator/lead/{company_id}
    - Sample implementation:
@@ -93,58 +188,133 @@ def load_qualified_companies() -> List[Dict[str, Any]]:
     Returns:
         List of qualified companies
     """
-    print("Loading qualified companies...")
+    logger.info("Loading qualified companies...")
     
     companies = []
     
-    # Load companies
+    # Load companies from the single-file JSONL stream, then from any per-company
+    # files it does not cover (e.g. companies saved before the stream existed)
     companies_dir = DATA_DIR / "companies"
+    if COMPANIES_JSONL.exists():
+        logger.info("Found company stream at: %s", COMPANIES_JSONL)
+        companies.extend(load_companies_jsonl(COMPANIES_JSONL))
     if companies_dir.exists():
-        print(f"Found company directory at: {companies_dir}")
-        company_files = list(companies_dir.glob("*.json"))
-        print(f"Found {len(company_files)} company JSON files")
-        
-        for company_file in companies_dir.glob("*.json"):
-            try:
-                with open(company_file, "r") as f:
-                    company_data = json.load(f)
-                    
-                    # Debug info
-                    print(f"Loaded company: {company_data.get('name', 'Missing name')} (ID: {company_data.get('id', 'No ID')})")
-                    
-                    # Ensure required fields are present
-                    if "name" not in company_data or not company_data["name"] or company_data["name"] == "Unknown Company":
-                        new_name = f"Company-{company_file.stem[-8:]}"
-                        print(f"⚠️ Company missing valid name, assigning: {new_name}")
-                        company_data["name"] = new_name
-                    
-                    # Ensure ID is present
-                    if "id" not in company_data:
-                        company_data["id"] = str(uuid.uuid4())
-                        print(f"Added missing ID to company: {company_data['name']}")
-                    
-                    companies.append(company_data)
-            except Exception as e:
-                print(f"Error loading company data from {company_file}: {str(e)}")
+        logger.info("Found company directory at: %s", companies_dir)
+        # Company files are named by company ID, so covered ones are skipped unread
+        streamed_ids = {str(company["id"]) for company in companies}
+        company_files = [path for path in companies_dir.glob("*.json") if path.stem not in streamed_ids]
+        logger.info("Found %d company JSON files not in the company stream", len(company_files))
+        
+        # File reads are I/O-bound, so overlap them across threads
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            loaded = list(executor.map(load_company_file, company_files))
+        
+        companies.extend(company for company in loaded if company is not None)
+    
+    # Drop duplicate companies (e.g. from re-run analyses) so each is paid for once
+    seen_keys = set()
+    unique_companies = []
+    for company in companies:
+        key = company.get("id") or (company.get("name"), company.get("website"))
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+        unique_companies.append(company)
+    if len(unique_companies) < len(companies):
+        logger.info("Skipped %d duplicate companies", len(companies) - len(unique_companies))
+    companies = unique_companies
     
     # Sort by priority and qualification score
-    companies = sorted(companies, key=lambda c: (
-        0 if c.get("lead_priority") == "exceptional" else (
-            1 if c.get("lead_priority") == "high_priority" else (
-                2 if c.get("lead_priority") == "qualified" else 3
-            )
-        ),
-        -float(c.get("qualification_score", 0))
+    companies.sort(key=lambda c: (
+        LEAD_PRIORITY_RANK.get(c.get("lead_priority"), len(LEAD_PRIORITY_RANK)),
+        -float(c.get("qualification_score", 0) or 0)
     ))
     
-    print(f"Loaded {len(companies)} qualified companies:")
-    print(f"- Exceptional priority: {sum(1 for c in companies if c.get('lead_priority') == 'exceptional')}")
-    print(f"- High priority: {sum(1 for c in companies if c.get('lead_priority') == 'high_priority')}")
-    print(f"- Qualified: {sum(1 for c in companies if c.get('lead_priority') == 'qualified')}")
-    print(f"- Other: {sum(1 for c in companies if c.get('lead_priority') not in ['exceptional', 'high_priority', 'qualified'])}")
+    priority_counts = Counter(c.get("lead_priority") for c in companies)
+    qualified_total = sum(priority_counts[priority] for priority in LEAD_PRIORITY_RANK)
+    
+    logger.info("Loaded %d qualified companies:", len(companies))
+    logger.info("- Exceptional priority: %d", priority_counts['exceptional'])
+    logger.info("- High priority: %d", priority_counts['high_priority'])
+    logger.info("- Qualified: %d", priority_counts['qualified'])
+    logger.info("- Other: %d", len(companies) - qualified_total)
     
     return companies
 
+def load_company_file(company_file: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a single company JSON file, filling in a missing name or ID.
+    
+    Args:
+        company_file: Path to the company JSON file
+        
+    Returns:
+        Company data, or None if the file could not be loaded
+    """
+    try:
+        company_data = _json_loads(company_file.read_bytes())
+        return normalize_company_data(company_data, company_file.stem)
+    except Exception as e:
+        logger.error("Error loading company data from %s: %s", company_file, e)
+        return None
+
+def load_companies_jsonl(jsonl_path: Path) -> List[Dict[str, Any]]:
+    """
+    Load companies from the append-only JSONL stream in a single read.
+    
+    Companies saved by repeated analysis runs appear more than once; the
+    most recently appended record for each ID wins.
+    
+    Args:
+        jsonl_path: Path to the companies JSONL file
+        
+    Returns:
+        List of company data
+    """
+    companies_by_id = {}
+    with open(jsonl_path, "rb") as f:
+        lines = f.read().splitlines()
+    
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            company_data = _json_loads(line)
+        except Exception as e:
+            logger.error("Error loading company data from %s line %d: %s", jsonl_path, line_number, e)
+            continue
+        company_data = normalize_company_data(company_data, str(company_data.get("id", line_number)))
+        companies_by_id[company_data["id"]] = company_data
+    
+    return list(companies_by_id.values())
+
+def normalize_company_data(company_data: Dict[str, Any], source_name: str) -> Dict[str, Any]:
+    """
+    Fill in a missing name or ID on loaded company data.
+    
+    Args:
+        company_data: Company data as loaded from disk
+        source_name: Identifier of the source record, used for placeholder names
+        
+    Returns:
+        Company data with name and ID present
+    """
+    # Debug info
+    logger.debug("Loaded company: %s (ID: %s)", company_data.get('name', 'Missing name'), company_data.get('id', 'No ID'))
+    
+    # Ensure required fields are present
+    if "name" not in company_data or not company_data["name"] or company_data["name"] == "Unknown Company":
+        new_name = f"Company-{source_name[-8:]}"
+        logger.warning("⚠️ Company missing valid name, assigning: %s", new_name)
+        company_data["name"] = new_name
+    
+    # Ensure ID is present
+    if "id" not in company_data:
+        company_data["id"] = str(uuid.uuid4())
+        logger.debug("Added missing ID to company: %s", company_data['name'])
+    
+    return company_data
+
 def generate_name_from_title(title):
     """
     Generate a placeholder name based on job title.
@@ -152,10 +322,42 @@ def generate_name_from_title(title):
     first_names = ["Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Avery", "Quinn"]
     last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis", "Wilson"]
     
-    import random
     return f"{random.choice(first_names)} {random.choice(last_names)}"
 
-def identify_stakeholders_for_company(company: Dict[str, Any]) -> List[Dict[str, Any]]:
+def is_llm_eligible(company: Dict[str, Any]) -> bool:
+    """
+    Check whether a company's lead priority justifies LLM calls.
+    
+    Companies below the qualified tier receive templated segment stakeholders,
+    since the LLM output for them is rarely better than the fallback.
+    
+    Args:
+        company: Company information
+        
+    Returns:
+        True if the company is exceptional, high priority or qualified
+    """
+    return company.get("lead_priority") in LEAD_PRIORITY_RANK
+
+def identify_fallback_stakeholders(company: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Identify stakeholders for a low-priority company without an LLM call.
+    
+    Args:
+        company: Company information
+        
+    Returns:
+        List of segment-specific fallback stakeholders
+    """
+    logger.debug("Using segment fallback stakeholders for %s (priority: %s).", company['name'], company.get('lead_priority', 'unknown'))
+    return enhance_stakeholders(company, build_fallback_stakeholders(company))
+
+def identify_stakeholders_for_company(
+    company: Dict[str, Any],
+    use_cache: bool = True,
+    cache_ttl_seconds: Optional[float] = None,
+    use_semantic_cache: bool = False
+) -> List[Dict[str, Any]]:
     """
     Identify key decision-makers at a qualified company.
     
@@ -164,18 +366,245 @@ def identify_stakeholders_for_company(company: Dict[str, Any]) -> List[Dict[str,
     
     Args:
         company: Qualified company information
+        use_cache: Whether to serve identical prompts from the response cache
+        cache_ttl_seconds: Optional maximum age of cached responses
+        use_semantic_cache: Whether to reuse responses for near-duplicate companies
         
     Returns:
         List of identified stakeholders
     """
-    print(f"Identifying stakeholders for: {company['name']}...")
+    logger.debug("Identifying stakeholders for: %s...", company['name'])
+    
+    # Low-priority companies get templated stakeholders at no API cost
+    if not is_llm_eligible(company):
+        return identify_fallback_stakeholders(company)
     
     # Budget check
     estimated_cost = 0.03  # Approximate cost for initial stakeholder identification
     if not is_budget_available("stakeholder_identification", estimated_cost):
-        print(f"WARNING: Insufficient budget for stakeholder identification for {company['name']}.")
+        logger.warning("Insufficient budget for stakeholder identification for %s.", company['name'])
         return []
     
+    messages, model_config, operation = build_stakeholder_messages(company)
+    
+    semantic_text = build_semantic_cache_text(company)
+    if use_semantic_cache:
+        content = semantic_cache.get(semantic_text, namespace=operation, module="stakeholder_identification")
+        if content is not None:
+            return parse_stakeholder_response(company, content)
+    
+    response = call_openai_api(
+        messages=messages,
+        model=model_config["model"],
+        temperature=model_config["temperature"],
+        max_tokens=model_config["max_tokens"],
+        module="stakeholder_identification",
+        operation=operation,
+        use_cache=use_cache,
+        cache_ttl_seconds=cache_ttl_seconds,
+        cache_max_temperature=STAKEHOLDER_CACHE_MAX_TEMPERATURE,
+        response_format=model_config["response_format"],
+        stream=True
+    )
+    
+    if use_semantic_cache and not response["content"].startswith("Error:"):
+        semantic_cache.put(semantic_text, response["content"], namespace=operation, module="stakeholder_identification")
+    
+    return parse_stakeholder_response(company, response["content"])
+
+def build_semantic_cache_text(company: Dict[str, Any]) -> str:
+    """
+    Build the text embedded for semantic cache lookups of a company.
+    
+    Near-duplicate companies (same segment, similar profile) yield interchangeable
+    stakeholder roles; embed only the company-specific fields, since the shared
+    prompt boilerplate would make every company look alike.
+    
+    Args:
+        company: Qualified company information
+        
+    Returns:
+        Text to embed
+    """
+    return "\n".join([
+        company.get("customer_segment", ""),
+        company.get("industry", ""),
+        company.get("description", ""),
+        ", ".join(company.get("detailed_qualification", {}).get("pain_points", []))
+    ])
+
+def build_stakeholder_requests(companies: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Build multi-company stakeholder identification requests.
+    
+    Companies without remaining budget or below the qualified tier are skipped.
+    No cost is logged until the requests run, so each queued request reserves
+    its estimated cost and later budget checks include those reservations.
+    
+    Args:
+        companies: Qualified company information
+        
+    Returns:
+        Tuple of (requests keyed by company ID as custom_id, companies by ID)
+    """
+    stakeholder_requests = []
+    companies_by_id = {}
+    reserved = 0.0
+    for company in companies:
+        if not is_llm_eligible(company):
+            continue
+        
+        # Budget check
+        estimated_cost = 0.03  # Approximate cost for initial stakeholder identification
+        if not is_budget_available("stakeholder_identification", reserved + estimated_cost):
+            logger.warning("Insufficient budget for stakeholder identification for %s.", company['name'])
+            continue
+        reserved += estimated_cost
+        
+        messages, model_config, operation = build_stakeholder_messages(company)
+        stakeholder_requests.append({
+            "custom_id": str(company["id"]),
+            "messages": messages,
+            "model": model_config["model"],
+            "temperature": model_config["temperature"],
+            "max_tokens": model_config["max_tokens"],
+            "response_format": model_config["response_format"],
+            "stream": True,
+            "operation": operation
+        })
+        companies_by_id[str(company["id"])] = company
+    
+    return stakeholder_requests, companies_by_id
+
+def identify_stakeholders_batch(companies: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Identify key decision-makers for many companies through the OpenAI Batch API.
+    
+    All company prompts are submitted as a single batch job, which halves token
+    cost compared to individual calls at the price of asynchronous completion.
+    Best suited to large offline runs; interactive runs should use
+    identify_stakeholders_concurrent instead.
+    
+    Args:
+        companies: Qualified company information
+        
+    Returns:
+        Dictionary mapping company ID to its list of identified stakeholders
+    """
+    logger.info("Submitting batch stakeholder identification for %d companies...", len(companies))
+    
+    batch_requests, companies_by_id = build_stakeholder_requests(companies)
+    for request in batch_requests:
+        request["operation"] = f"batch_{request['operation']}"
+    
+    responses = call_openai_batch(batch_requests, module="stakeholder_identification") if batch_requests else {}
+    
+    # Dispatch each batch result back to the standard parse/enhance logic
+    stakeholders_by_company = {}
+    for company_id, company in companies_by_id.items():
+        response = responses.get(company_id, {"content": ""})
+        stakeholders_by_company[company_id] = parse_stakeholder_response(company, response["content"])
+    
+    for company in companies:
+        if not is_llm_eligible(company):
+            stakeholders_by_company[str(company["id"])] = identify_fallback_stakeholders(company)
+    
+    return stakeholders_by_company
+
+def identify_stakeholders_concurrent(
+    companies: List[Dict[str, Any]],
+    max_concurrent: int = 8,
+    use_cache: bool = True,
+    cache_ttl_seconds: Optional[float] = None,
+    use_semantic_cache: bool = False
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Identify key decision-makers for many companies with concurrent API calls.
+    
+    Requests run in parallel with bounded concurrency and rate limiting, so
+    wall-clock time scales with rate-limit headroom rather than company count.
+    Cache behaviour matches identify_stakeholders_for_company.
+    
+    Args:
+        companies: Qualified company information
+        max_concurrent: Maximum number of in-flight requests
+        use_cache: Whether to serve identical prompts from the response cache
+        cache_ttl_seconds: Optional maximum age of cached responses
+        use_semantic_cache: Whether to reuse responses for near-duplicate companies
+        
+    Returns:
+        Dictionary mapping company ID to its list of identified stakeholders
+    """
+    logger.info("Identifying stakeholders for %d companies (%d concurrent requests)...", len(companies), max_concurrent)
+    
+    stakeholder_requests, companies_by_id = build_stakeholder_requests(companies)
+    
+    stakeholders_by_company = {}
+    semantic_texts = {}
+    if use_semantic_cache:
+        pending_requests = []
+        for request in stakeholder_requests:
+            company = companies_by_id[request["custom_id"]]
+            semantic_texts[request["custom_id"]] = build_semantic_cache_text(company)
+            content = semantic_cache.get(
+                semantic_texts[request["custom_id"]], namespace=request["operation"], module="stakeholder_identification"
+            )
+            if content is not None:
+                stakeholders_by_company[request["custom_id"]] = parse_stakeholder_response(company, content)
+            else:
+                pending_requests.append(request)
+        stakeholder_requests = pending_requests
+    
+    responses = call_openai_concurrent(
+        stakeholder_requests,
+        module="stakeholder_identification",
+        max_concurrent=max_concurrent,
+        use_cache=use_cache,
+        cache_ttl_seconds=cache_ttl_seconds,
+        cache_max_temperature=STAKEHOLDER_CACHE_MAX_TEMPERATURE
+    ) if stakeholder_requests else {}
+    
+    for request in stakeholder_requests:
+        company_id = request["custom_id"]
+        response = responses.get(company_id, {"content": ""})
+        if use_semantic_cache and response["content"] and not response["content"].startswith("Error:"):
+            semantic_cache.put(
+                semantic_texts[company_id], response["content"], namespace=request["operation"], module="stakeholder_identification"
+            )
+        stakeholders_by_company[company_id] = parse_stakeholder_response(companies_by_id[company_id], response["content"])
+    
+    for company in companies:
+        if not is_llm_eligible(company):
+            stakeholders_by_company[str(company["id"])] = identify_fallback_stakeholders(company)
+    
+    return stakeholders_by_company
+
+def infer_customer_segment(industry: str) -> str:
+    """
+    Infer a customer segment from the company's industry when none is recorded.
+    
+    Args:
+        industry: Company industry
+        
+    Returns:
+        Customer segment name
+    """
+    industry_lower = industry.lower()
+    return next(
+        (segment for keyword, segment in INDUSTRY_SEGMENT_KEYWORDS if keyword in industry_lower),
+        "Sign Manufacturing Companies"  # Default fallback
+    )
+
+def build_stakeholder_messages(company: Dict[str, Any]) -> Tuple[List[Dict[str, str]], Dict[str, Any], str]:
+    """
+    Build the stakeholder identification messages and model settings for a company.
+    
+    Args:
+        company: Qualified company information
+        
+    Returns:
+        Tuple of (chat messages, model configuration, operation name)
+    """
     # Format company details for the prompt
     company_details = f"""
     Company Name: {company['name']}
@@ -194,29 +623,14 @@ def identify_stakeholders_for_company(company: Dict[str, Any]) -> List[Dict[str,
     """
     
     # Get customer segment - critical for identifying the right roles
-    customer_segment = company.get('customer_segment', '')
-    if not customer_segment:
-        # Try to infer from industry if not available
-        if 'print' in company.get('industry', '').lower():
-            customer_segment = "Large Format Print Providers"
-        elif 'fleet' in company.get('industry', '').lower() or 'vehicle' in company.get('industry', '').lower():
-            customer_segment = "Fleet Graphics Specialists"
-        elif 'architect' in company.get('industry', '').lower():
-            customer_segment = "Architectural Graphics Manufacturers"
-        elif 'outdoor' in company.get('industry', '').lower() or 'billboard' in company.get('industry', '').lower():
-            customer_segment = "Outdoor Advertising Companies"
-        elif 'sign' in company.get('industry', '').lower():
-            customer_segment = "Sign Manufacturing Companies"
-        elif 'distribut' in company.get('industry', '').lower() or 'supply' in company.get('industry', '').lower():
-            customer_segment = "Material Distributors & Converters"
-        else:
-            customer_segment = "Sign Manufacturing Companies"  # Default fallback
+    customer_segment = company.get('customer_segment', '') or infer_customer_segment(company.get('industry', ''))
     
     # Direct prompt construction or use template if available
-    if STAKEHOLDER_IDENTIFICATION_PROMPT:
-        from src.llm.prompt_templates import customize_prompt
-        prompt = customize_prompt(
-            STAKEHOLDER_IDENTIFICATION_PROMPT,
+    if STAKEHOLDER_IDENTIFICATION_SYSTEM_PROMPT:
+        messages = build_prompt_messages(
+            STAKEHOLDER_IDENTIFICATION_SYSTEM_PROMPT,
+            STAKEHOLDER_IDENTIFICATION_USER_PROMPT,
+            base_context=TEDLAR_CORE_CONTEXT,
             company_name=company['name'],
             company_details=company_details,
             customer_segment=customer_segment
@@ -269,421 +683,556 @@ def identify_stakeholders_for_company(company: Dict[str, Any]) -> List[Dict[str,
         FORMAT YOUR RESPONSE AS JSON with stakeholder details and decision-making assessment.
         Include a priority ranking of which stakeholders to contact first.
         """
+        messages = [{"role": "system", "content": prompt}]
     
     # Use appropriate model based on company priority
     model_tier = "high_quality" if company.get('lead_priority') in ['exceptional', 'high_priority'] else "standard"
     
     if model_tier == "high_quality":
-        # Use premium model for high-priority companies
+        # Use a larger response budget for high-priority companies
         model_config = {
-            "model": "gpt-4-turbo",
+            "model": "gpt-4o-mini",
             "temperature": 0.4,
             "max_tokens": 1500,
         }
         operation = "detailed_stakeholder_identification"
     else:
-        # Use cost-effective model for standard companies
+        # Use cost-effective settings for standard companies
         model_config = {
-            "model": "gpt-3.5-turbo",
+            "model": "gpt-4o-mini",
             "temperature": 0.3,
             "max_tokens": 1200,
         }
         operation = "standard_stakeholder_identification"
     
-    response = call_openai_api(
-        messages=[{"role": "system", "content": prompt}],
-        model=model_config["model"],
-        temperature=model_config["temperature"],
-        max_tokens=model_config["max_tokens"],
-        module="stakeholder_identification",
-        operation=operation
-    )
+    # Structured outputs guarantee the stakeholder schema, skipping the salvage fallbacks
+    model_config["response_format"] = response_format_for(model_config["model"], "stakeholders", STAKEHOLDER_IDENTIFICATION_SCHEMA)
     
-    # Extract and parse the stakeholders from the response
-    try:
-        content = response["content"]
-        
-        # Debug output to help with troubleshooting
-        print(f"\nDEBUG - First 500 characters of API response:")
-        print(content[:500])
-        print("\n")
+    return messages, model_config, operation
+
+def parse_stakeholder_response(company: Dict[str, Any], content: str) -> List[Dict[str, Any]]:
+    """
+    Parse an LLM stakeholder response into enhanced stakeholder records.
+    
+    Falls back to segment-specific placeholder stakeholders when no structured
+    data can be extracted from the response.
+    
+    Args:
+        company: Qualified company information
+        content: Raw LLM response content
         
-        # Try to parse the JSON response
-        try:
-            # Try direct parsing first
-            stakeholders_data = json.loads(content)
-            
-            # Debug the structure
-            print(f"Parsed JSON structure: {list(stakeholders_data.keys()) if isinstance(stakeholders_data, dict) else 'list'}")
-            
-            # Check all possible structures
-            if isinstance(stakeholders_data, dict):
-                # Try different possible keys for stakeholders
-                if "stakeholders" in stakeholders_data:
-                    stakeholders = stakeholders_data["stakeholders"]
-                elif "Stakeholders" in stakeholders_data:
-                    stakeholders = stakeholders_data["Stakeholders"]
-                elif "people" in stakeholders_data:
-                    stakeholders = stakeholders_data["people"]
-                elif "People" in stakeholders_data:
-                    stakeholders = stakeholders_data["People"]
-                elif "decision_makers" in stakeholders_data:
-                    stakeholders = stakeholders_data["decision_makers"]
-                elif "DecisionMakers" in stakeholders_data:
-                    stakeholders = stakeholders_data["DecisionMakers"]
-                else:
-                    # If no stakeholders array found, check if this is a single stakeholder
-                    if any(key in stakeholders_data for key in ["name", "title", "jobTitle", "JobTitle", "role", "Role"]):
-                        stakeholders = [stakeholders_data]  # Single stakeholder as an object
-                    else:
-                        stakeholders = []
-            elif isinstance(stakeholders_data, list):
-                stakeholders = stakeholders_data
-            else:
-                stakeholders = []
-                
-            # Debug the stakeholders
-            print(f"Found {len(stakeholders)} stakeholders in response")
-            for idx, s in enumerate(stakeholders):
-                print(f"Stakeholder {idx+1} keys: {list(s.keys()) if isinstance(s, dict) else 'not a dict'}")
-                
-        except json.JSONDecodeError:
-            # Try to extract JSON content if direct parsing fails
-            import re
-            
-            # First try to find a JSON object/array
-            json_matches = re.findall(r'```json(.*?)```', content, re.DOTALL)
-            if json_matches:
-                clean_json = json_matches[0].strip()
-                try:
-                    stakeholders_data = json.loads(clean_json)
-                    # Process same as above
-                    if isinstance(stakeholders_data, dict):
-                        if "stakeholders" in stakeholders_data:
-                            stakeholders = stakeholders_data["stakeholders"]
-                        elif "Stakeholders" in stakeholders_data:
-                            stakeholders = stakeholders_data["Stakeholders"]
-                        else:
-                            stakeholders = [stakeholders_data]
-                    elif isinstance(stakeholders_data, list):
-                        stakeholders = stakeholders_data
-                    else:
-                        stakeholders = []
-                except:
-                    stakeholders = []
-            else:
-                # If no JSON object found, use regex to extract
-                stakeholder_patterns = re.findall(r'\{\s*"(?:name|title|jobTitle|JobTitle)".*?(?=\{\s*"(?:name|title|jobTitle|JobTitle)|\Z)', content, re.DOTALL)
-                
-                if stakeholder_patterns:
-                    stakeholders = []
-                    for pattern in stakeholder_patterns:
-                        # Clean up and complete the JSON
-                        if not pattern.strip().endswith('}'):
-                            pattern += '}'
-                        try:
-                            stakeholder = json.loads(pattern)
-                            stakeholders.append(stakeholder)
-                        except:
-                            pass
-                else:
-                    # Fallback if no structured data can be extracted
-                    print(f"WARNING: Could not extract JSON from response for {company['name']}. Using fallback approach.")
-                    stakeholders = []
-    except Exception as e:
-        print(f"Error parsing stakeholders for {company['name']}: {str(e)}")
+    Returns:
+        List of identified stakeholders
+    """
+    # Debug output to help with troubleshooting
+    logger.debug("First 500 characters of API response:\n%s", content[:500])
+    
+    # Structured outputs guarantee {"stakeholders": [...]}; error responses and
+    # legacy cached free-form responses are salvaged from embedded JSON objects
+    try:
+        stakeholders = _json_loads(content)["stakeholders"]
+    except (json.JSONDecodeError, KeyError, TypeError):
         stakeholders = []
+        for obj in iter_json_objects(content):
+            if "stakeholders" in obj or "Stakeholders" in obj:
+                nested = obj.get("stakeholders", obj.get("Stakeholders"))
+                stakeholders.extend(s for s in as_list(nested) if isinstance(s, dict))
+            else:
+                stakeholders.append(obj)
+        
+        if not stakeholders:
+            logger.warning("Could not extract JSON from response for %s. Using fallback approach.", company['name'])
+    
+    logger.debug("Found %d stakeholders in response", len(stakeholders))
     
     # If no stakeholders found, create fallback stakeholders
     if not stakeholders:
-        # Create fallback stakeholders based on customer segment
-        segment = company.get('customer_segment', 'Sign Manufacturing Companies')
-        
-        if segment == "Large Format Print Providers":
-            stakeholders = [
-                {
-                    "name": f"Alex Johnson",
-                    "title": "Operations Director",
-                    "decision_maker_score": 9.0,
-                    "rationale": "Operations Directors at Large Format Print Providers typically oversee production processes and make material sourcing decisions.",
-                    "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{generate_random_linkedin_id()}"
-                },
-                {
-                    "name": f"Sam Williams",
-                    "title": "Production Manager",
-                    "decision_maker_score": 8.0,
-                    "rationale": "Production Managers influence material selection based on quality and performance requirements.",
-                    "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{generate_random_linkedin_id()}"
-                }
-            ]
-        elif segment == "Fleet Graphics Specialists":
-            stakeholders = [
-                {
-                    "name": f"Taylor Reed",
-                    "title": "Fleet Graphics Director",
-                    "decision_maker_score": 9.0,
-                    "rationale": "Fleet Graphics Directors make decisions on materials that ensure longevity of vehicle wraps.",
-                    "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{generate_random_linkedin_id()}"
-                },
-                {
-                    "name": f"Jamie Martin",
-                    "title": "Product Development Manager",
-                    "decision_maker_score": 7.5,
-                    "rationale": "Product Development Managers evaluate new materials for enhanced performance.",
-                    "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{generate_random_linkedin_id()}"
-                }
-            ]
-        else:
-            stakeholders = [
-                {
-                    "name": f"Morgan Smith",
-                    "title": "Production Director",
-                    "decision_maker_score": 8.5,
-                    "rationale": "Production Directors influence material selection based on performance requirements.",
-                    "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{generate_random_linkedin_id()}"
-                },
-                {
-                    "name": f"Casey Brown",
-                    "title": "Materials Procurement Manager",
-                    "decision_maker_score": 7.0,
-                    "rationale": "Materials Procurement Managers make purchasing decisions based on cost-benefit analysis.",
-                    "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{generate_random_linkedin_id()}"
-                }
-            ]
+        stakeholders = build_fallback_stakeholders(company)
+    
+    return enhance_stakeholders(company, stakeholders)
+
+def build_fallback_stakeholders(company: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Build segment-specific placeholder stakeholders for a company.
+    
+    Args:
+        company: Company information
+        
+    Returns:
+        List of raw fallback stakeholders
+    """
+    segment = company.get('customer_segment', '') or infer_customer_segment(company.get('industry', ''))
+    linkedin_ids = generate_random_linkedin_ids(2)
+    
+    if segment == "Large Format Print Providers":
+        stakeholders = [
+            {
+                "name": f"Alex Johnson",
+                "title": "Operations Director",
+                "decision_maker_score": 9.0,
+                "rationale": "Operations Directors at Large Format Print Providers typically oversee production processes and make material sourcing decisions.",
+                "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{linkedin_ids[0]}"
+            },
+            {
+                "name": f"Sam Williams",
+                "title": "Production Manager",
+                "decision_maker_score": 8.0,
+                "rationale": "Production Managers influence material selection based on quality and performance requirements.",
+                "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{linkedin_ids[1]}"
+            }
+        ]
+    elif segment == "Fleet Graphics Specialists":
+        stakeholders = [
+            {
+                "name": f"Taylor Reed",
+                "title": "Fleet Graphics Director",
+                "decision_maker_score": 9.0,
+                "rationale": "Fleet Graphics Directors make decisions on materials that ensure longevity of vehicle wraps.",
+                "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{linkedin_ids[0]}"
+            },
+            {
+                "name": f"Jamie Martin",
+                "title": "Product Development Manager",
+                "decision_maker_score": 7.5,
+                "rationale": "Product Development Managers evaluate new materials for enhanced performance.",
+                "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{linkedin_ids[1]}"
+            }
+        ]
+    else:
+        stakeholders = [
+            {
+                "name": f"Morgan Smith",
+                "title": "Production Director",
+                "decision_maker_score": 8.5,
+                "rationale": "Production Directors influence material selection based on performance requirements.",
+                "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{linkedin_ids[0]}"
+            },
+            {
+                "name": f"Casey Brown",
+                "title": "Materials Procurement Manager",
+                "decision_maker_score": 7.0,
+                "rationale": "Materials Procurement Managers make purchasing decisions based on cost-benefit analysis.",
+                "linkedin_url": f"https://www.linkedin.com/sales/people/ACoAA{linkedin_ids[1]}"
+            }
+        ]
+    
+    return stakeholders
+
+def enhance_stakeholders(company: Dict[str, Any], stakeholders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Normalize raw stakeholders into enhanced records with company context.
     
+    Args:
+        company: Company information
+        stakeholders: Raw stakeholders from an LLM response or fallback
+        
+    Returns:
+        List of enhanced stakeholders
+    """
     # Enhance stakeholder data with company context
     enhanced_stakeholders = []
     for idx, stakeholder in enumerate(stakeholders):
         stakeholder_id = str(uuid.uuid4())
         
-        print(f"Processing stakeholder {idx+1}: {list(stakeholder.keys()) if isinstance(stakeholder, dict) else 'not a dict'}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing stakeholder %d: %s", idx + 1, list(stakeholder.keys()) if isinstance(stakeholder, dict) else 'not a dict')
         
-        # Extract name - check multiple possible field names
-        name = None
-        for name_field in ["name", "Name", "contact", "Contact", "person", "Person"]:
-            if name_field in stakeholder and stakeholder[name_field]:
-                name = stakeholder[name_field]
-                break
+        # Extract all known fields in a single pass over the response keys
+        fields = collect_stakeholder_fields(stakeholder)
         
-        # If no name found, generate one
-        if not name:
-            # Generate name from title/role if available
-            title_value = None
-            for title_field in ["title", "Title", "jobTitle", "JobTitle", "role", "Role", "position", "Position"]:
-                if title_field in stakeholder and stakeholder[title_field]:
-                    title_value = stakeholder[title_field]
-                    break
-                    
-            name = generate_name_from_title(title_value or "Unknown")
+        title = next((value for value in fields["title"] if value), None)
         
-        # Extract title - check multiple possible field names
-        title = None
-        for title_field in ["title", "Title", "jobTitle", "JobTitle", "role", "Role", "position", "Position"]:
-            if title_field in stakeholder and stakeholder[title_field]:
-                title = stakeholder[title_field]
-                break
+        # If no name found, generate one from title/role if available
+        name = next((value for value in fields["name"] if value), None)
+        if not name:
+            name = generate_name_from_title(title or "Unknown")
         
-        # Extract decision maker score - check multiple possible field names
         score = 7.5  # Default score
-        for score_field in [
-            "decision_maker_score", "decisionMakerScore", "DecisionMakerScore", 
-            "score", "Score", "relevance", "Relevance", "priority_score", "PriorityScore"
-        ]:
-            if score_field in stakeholder and stakeholder[score_field]:
+        for value in fields["score"]:
+            if value:
                 try:
-                    score = float(stakeholder[score_field])
+                    score = float(value)
                     break
                 except:
                     pass
         
-        # Extract rationale - check multiple possible field names
-        rationale = ""
-        for rationale_field in [
-            "rationale", "Rationale", "decision_maker_rationale", "decisionMakerRationale",
-            "justification", "Justification", "reason", "Reason", "explanation", "Explanation",
-            "JobChallengesAddressed", "jobChallengesAddressed"
-        ]:
-            if rationale_field in stakeholder and stakeholder[rationale_field]:
-                if isinstance(stakeholder[rationale_field], list):
-                    rationale = "; ".join(stakeholder[rationale_field])
-                else:
-                    rationale = stakeholder[rationale_field]
-                break
-        
-        # Extract LinkedIn URL - check multiple possible field names
-        linkedin_url = ""
-        for linkedin_field in [
-            "linkedin_url", "linkedinUrl", "LinkedinUrl", "linkedin", "Linkedin",
-            "linkedInProfile", "LinkedInProfile"
-        ]:
-            if linkedin_field in stakeholder and stakeholder[linkedin_field]:
-                linkedin_url = stakeholder[linkedin_field]
-                break
-        
-        # Extract responsibilities - check multiple possible field names
-        responsibilities = []
-        for resp_field in ["responsibilities", "Responsibilities", "duties", "Duties", "role_details", "RoleDetails"]:
-            if resp_field in stakeholder:
-                if isinstance(stakeholder[resp_field], list):
-                    responsibilities = stakeholder[resp_field]
-                elif isinstance(stakeholder[resp_field], str):
-                    responsibilities = [stakeholder[resp_field]]
-                break
-        
-        # Extract influence - check multiple possible field names
-        influence = ""
-        for influence_field in ["influence", "Influence", "influenceInPurchasing", "InfluenceInPurchasing"]:
-            if influence_field in stakeholder and stakeholder[influence_field]:
-                influence = stakeholder[influence_field]
-                break
-        
-        # Extract benefits - check multiple possible field names
-        benefits = []
-        for benefit_field in [
-            "relevant_benefits", "relevantBenefits", "tedlarBenefits", "TedlarBenefits",
-            "benefits", "Benefits"
-        ]:
-            if benefit_field in stakeholder:
-                if isinstance(stakeholder[benefit_field], list):
-                    benefits = stakeholder[benefit_field]
-                elif isinstance(stakeholder[benefit_field], str):
-                    benefits = [stakeholder[benefit_field]]
-                break
+        rationale = next((value for value in fields["rationale"] if value), "")
+        if isinstance(rationale, list):
+            rationale = "; ".join(str(item) for item in rationale)
         
+        linkedin_url = next((value for value in fields["linkedin_url"] if value), "")
+        influence = next((value for value in fields["influence"] if value), "")
+        
+        # List fields take the first alias present, coercing a string to a one-item list
+        # and every item to a string, since the Stakeholder model expects List[str]
+        responsibilities = [str(item) for item in as_list(fields["responsibilities"][0])] if fields["responsibilities"] else []
+        benefits = [str(item) for item in as_list(fields["relevant_benefits"][0])] if fields["relevant_benefits"] else []
+        
+        # LLM responses sometimes return numbers or objects for text fields
         enhanced_stakeholders.append({
             "id": stakeholder_id,
             "company_id": company.get("id", ""),
             "company_name": company["name"],
-            "name": name,
-            "title": title or "Unknown",
-            "department": stakeholder.get("department", ""),
+            "name": as_text(name),
+            "title": as_text(title) or "Unknown",
+            "department": as_text(stakeholder.get("department")),
             "decision_maker_score": score,
-            "decision_maker_rationale": rationale,
-            "linkedin_url": linkedin_url,
-            "email": stakeholder.get("email", ""),
-            "priority": stakeholder.get("priority", "medium"),
+            "decision_maker_rationale": as_text(rationale),
+            "linkedin_url": as_text(linkedin_url),
+            "email": as_text(stakeholder.get("email")),
+            "priority": as_text(stakeholder.get("priority")) or "medium",
             "responsibilities": responsibilities,
-            "influence": influence,
+            "influence": as_text(influence),
             "relevant_benefits": benefits,
             "customer_segment": company.get("customer_segment", "")
         })
         
-        print(f"Enhanced stakeholder: {name} ({title or 'Unknown'}) at {company['name']}")
+        logger.debug("Enhanced stakeholder: %s (%s) at %s", name, title or 'Unknown', company['name'])
     
-    print(f"Identified {len(enhanced_stakeholders)} stakeholders for {company['name']}.")
+    logger.debug("Identified %d stakeholders for %s.", len(enhanced_stakeholders), company['name'])
     return enhanced_stakeholders
 
-def generate_random_linkedin_id():
+def iter_json_objects(text: str):
+    """
+    Yield each top-level JSON object embedded in free-form text.
+    
+    Scans for "{" and decodes from there with JSONDecoder.raw_decode, which
+    handles nested braces correctly and skips past each decoded object, so
+    the scan is linear in the text length.
+    
+    Args:
+        text: Text containing zero or more JSON objects
+        
+    Yields:
+        Decoded JSON objects
+    """
+    index = 0
+    while True:
+        start = text.find("{", index)
+        if start < 0:
+            return
+        try:
+            obj, end = _JSON_DECODER.raw_decode(text, start)
+        except ValueError:
+            index = start + 1
+            continue
+        if isinstance(obj, dict):
+            yield obj
+        index = end
+
+def collect_stakeholder_fields(stakeholder: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """
+    Group a raw stakeholder's values by canonical field name.
+    
+    LLM responses use many spellings for the same field (e.g. "title",
+    "jobTitle", "Role"). This maps every known alias to its canonical field in
+    one pass over the response keys.
+    
+    Args:
+        stakeholder: Raw stakeholder object from the LLM response
+        
+    Returns:
+        Dictionary mapping each canonical field to its values in alias priority order
+    """
+    candidates = {field: [] for field in STAKEHOLDER_FIELD_ALIASES}
+    for key, value in stakeholder.items():
+        alias = _ALIAS_TO_FIELD.get(key)
+        if alias is not None:
+            field, rank = alias
+            candidates[field].append((rank, value))
+    
+    return {
+        field: [value for _, value in sorted(values, key=lambda item: item[0])]
+        for field, values in candidates.items()
+    }
+
+def as_list(value: Any) -> List[Any]:
+    """Coerce a list-or-string field value to a list."""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        return [value]
+    return []
+
+def as_text(value: Any) -> str:
+    """Coerce a text field value to a string, treating None as empty."""
+    return "" if value is None else str(value)
+
+def generate_random_linkedin_ids(count: int) -> List[str]:
     """
-    Generate a realistic-looking LinkedIn Sales Navigator profile ID.
+    Generate several Sales Navigator profile IDs with one vectorized draw.
     
     Sales Navigator IDs are typically 10-12 characters consisting of 
     alphanumeric characters after 'ACoAA'.
+    
+    Args:
+        count: Number of IDs to generate
+        
+    Returns:
+        List of 10-12 character alphanumeric IDs
+    """
+    lengths = _RNG.integers(10, 13, size=count)
+    characters = _RNG.choice(LINKEDIN_ID_ARRAY, size=(count, 12))
+    return [''.join(row[:length]) for row, length in zip(characters, lengths)]
+
+def group_query_candidates(
+    companies_by_id: Dict[str, Dict[str, Any]],
+    stakeholders: List[Dict[str, Any]],
+    min_score: float = 7.0
+) -> Dict[str, List[int]]:
+    """
+    Group stakeholders that qualify for Sales Navigator queries by company.
+    
+    Args:
+        companies_by_id: Company information keyed by company ID
+        stakeholders: Stakeholders to generate queries for
+        min_score: Minimum decision-maker score for query generation
+        
+    Returns:
+        Dictionary mapping company ID to indices into stakeholders
     """
-    characters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-    id_length = random.randint(10, 12)
-    return ''.join(random.choice(characters) for _ in range(id_length))
+    indices_by_company = {}
+    for idx, stakeholder in enumerate(stakeholders):
+        company = companies_by_id.get(stakeholder["company_id"])
+        if not company or not is_llm_eligible(company) or stakeholder.get("decision_maker_score", 0.0) < min_score:
+            continue
+        indices_by_company.setdefault(stakeholder["company_id"], []).append(idx)
+    return indices_by_company
 
-def generate_sales_navigator_query(company: Dict[str, Any], stakeholder: Dict[str, Any]) -> Dict[str, Any]:
+def generate_sales_navigator_queries_batch(
+    company: Dict[str, Any],
+    stakeholders: List[Dict[str, Any]],
+    use_cache: bool = True,
+    cache_ttl_seconds: Optional[float] = None
+) -> List[Dict[str, Any]]:
     """
-    Generate a LinkedIn Sales Navigator search query for finding the stakeholder.
+    Generate Sales Navigator queries for several stakeholders at one company in one call.
     
-    This function implements the second tier of our LLM approach, using a
-    specialized query generator to help sales teams find the exact stakeholder.
+    The shared Tedlar context and company details are sent once for all of the
+    company's stakeholders instead of once per stakeholder.
     
     Args:
         company: Company information
-        stakeholder: Stakeholder information
+        stakeholders: Stakeholders at the company to generate queries for
+        use_cache: Whether to serve identical prompts from the response cache
+        cache_ttl_seconds: Optional maximum age of cached responses
         
     Returns:
-        Enhanced stakeholder with Sales Navigator query
+        Stakeholders in the original order, enhanced with Sales Navigator queries
     """
-    print(f"Generating Sales Navigator query for: {stakeholder['name']} ({stakeholder['title']})...")
+    logger.debug("Generating %d Sales Navigator queries for: %s...", len(stakeholders), company['name'])
     
     # Budget check
     estimated_cost = 0.01  # Very small cost for query generation
     if not is_budget_available("stakeholder_identification", estimated_cost):
-        print(f"WARNING: Insufficient budget for Sales Navigator query generation.")
-        return stakeholder
+        logger.warning("Insufficient budget for Sales Navigator query generation.")
+        return stakeholders
     
-    # Only generate queries for high-scoring stakeholders to optimize budget
-    if stakeholder.get("decision_maker_score", 0.0) < 7.0:
-        print(f"Skipping query generation for low-scoring stakeholder: {stakeholder['name']}.")
-        return stakeholder
+    model_config = sales_navigator_batch_model_config(len(stakeholders))
+    response = call_openai_api(
+        messages=build_sales_navigator_batch_messages(company, stakeholders),
+        model=model_config["model"],
+        temperature=model_config["temperature"],
+        max_tokens=model_config["max_tokens"],
+        module="stakeholder_identification",
+        operation="sales_navigator_batch_query_generation",
+        response_format=model_config["response_format"],
+        use_cache=use_cache,
+        cache_ttl_seconds=cache_ttl_seconds,
+        cache_max_temperature=STAKEHOLDER_CACHE_MAX_TEMPERATURE
+    )
     
-    # Format company and stakeholder details for the prompt
-    company_details = f"""
-    Company Name: {company['name']}
-    Industry: {company.get('industry', 'Graphics & Signage')}
-    Customer Segment: {company.get('customer_segment', 'Unknown')}
-    Description: {company.get('description', '')}
-    Estimated Size: {company.get('size_estimate', 'Unknown')}
+    return apply_sales_navigator_queries(company, stakeholders, response["content"])
+
+def generate_sales_navigator_queries_concurrent(
+    companies_by_id: Dict[str, Dict[str, Any]],
+    stakeholders: List[Dict[str, Any]],
+    max_concurrent: int = 8,
+    min_score: float = 7.0,
+    use_cache: bool = True,
+    cache_ttl_seconds: Optional[float] = None
+) -> List[Dict[str, Any]]:
     """
+    Generate Sales Navigator queries for many companies with concurrent API calls.
     
-    customer_segment = company.get('customer_segment', '')
+    Each company's qualifying stakeholders share one batched prompt, and the
+    per-company requests run concurrently. Only stakeholders at LLM-eligible
+    companies with at least min_score get a query while budget remains; all
+    others are returned unchanged.
     
-    # Direct prompt construction or use template if available
-    if LINKEDIN_QUERY_TEMPLATE:
-        from src.llm.prompt_templates import customize_prompt
-        prompt = customize_prompt(
-            LINKEDIN_QUERY_TEMPLATE,
-            company_name=company['name'],
-            company_details=company_details,
-            customer_segment=customer_segment
-        )
-    else:
-        # Fallback direct prompt
-        prompt = f"""
-        {BASE_TEDLAR_CONTEXT}
-
-        TASK: Create a LinkedIn Sales Navigator search query to find this specific stakeholder
-        at the company.
+    Args:
+        companies_by_id: Company information keyed by company ID
+        stakeholders: Stakeholders to generate queries for
+        max_concurrent: Maximum number of in-flight requests
+        min_score: Minimum decision-maker score for query generation
+        use_cache: Whether to serve identical prompts from the response cache
+        cache_ttl_seconds: Optional maximum age of cached responses
+        
+    Returns:
+        Stakeholders in the original order, enhanced with Sales Navigator queries
+    """
+    indices_by_company = group_query_candidates(companies_by_id, stakeholders, min_score)
+    
+    query_requests = []
+    # Reserve each queued request's estimated cost, since none is logged until they run
+    reserved = 0.0
+    for company_id, indices in indices_by_company.items():
+        # Budget check
+        estimated_cost = 0.01  # Very small cost for query generation
+        if not is_budget_available("stakeholder_identification", reserved + estimated_cost):
+            logger.warning("Insufficient budget for Sales Navigator query generation.")
+            break
+        reserved += estimated_cost
+        
+        company_stakeholders = [stakeholders[idx] for idx in indices]
+        model_config = sales_navigator_batch_model_config(len(company_stakeholders))
+        query_requests.append({
+            "custom_id": str(company_id),
+            "messages": build_sales_navigator_batch_messages(companies_by_id[company_id], company_stakeholders),
+            "model": model_config["model"],
+            "temperature": model_config["temperature"],
+            "max_tokens": model_config["max_tokens"],
+            "response_format": model_config["response_format"],
+            "operation": "sales_navigator_batch_query_generation"
+        })
+    
+    if not query_requests:
+        return stakeholders
+    
+    logger.info("Generating Sales Navigator queries for %d companies (%d concurrent requests)...", len(query_requests), max_concurrent)
+    responses = call_openai_concurrent(
+        query_requests,
+        module="stakeholder_identification",
+        max_concurrent=max_concurrent,
+        use_cache=use_cache,
+        cache_ttl_seconds=cache_ttl_seconds,
+        cache_max_temperature=STAKEHOLDER_CACHE_MAX_TEMPERATURE
+    )
+    
+    enhanced_stakeholders = list(stakeholders)
+    for company_id, indices in indices_by_company.items():
+        response = responses.get(str(company_id))
+        if response is None:
+            continue
+        company_stakeholders = [stakeholders[idx] for idx in indices]
+        enhanced = apply_sales_navigator_queries(companies_by_id[company_id], company_stakeholders, response["content"])
+        for idx, stakeholder in zip(indices, enhanced):
+            enhanced_stakeholders[idx] = stakeholder
+    
+    return enhanced_stakeholders
 
-        COMPANY: {company['name']}
-        DETAILS: {company_details}
-        CUSTOMER SEGMENT: {customer_segment}
-        STAKEHOLDER: {stakeholder['name']}
-        TITLE: {stakeholder['title']}
-
-        Based on the company's customer segment and the stakeholder's role, create a targeted
-        Sales Navigator search query that will help find this specific person or someone in
-        that role.
-
-        Create a query with these parameters:
-        1. Company name: Exact company name
-        2. Title keywords: Include variations of the stakeholder's title
-        3. Industry-specific keywords related to this role
-        4. Function/department filters appropriate for this role
-        5. Seniority levels: Appropriate for the role and company size
-
-        FORMAT YOUR RESPONSE AS A STRUCTURED QUERY that can be directly copied into 
-        Sales Navigator's search fields. Include explanations for why each parameter was chosen.
-        """
+def sales_navigator_batch_model_config(stakeholder_count: int) -> Dict[str, Any]:
+    """
+    Model settings for a batched Sales Navigator query request.
     
+    Args:
+        stakeholder_count: Number of stakeholders in the request
+        
+    Returns:
+        Model configuration with response budget scaled to the stakeholder count
+    """
     # Use cost-effective model for query generation
-    model_config = {
-        "model": "gpt-3.5-turbo",
+    return {
+        "model": "gpt-4o-mini",
         "temperature": 0.2,
-        "max_tokens": 800,
+        "max_tokens": min(4000, 600 * stakeholder_count),
+        "response_format": response_format_for("gpt-4o-mini", "sales_navigator_queries", LINKEDIN_BATCH_QUERY_SCHEMA)
     }
+
+def build_sales_navigator_batch_messages(company: Dict[str, Any], stakeholders: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """
+    Build one Sales Navigator query request covering several stakeholders at a company.
     
-    response = call_openai_api(
-        messages=[{"role": "system", "content": prompt}],
-        model=model_config["model"],
-        temperature=model_config["temperature"],
-        max_tokens=model_config["max_tokens"],
-        module="stakeholder_identification",
-        operation="sales_navigator_query_generation"
+    Stakeholders are numbered from 1 so the response can be matched back.
+    
+    Args:
+        company: Company information
+        stakeholders: Stakeholders at the company
+        
+    Returns:
+        Chat messages
+    """
+    company_details = format_sales_navigator_company_details(
+        company['name'],
+        company.get('industry', 'Graphics & Signage'),
+        company.get('customer_segment', 'Unknown'),
+        company.get('description', ''),
+        company.get('size_estimate', 'Unknown')
+    )
+    stakeholder_list = "\n".join(
+        f"{idx}. {stakeholder['name']} - {stakeholder['title']}"
+        for idx, stakeholder in enumerate(stakeholders, 1)
+    )
+    
+    return build_prompt_messages(
+        LINKEDIN_BATCH_QUERY_SYSTEM_PROMPT,
+        LINKEDIN_BATCH_QUERY_USER_PROMPT,
+        base_context=SALES_NAVIGATOR_CONTEXT,
+        company_name=company['name'],
+        company_details=company_details,
+        customer_segment=company.get('customer_segment', ''),
+        stakeholder_list=stakeholder_list
     )
+
+def apply_sales_navigator_queries(
+    company: Dict[str, Any],
+    stakeholders: List[Dict[str, Any]],
+    content: str
+) -> List[Dict[str, Any]]:
+    """
+    Attach queries from a batched Sales Navigator response to their stakeholders.
+    
+    Stakeholders without a matching query in the response are returned unchanged.
+    
+    Args:
+        company: Company information
+        stakeholders: Stakeholders in the order they were numbered in the prompt
+        content: Raw LLM response content
+        
+    Returns:
+        Stakeholders in the original order, enhanced with Sales Navigator queries
+    """
+    try:
+        queries = {
+            int(entry["id"]): entry["query"]
+            for entry in _json_loads(content)["queries"]
+        }
+    except Exception as e:
+        logger.warning("Could not parse Sales Navigator queries for %s: %s", company['name'], e)
+        return stakeholders
     
-    # Extract the query from the response
-    content = response["content"]
+    enhanced_stakeholders = []
+    for idx, stakeholder in enumerate(stakeholders, 1):
+        if idx in queries:
+            stakeholder = stakeholder.copy()
+            stakeholder["sales_navigator_query"] = queries[idx]
+        enhanced_stakeholders.append(stakeholder)
     
-    # Update stakeholder with query information
-    enhanced_stakeholder = stakeholder.copy()
-    enhanced_stakeholder["sales_navigator_query"] = content
+    return enhanced_stakeholders
+
+@lru_cache(maxsize=1024)
+def format_sales_navigator_company_details(
+    name: str,
+    industry: str,
+    customer_segment: str,
+    description: str,
+    size_estimate: str
+) -> str:
+    """
+    Format the company section of the Sales Navigator prompt.
     
-    return enhanced_stakeholder
+    Memoized on the field values, which are hashable, unlike the company dict.
+    
+    Returns:
+        Company details text
+    """
+    return f"""
+    Company Name: {name}
+    Industry: {industry}
+    Customer Segment: {customer_segment}
+    Description: {description}
+    Estimated Size: {size_estimate}
+    """
 
 def prioritize_stakeholders(stakeholders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
@@ -698,35 +1247,27 @@ def prioritize_stakeholders(stakeholders: List[Dict[str, Any]]) -> List[Dict[str
     Returns:
         Prioritized list of stakeholders
     """
-    # Sort stakeholders by decision-maker score (descending)
-    sorted_stakeholders = sorted(stakeholders, key=lambda x: x.get("decision_maker_score", 0.0), reverse=True)
-    
-    # Categorize by priority
-    high_priority = []
-    medium_priority = []
-    low_priority = []
+    # Extract scores once, then band and order them with vectorized lookups; a
+    # stable sort keeps the original order among equal scores
+    scores = np.array([float(s.get("decision_maker_score", 0.0)) for s in stakeholders], dtype=float)
+    bands = np.searchsorted(PRIORITY_THRESHOLDS, scores, side="right")
+    order = np.argsort(-scores, kind="stable")
     
-    for stakeholder in sorted_stakeholders:
-        score = stakeholder.get("decision_maker_score", 0.0)
-        
-        if score >= 8.0:
-            stakeholder["priority"] = "high"
-            high_priority.append(stakeholder)
-        elif score >= 6.0:
-            stakeholder["priority"] = "medium"
-            medium_priority.append(stakeholder)
-        else:
-            stakeholder["priority"] = "low"
-            low_priority.append(stakeholder)
+    # Tag priority while building the sorted list
+    prioritized_stakeholders = []
+    for idx in order:
+        stakeholder = stakeholders[idx]
+        stakeholder["priority"] = PRIORITY_BANDS[bands[idx]]
+        prioritized_stakeholders.append(stakeholder)
     
-    # Combine categories in order of priority
-    prioritized_stakeholders = high_priority + medium_priority + low_priority
+    # Sorting by score already orders the priority bands high, medium, low
+    low_count, medium_count, high_count = np.bincount(bands, minlength=3)
     
-    print(f"\nStakeholder Prioritization Summary:")
-    print(f"Total stakeholders identified: {len(prioritized_stakeholders)}")
-    print(f"High priority stakeholders: {len(high_priority)}")
-    print(f"Medium priority stakeholders: {len(medium_priority)}")
-    print(f"Low priority stakeholders: {len(low_priority)}")
+    logger.info("\nStakeholder Prioritization Summary:")
+    logger.info("Total stakeholders identified: %d", len(prioritized_stakeholders))
+    logger.info("High priority stakeholders: %d", high_count)
+    logger.info("Medium priority stakeholders: %d", medium_count)
+    logger.info("Low priority stakeholders: %d", low_count)
     
     return prioritized_stakeholders
 
@@ -743,66 +1284,60 @@ def save_stakeholder_data(stakeholders: List[Dict[str, Any]]):
     stakeholders_dir = DATA_DIR / "stakeholders"
     stakeholders_dir.mkdir(exist_ok=True)
     
-    # Custom JSON encoder to handle various data types
-    class CustomEncoder(json.JSONEncoder):
-        def default(self, obj):
-            if isinstance(obj, uuid.UUID):
-                return str(obj)
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            return super().default(obj)
-    
-    # Save each stakeholder as a separate JSON file
-    for stakeholder in stakeholders:
+    # Validate every record at once, falling back to one at a time so a single
+    # invalid stakeholder is skipped rather than failing the whole save
+    try:
+        validated = _STAKEHOLDER_LIST_ADAPTER.validate_python(stakeholders)
+    except ValidationError:
+        validated = [validate_stakeholder(stakeholder) for stakeholder in stakeholders]
+    
+    # Serialize in this thread; Pydantic serializes UUID and datetime fields itself
+    pending_writes = []
+    for stakeholder, stakeholder_obj in zip(stakeholders, validated):
+        if stakeholder_obj is None:
+            continue
         try:
-            # Create Stakeholder object for validation
-            stakeholder_obj = Stakeholder(
-                id=stakeholder["id"],
-                company_id=stakeholder["company_id"],
-                name=stakeholder["name"],
-                title=stakeholder["title"],
-                department=stakeholder.get("department", ""),
-                linkedin_url=stakeholder.get("linkedin_url", ""),
-                email=stakeholder.get("email", ""),
-                relevance_score=stakeholder.get("decision_maker_score", 0.0),
-                relevance_rationale=stakeholder.get("decision_maker_rationale", "")
-            )
-            
-            # Convert to dictionary for saving
-            stakeholder_dict = stakeholder_obj.model_dump()
-            
-            # Add additional fields
-            if "priority" in stakeholder:
-                stakeholder_dict["priority"] = stakeholder["priority"]
-                
-            if "responsibilities" in stakeholder:
-                stakeholder_dict["responsibilities"] = stakeholder["responsibilities"]
-                
-            if "influence" in stakeholder:
-                stakeholder_dict["influence"] = stakeholder["influence"]
-                
-            if "relevant_benefits" in stakeholder:
-                stakeholder_dict["relevant_benefits"] = stakeholder["relevant_benefits"]
-                
-            if "company_name" in stakeholder:
-                stakeholder_dict["company_name"] = stakeholder["company_name"]
-                
-            if "customer_segment" in stakeholder:
-                stakeholder_dict["customer_segment"] = stakeholder["customer_segment"]
-                
-            if "sales_navigator_query" in stakeholder:
-                stakeholder_dict["sales_navigator_query"] = stakeholder["sales_navigator_query"]
-                
-            # Save to file
             stakeholder_file = stakeholders_dir / f"{stakeholder['id']}.json"
-            with open(stakeholder_file, "w") as f:
-                json.dump(stakeholder_dict, f, indent=2, cls=CustomEncoder)
-                
-            print(f"Saved stakeholder data for: {stakeholder['name']} ({stakeholder['title']}) at {stakeholder['company_name']}")
+            pending_writes.append((stakeholder, stakeholder_file, stakeholder_obj.model_dump_json(exclude_none=True, indent=2).encode()))
         except Exception as e:
-            print(f"Error saving stakeholder {stakeholder.get('name', 'unknown')}: {str(e)}")
+            logger.error("Error saving stakeholder %s: %s", stakeholder.get('name', 'unknown'), e)
+    
+    # File writes are I/O-bound, so overlap them across threads
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(write_stakeholder_file, pending_writes))
+
+def validate_stakeholder(stakeholder: Dict[str, Any]) -> Optional[Stakeholder]:
+    """
+    Validate one stakeholder record.
+    
+    Args:
+        stakeholder: Stakeholder information
+        
+    Returns:
+        Validated Stakeholder, or None if the record is invalid
+    """
+    try:
+        return Stakeholder.model_validate(stakeholder)
+    except ValidationError as e:
+        logger.error("Error saving stakeholder %s: %s", stakeholder.get('name', 'unknown'), e)
+        return None
+
+def write_stakeholder_file(pending_write: Tuple[Dict[str, Any], Path, bytes]):
+    """
+    Write one serialized stakeholder to its JSON file.
+    
+    Args:
+        pending_write: Tuple of (stakeholder, file path, serialized JSON bytes)
+    """
+    stakeholder, stakeholder_file, data = pending_write
+    try:
+        stakeholder_file.write_bytes(data)
+        logger.debug("Saved stakeholder data for: %s (%s) at %s", stakeholder['name'], stakeholder['title'], stakeholder.get('company_name'))
+    except Exception as e:
+        logger.error("Error saving stakeholder %s: %s", stakeholder.get('name', 'unknown'), e)
 
-def run_stakeholder_identification(limit_companies=None, limit_stakeholders_per_company=None, debug=False):
+def run_stakeholder_identification(limit_companies=None, limit_stakeholders_per_company=None, debug=False, use_batch=False, max_concurrent=8,
+                                   use_cache=True, cache_ttl_hours=None, use_semantic_cache=False):
     """
     Run the complete stakeholder identification process:
     1. Load qualified companies from company analysis
@@ -817,47 +1352,77 @@ def run_stakeholder_identification(limit_companies=None, limit_stakeholders_per_
     Args:
         limit_companies: Optional limit on number of companies to process
         limit_stakeholders_per_company: Optional limit on stakeholders per company
-        debug: Whether to print debug information
+        debug: Whether to log debug information
+        use_batch: Whether to identify stakeholders through the OpenAI Batch API
+        max_concurrent: Number of concurrent API requests (1 runs sequentially)
+        use_cache: Whether to reuse cached LLM responses for identical prompts
+        cache_ttl_hours: Optional maximum age of cached responses in hours
+        use_semantic_cache: Whether to reuse responses for near-duplicate companies
     """
-    print("Starting stakeholder identification process...")
+    logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    # Callers that never configure logging would otherwise only see warnings
+    if not logger.handlers and not logging.getLogger().handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    
+    logger.info("Starting stakeholder identification process...")
+    
+    cache_ttl_seconds = cache_ttl_hours * 3600 if cache_ttl_hours is not None else None
     
     # Step 1: Load qualified companies from company analysis
     companies = load_qualified_companies()
     
     if not companies:
-        print("No qualified companies found. Run company analysis module first.")
+        logger.warning("No qualified companies found. Run company analysis module first.")
         return
     
     # Apply limit on companies if specified
     if limit_companies is not None and limit_companies > 0:
         companies = companies[:limit_companies]
-        print(f"Limiting analysis to {limit_companies} companies.")
+        logger.info("Limiting analysis to %d companies.", limit_companies)
     
     # Step 2: Identify stakeholders for each company
     all_stakeholders = []
+    if use_batch:
+        batch_results = identify_stakeholders_batch(companies)
+    elif max_concurrent > 1:
+        batch_results = identify_stakeholders_concurrent(
+            companies, max_concurrent, use_cache, cache_ttl_seconds, use_semantic_cache
+        )
+    else:
+        batch_results = None
     for company in companies:
-        stakeholders = identify_stakeholders_for_company(company)
+        if batch_results is not None:
+            stakeholders = batch_results.get(str(company["id"]), [])
+        else:
+            stakeholders = identify_stakeholders_for_company(company, use_cache, cache_ttl_seconds, use_semantic_cache)
         
         # Apply limit on stakeholders per company if specified
         if limit_stakeholders_per_company is not None and limit_stakeholders_per_company > 0:
             stakeholders = stakeholders[:limit_stakeholders_per_company]
-            print(f"Limiting to {limit_stakeholders_per_company} stakeholders for {company['name']}.")
+            logger.debug("Limiting to %d stakeholders for %s.", limit_stakeholders_per_company, company['name'])
         
         all_stakeholders.extend(stakeholders)
-        
-        # Small delay to avoid API rate limits
-        time.sleep(0.5)
     
-    # Step 3: Generate Sales Navigator queries for high-value stakeholders
-    for i, stakeholder in enumerate(all_stakeholders):
-        if stakeholder.get("decision_maker_score", 0.0) >= 7.5:
-            # Only generate queries for high-scoring stakeholders to optimize budget
-            company = next((c for c in companies if c["id"] == stakeholder["company_id"]), None)
-            if company:
-                all_stakeholders[i] = generate_sales_navigator_query(company, stakeholder)
-        
-        # Small delay to avoid API rate limits
-        time.sleep(0.5)
+    # Step 3: Generate Sales Navigator queries for high-value stakeholders, one prompt per company
+    companies_by_id = {c["id"]: c for c in companies}
+    if max_concurrent > 1:
+        all_stakeholders = generate_sales_navigator_queries_concurrent(
+            companies_by_id, all_stakeholders, max_concurrent, min_score=7.5,
+            use_cache=use_cache, cache_ttl_seconds=cache_ttl_seconds
+        )
+    else:
+        # Only generate queries for high-scoring stakeholders to optimize budget
+        for company_id, indices in group_query_candidates(companies_by_id, all_stakeholders, min_score=7.5).items():
+            enhanced = generate_sales_navigator_queries_batch(
+                companies_by_id[company_id],
+                [all_stakeholders[i] for i in indices],
+                use_cache,
+                cache_ttl_seconds
+            )
+            for i, stakeholder in zip(indices, enhanced):
+                all_stakeholders[i] = stakeholder
     
     # Step 4: Prioritize stakeholders based on decision-maker score
     prioritized_stakeholders = prioritize_stakeholders(all_stakeholders)
@@ -869,24 +1434,24 @@ def run_stakeholder_identification(limit_companies=None, limit_stakeholders_per_
     log_usage_report()
     
     # Print top stakeholders by score
-    print("\nTop 5 Identified Stakeholders:")
+    logger.info("\nTop 5 Identified Stakeholders:")
     for i, stakeholder in enumerate(prioritized_stakeholders[:min(5, len(prioritized_stakeholders))]):
-        print(f"{i+1}. {stakeholder['name']} ({stakeholder['title']}) at {stakeholder['company_name']} " +
-              f"(Score: {stakeholder.get('decision_maker_score', 0.0):.1f}, Priority: {stakeholder.get('priority', 'unknown')})")
+        logger.info("%d. %s (%s) at %s (Score: %.1f, Priority: %s)",
+                    i + 1, stakeholder['name'], stakeholder['title'], stakeholder['company_name'],
+                    stakeholder.get('decision_maker_score', 0.0), stakeholder.get('priority', 'unknown'))
     
     # Filter out stakeholders with problematic company names before displaying
-    # Update your filter code to this
-    filtered_stakeholders = [s for s in prioritized_stakeholders 
-                            if not (s['company_name'].startswith('Company-') or 
-                                    s['company_name'] == 'Unknown Company') and
-                            s['title'] != 'Unknown']
-
-    print("\nFiltered Results (Excluding auto-generated company names):")
-    print(f"Total filtered stakeholders: {len(filtered_stakeholders)}")
-    print("\nTop 5 Quality Stakeholders:")
+    filtered_stakeholders = [s for s in prioritized_stakeholders
+                             if not _PLACEHOLDER_COMPANY_RE.match(s['company_name']) and
+                             s['title'] != 'Unknown']
+
+    logger.info("\nFiltered Results (Excluding auto-generated company names):")
+    logger.info("Total filtered stakeholders: %d", len(filtered_stakeholders))
+    logger.info("\nTop 5 Quality Stakeholders:")
     for i, stakeholder in enumerate(filtered_stakeholders[:min(5, len(filtered_stakeholders))]):
-        print(f"{i+1}. {stakeholder['name']} ({stakeholder['title']}) at {stakeholder['company_name']} " +
-            f"(Score: {stakeholder.get('decision_maker_score', 0.0):.1f}, Priority: {stakeholder.get('priority', 'unknown')})")
+        logger.info("%d. %s (%s) at %s (Score: %.1f, Priority: %s)",
+                    i + 1, stakeholder['name'], stakeholder['title'], stakeholder['company_name'],
+                    stakeholder.get('decision_maker_score', 0.0), stakeholder.get('priority', 'unknown'))
 
 def parse_arguments():
     """Parse command line arguments for more flexible execution."""
@@ -895,12 +1460,23 @@ def parse_arguments():
     parser.add_argument("--limit-companies", type=int, default=None, help="Limit the number of companies to process")
     parser.add_argument("--limit-stakeholders", type=int, default=None, help="Limit the number of stakeholders per company")
     parser.add_argument("--debug", action="store_true", help="Enable debug output")
+    parser.add_argument("--batch", action="store_true", help="Identify stakeholders through the OpenAI Batch API (50%% cheaper, slower)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of concurrent API requests (1 runs sequentially)")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the LLM instead of reusing cached responses")
+    parser.add_argument("--cache-ttl-hours", type=float, default=None, help="Ignore cached responses older than this many hours")
+    parser.add_argument("--semantic-cache", action="store_true", help="Reuse stakeholder responses for near-duplicate companies")
     return parser.parse_args()
 
 if __name__ == "__main__":
     args = parse_arguments()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO, format="%(message)s")
     run_stakeholder_identification(
         limit_companies=args.limit_companies,
         limit_stakeholders_per_company=args.limit_stakeholders,
-        debug=args.debug
+        debug=args.debug,
+        use_batch=args.batch,
+        max_concurrent=args.concurrency,
+        use_cache=not args.no_cache,
+        cache_ttl_hours=args.cache_ttl_hours,
+        use_semantic_cache=args.semantic_cache
     )
\ No newline at end of file
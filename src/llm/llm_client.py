@@ -8,39 +8,94 @@ This module provides interfaces to different LLM providers using a tiered approa
 """
 
 import os
+import re
 import json
 import time
-import requests
-from typing import Dict, Any, List, Optional
+import atexit
+import asyncio
+import threading
+import httpx
+from typing import Dict, Any, List, Optional, Tuple
 import openai
 from datetime import datetime
-from config.config import OPENAI_API_KEY, PERPLEXITY_API_KEY, TOKEN_PRICING, DATA_DIR
+from config.config import OPENAI_API_KEY, PERPLEXITY_API_KEY, TOKEN_PRICING
+from src.llm.response_cache import make_cache_key, get_cached_response, save_cached_response, is_cacheable, CACHE_MAX_TEMPERATURE
+from src.utils.usage_log import append_usage_record
 from pathlib import Path
 
+# Prefer orjson for batch files (falls back to stdlib json if unavailable)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
 # Initialize API clients
 openai.api_key = OPENAI_API_KEY
 
-# Path for token usage logging
-#from config.config import DATA_DIR
-TOKEN_USAGE_FILE = DATA_DIR / "token_usage.json"
+# Shared HTTP client for all provider calls - keeps connections alive across
+# calls (and multiplexes them over HTTP/2) instead of paying a fresh TCP+TLS
+# handshake on every request. The transport also retries failed connection
+# attempts, so dropped keep-alive connections don't surface as call errors.
+_HTTP_CLIENT = httpx.Client(
+    timeout=60.0,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    )
+)
+
+# HTTP statuses worth retrying: rate limiting and transient gateway errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+atexit.register(_HTTP_CLIENT.close)
+
+_openai_client = None
+
+def get_openai_client() -> "openai.OpenAI":
+    """
+    Return the shared OpenAI client, creating it on first use.
+    
+    The client is built lazily so importing this module does not require an
+    API key, and reused so calls skip re-reading configuration and rebuilding
+    the SDK client on top of the shared connection pool.
+    """
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = openai.OpenAI(api_key=OPENAI_API_KEY, http_client=_HTTP_CLIENT)
+    return _openai_client
+
+# Batch API jobs are billed at half the synchronous rate
+BATCH_PRICE_MULTIPLIER = 0.5
 
 def log_token_usage(
     model: str,
     prompt_tokens: int,
     completion_tokens: int,
     module: str,
-    operation: str
+    operation: str,
+    cached_tokens: int = 0,
+    price_multiplier: float = 1.0
 ) -> Dict[str, Any]:
     """
     Log token usage and associated costs for budget tracking.
     
     This function is critical for ensuring we stay within our $200 budget while
     prioritizing tokens for high-value operations like qualification and outreach.
+    
+    cached_tokens is the part of prompt_tokens served from the provider's
+    prompt cache (the shared static system prompt), billed at the cached rate.
+    price_multiplier scales the listed prices, e.g. BATCH_PRICE_MULTIPLIER for
+    requests run through the Batch API.
     """
     # Calculate costs based on model
     if "gpt-" in model:
         model_pricing = TOKEN_PRICING.get(model, TOKEN_PRICING["gpt-4-turbo"])
-        input_cost = (prompt_tokens / 1000) * model_pricing["input"]
+        cached_rate = model_pricing.get("cached_input", model_pricing["input"])
+        input_cost = ((prompt_tokens - cached_tokens) / 1000) * model_pricing["input"] + (cached_tokens / 1000) * cached_rate
         output_cost = (completion_tokens / 1000) * model_pricing["output"]
         total_cost = input_cost + output_cost
     elif "claude" in model:
@@ -48,6 +103,11 @@ def log_token_usage(
         input_cost = (prompt_tokens / 1000) * model_pricing["input"]
         output_cost = (completion_tokens / 1000) * model_pricing["output"]
         total_cost = input_cost + output_cost
+    elif "embedding" in model:
+        model_pricing = TOKEN_PRICING.get(model, TOKEN_PRICING["text-embedding-3-small"])
+        input_cost = (prompt_tokens / 1000) * model_pricing["input"]
+        output_cost = 0
+        total_cost = input_cost
     elif "perplexity" in model:
         # Perplexity has per-request pricing
         total_cost = TOKEN_PRICING["perplexity"]["request"]
@@ -59,12 +119,17 @@ def log_token_usage(
         input_cost = 0
         output_cost = 0
     
+    input_cost *= price_multiplier
+    output_cost *= price_multiplier
+    total_cost *= price_multiplier
+    
     # Create usage record
     usage_record = {
         "model": model,
         "prompt_tokens": prompt_tokens,
         "completion_tokens": completion_tokens,
         "total_tokens": prompt_tokens + completion_tokens,
+        "cached_tokens": cached_tokens,
         "input_cost_usd": input_cost,
         "output_cost_usd": output_cost,
         "total_cost_usd": total_cost,
@@ -74,43 +139,142 @@ def log_token_usage(
     }
     
     # Append to usage file
-    with open(TOKEN_USAGE_FILE, "a") as f:
-        f.write(json.dumps(usage_record) + "\n")
+    append_usage_record(usage_record)
     
     return usage_record
 
+def cached_prompt_tokens(usage) -> int:
+    """
+    Get the number of prompt tokens served from OpenAI's prompt cache.
+    
+    SDK releases that predate prompt_tokens_details keep it as an untyped
+    extra, so it may arrive as a plain dict rather than an object.
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    if isinstance(details, dict):
+        return details.get("cached_tokens") or 0
+    return getattr(details, "cached_tokens", 0) or 0
+
+def completion_options(response_format: Optional[Dict[str, Any]], stream: bool = False) -> Dict[str, Any]:
+    """
+    Build optional chat completion arguments, omitting unset ones.
+    """
+    options = {"response_format": response_format} if response_format is not None else {}
+    if stream:
+        # Ask for a final usage chunk so streamed calls are still tracked
+        options["stream"] = True
+        options["stream_options"] = {"include_usage": True}
+    return options
+
+def read_completion_stream(stream) -> Tuple[str, Any, Optional[str]]:
+    """
+    Assemble a streamed chat completion.
+    
+    Returns:
+        Tuple of (content, usage, finish_reason) where usage comes from the
+        final chunk
+    """
+    parts = []
+    usage = None
+    finish_reason = None
+    for chunk in stream:
+        if chunk.choices:
+            parts.append(chunk.choices[0].delta.content or "")
+            finish_reason = chunk.choices[0].finish_reason or finish_reason
+        if chunk.usage is not None:
+            usage = chunk.usage
+    return "".join(parts), usage, finish_reason
+
+async def read_completion_stream_async(stream) -> Tuple[str, Any, Optional[str]]:
+    """
+    Async variant of read_completion_stream.
+    """
+    parts = []
+    usage = None
+    finish_reason = None
+    async for chunk in stream:
+        if chunk.choices:
+            parts.append(chunk.choices[0].delta.content or "")
+            finish_reason = chunk.choices[0].finish_reason or finish_reason
+        if chunk.usage is not None:
+            usage = chunk.usage
+    return "".join(parts), usage, finish_reason
+
 def call_openai_api(
     messages: List[Dict[str, str]],
     model: str = "gpt-4-turbo",
     temperature: float = 0.7,
     max_tokens: int = 1000,
     module: str = "general",
-    operation: str = "general"
+    operation: str = "general",
+    response_format: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
+    cache_ttl_seconds: Optional[float] = None,
+    stream: bool = False,
+    cache_max_temperature: float = CACHE_MAX_TEMPERATURE
 ) -> Dict[str, Any]:
     """
     Call OpenAI API with error handling and token tracking.
     Updated to use OpenAI API v1.0.0+
+    
+    Pass response_format={"type": "json_object"} to have the model return
+    parseable JSON. With stream=True the completion is read as it is
+    generated, which keeps long responses from idling on the connection.
+    
+    Identical low-temperature requests are served from the response cache
+    without an API call. Cache hits are still logged, at zero cost, so usage
+    analytics reflect every request. Raise cache_max_temperature to also reuse
+    responses sampled at a higher temperature.
     """
+    cache_key = None
+    if use_cache and is_cacheable(temperature, cache_max_temperature):
+        cache_key = make_cache_key(model, temperature, messages, response_format)
+        cached = get_cached_response(cache_key, ttl_seconds=cache_ttl_seconds)
+        if cached is not None:
+            return {
+                "content": cached["content"],
+                "usage": log_token_usage(
+                    model=model,
+                    prompt_tokens=0,
+                    completion_tokens=0,
+                    module=module,
+                    operation=f"{operation}_cache_hit"
+                )
+            }
+    
     max_retries = 3
     retry_delay = 2
     
-    client = openai.OpenAI(api_key=OPENAI_API_KEY)
+    client = get_openai_client()
     
     for attempt in range(max_retries):
         try:
-            # Make API call using new format
-            response = client.chat.completions.create(
+            _RATE_LIMITER.wait(estimate_request_tokens(messages, max_tokens))
+            
+            # Make API call using new format; the raw response exposes rate limit headers
+            raw_response = client.chat.completions.with_raw_response.create(
                 model=model,
                 messages=messages,
                 temperature=temperature,
-                max_tokens=max_tokens
+                max_tokens=max_tokens,
+                **completion_options(response_format, stream)
             )
+            _RATE_LIMITER.update_from_headers(raw_response.headers)
+            response = raw_response.parse()
+            
+            if stream:
+                content, response_usage, finish_reason = read_completion_stream(response)
+            else:
+                # A refusal under a strict json_schema format comes back with no content
+                content, response_usage = response.choices[0].message.content or "", response.usage
+                finish_reason = response.choices[0].finish_reason
             
             # Process usage for token tracking
             usage_data = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens
+                "prompt_tokens": response_usage.prompt_tokens if response_usage else 0,
+                "completion_tokens": response_usage.completion_tokens if response_usage else 0,
+                "total_tokens": response_usage.total_tokens if response_usage else 0,
+                "cached_tokens": cached_prompt_tokens(response_usage)
             }
             
             # Log token usage
@@ -119,12 +283,22 @@ def call_openai_api(
                 prompt_tokens=usage_data["prompt_tokens"],
                 completion_tokens=usage_data["completion_tokens"],
                 module=module,
-                operation=operation
+                operation=operation,
+                cached_tokens=usage_data["cached_tokens"]
             )
             
+            # Responses cut off at max_tokens are not worth reusing
+            if cache_key is not None and content and finish_reason != "length":
+                save_cached_response(cache_key, {
+                    "content": content,
+                    "model": model,
+                    "tokens": usage_data["completion_tokens"]
+                })
+            
             return {
-                "content": response.choices[0].message.content,
-                "usage": usage
+                "content": content,
+                "usage": usage,
+                "finish_reason": finish_reason
             }
         
         except Exception as e:
@@ -146,6 +320,441 @@ def call_openai_api(
                     )
                 }
 
+def get_embedding(
+    text: str,
+    model: str = "text-embedding-3-small",
+    module: str = "general",
+    operation: str = "embedding"
+) -> List[float]:
+    """
+    Get an embedding vector for text from the OpenAI API with token tracking.
+    
+    Returns an empty list if the call fails.
+    """
+    client = get_openai_client()
+    
+    try:
+        response = client.embeddings.create(model=model, input=text)
+        log_token_usage(
+            model=model,
+            prompt_tokens=response.usage.prompt_tokens,
+            completion_tokens=0,
+            module=module,
+            operation=operation
+        )
+        return response.data[0].embedding
+    except Exception as e:
+        print(f"Failed to get embedding from OpenAI API: {str(e)}")
+        return []
+
+class RateLimiter:
+    """
+    Token-bucket limiter for requests-per-minute and tokens-per-minute quotas.
+    
+    Both buckets refill continuously, so bursts are allowed up to the quota
+    and sustained throughput stays within the provider's rate limits. When
+    responses carry x-ratelimit-remaining-* headers, the buckets are lowered
+    to what the provider reports, so callers only wait when quota is short;
+    once a quota is exhausted, callers wait until its x-ratelimit-reset-* time.
+    """
+    
+    def __init__(self, max_requests_per_minute: float = 500, max_tokens_per_minute: float = 150000):
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.available_requests = max_requests_per_minute
+        self.available_tokens = max_tokens_per_minute
+        self.last_update = time.monotonic()
+        self.resume_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.last_update = now
+        self.available_requests = min(
+            self.max_requests_per_minute,
+            self.available_requests + elapsed * self.max_requests_per_minute / 60.0
+        )
+        self.available_tokens = min(
+            self.max_tokens_per_minute,
+            self.available_tokens + elapsed * self.max_tokens_per_minute / 60.0
+        )
+    
+    def _try_consume(self, tokens: int) -> float:
+        """Consume capacity if available; otherwise return seconds to wait."""
+        with self._lock:
+            self._refill()
+            if self.last_update < self.resume_at:
+                return self.resume_at - self.last_update
+            tokens = min(tokens, self.max_tokens_per_minute)
+            if self.available_requests >= 1 and self.available_tokens >= tokens:
+                self.available_requests -= 1
+                self.available_tokens -= tokens
+                return 0.0
+            
+            request_wait = (1 - self.available_requests) * 60.0 / self.max_requests_per_minute
+            token_wait = (tokens - self.available_tokens) * 60.0 / self.max_tokens_per_minute
+            return max(request_wait, token_wait, 0.01)
+    
+    async def acquire(self, tokens: int = 0):
+        """Wait until one request and the given number of tokens are available."""
+        wait = self._try_consume(tokens)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._try_consume(tokens)
+    
+    def wait(self, tokens: int = 0):
+        """Blocking variant of acquire for synchronous callers."""
+        wait = self._try_consume(tokens)
+        while wait > 0:
+            time.sleep(wait)
+            wait = self._try_consume(tokens)
+    
+    def update_from_headers(self, headers):
+        """Lower the buckets to the remaining quota reported by the provider."""
+        remaining_requests = headers.get("x-ratelimit-remaining-requests")
+        remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+        with self._lock:
+            self._refill()
+            try:
+                if remaining_requests is not None:
+                    self.available_requests = min(self.available_requests, float(remaining_requests))
+                    if self.available_requests < 1:
+                        self._pause_until_reset(headers.get("x-ratelimit-reset-requests"))
+                if remaining_tokens is not None:
+                    self.available_tokens = min(self.available_tokens, float(remaining_tokens))
+                    if self.available_tokens < 1:
+                        self._pause_until_reset(headers.get("x-ratelimit-reset-tokens"))
+            except ValueError:
+                pass
+    
+    def _pause_until_reset(self, reset: Optional[str]):
+        """Hold every caller until an exhausted quota resets."""
+        seconds = parse_reset_duration(reset)
+        if seconds:
+            self.resume_at = max(self.resume_at, self.last_update + seconds)
+
+_RESET_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_RESET_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+def parse_reset_duration(reset: Optional[str]) -> float:
+    """
+    Parse an x-ratelimit-reset-* header value such as "1s", "20ms" or "6m0s".
+    
+    Returns:
+        Seconds until the quota resets, or 0.0 if the value is missing or malformed
+    """
+    if not reset:
+        return 0.0
+    return sum((float(amount) * _RESET_UNIT_SECONDS[unit] for amount, unit in _RESET_DURATION_RE.findall(reset)), 0.0)
+
+# Shared limiter for synchronous calls, so sequential pipeline loops only
+# wait when the provider reports that quota is running low
+_RATE_LIMITER = RateLimiter()
+
+def estimate_request_tokens(messages: List[Dict[str, str]], max_tokens: int) -> int:
+    """
+    Roughly estimate tokens consumed by a chat request for rate limiting.
+    
+    Uses the ~4 characters per token heuristic for the prompt plus the
+    completion budget, matching how OpenAI counts against TPM limits.
+    """
+    prompt_chars = sum(len(message.get("content", "")) for message in messages)
+    return prompt_chars // 4 + max_tokens
+
+async def call_openai_api_async(
+    client: "openai.AsyncOpenAI",
+    messages: List[Dict[str, str]],
+    model: str = "gpt-4-turbo",
+    temperature: float = 0.7,
+    max_tokens: int = 1000,
+    module: str = "general",
+    operation: str = "general",
+    rate_limiter: Optional[RateLimiter] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    stream: bool = False
+) -> Dict[str, Any]:
+    """
+    Async variant of call_openai_api for concurrent request fan-out.
+    
+    Retries with exponential backoff on rate limit (429) and server errors,
+    waiting on the shared rate limiter before every attempt.
+    """
+    max_retries = 3
+    retry_delay = 2
+    
+    for attempt in range(max_retries):
+        try:
+            if rate_limiter is not None:
+                await rate_limiter.acquire(estimate_request_tokens(messages, max_tokens))
+            
+            raw_response = await client.chat.completions.with_raw_response.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **completion_options(response_format, stream)
+            )
+            if rate_limiter is not None:
+                rate_limiter.update_from_headers(raw_response.headers)
+            response = raw_response.parse()
+            
+            if stream:
+                content, response_usage, finish_reason = await read_completion_stream_async(response)
+            else:
+                # A refusal under a strict json_schema format comes back with no content
+                content, response_usage = response.choices[0].message.content or "", response.usage
+                finish_reason = response.choices[0].finish_reason
+            
+            # Log token usage
+            usage = log_token_usage(
+                model=model,
+                prompt_tokens=response_usage.prompt_tokens if response_usage else 0,
+                completion_tokens=response_usage.completion_tokens if response_usage else 0,
+                module=module,
+                operation=operation,
+                cached_tokens=cached_prompt_tokens(response_usage)
+            )
+            
+            return {
+                "content": content,
+                "usage": usage,
+                "finish_reason": finish_reason
+            }
+        
+        except Exception as e:
+            status_code = getattr(e, "status_code", None)
+            retryable = status_code is None or status_code == 429 or status_code >= 500
+            if retryable and attempt < max_retries - 1:
+                print(f"Error calling OpenAI API: {str(e)}. Retrying in {retry_delay} seconds...")
+                await asyncio.sleep(retry_delay)
+                retry_delay *= 2  # Exponential backoff
+            else:
+                print(f"Failed to call OpenAI API after {attempt + 1} attempts: {str(e)}")
+                return {
+                    "content": f"Error: {str(e)}",
+                    "usage": log_token_usage(
+                        model=model,
+                        prompt_tokens=0,
+                        completion_tokens=0,
+                        module=module,
+                        operation=f"error_{operation}"
+                    )
+                }
+
+def call_openai_concurrent(
+    batch_requests: List[Dict[str, Any]],
+    module: str = "general",
+    max_concurrent: int = 8,
+    max_requests_per_minute: float = 500,
+    max_tokens_per_minute: float = 150000,
+    use_cache: bool = False,
+    cache_ttl_seconds: Optional[float] = None,
+    cache_max_temperature: float = CACHE_MAX_TEMPERATURE
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run chat completion requests concurrently with bounded parallelism.
+    
+    Interactive alternative to call_openai_batch: requests are issued in
+    parallel over one shared connection pool, gated by a semaphore and a
+    requests/tokens-per-minute token bucket. With use_cache, low-temperature
+    requests found in the response cache are answered without an API call.
+    
+    Args:
+        batch_requests: Requests with custom_id, messages, model, temperature,
+            max_tokens and operation keys, plus optional response_format and stream
+        module: Pipeline module for token tracking
+        max_concurrent: Maximum number of in-flight requests
+        max_requests_per_minute: Requests-per-minute quota
+        max_tokens_per_minute: Tokens-per-minute quota
+        use_cache: Whether to serve and store responses in the response cache
+        cache_ttl_seconds: Optional maximum age of cached responses
+        cache_max_temperature: Highest temperature whose responses are cached
+        
+    Returns:
+        Dictionary mapping custom_id to a {"content", "usage", "finish_reason"} response
+    """
+    results = {}
+    cache_keys = {}
+    request_models = {request["custom_id"]: request["model"] for request in batch_requests}
+    pending_requests = []
+    for request in batch_requests:
+        if use_cache and is_cacheable(request["temperature"], cache_max_temperature):
+            key = make_cache_key(request["model"], request["temperature"], request["messages"], request.get("response_format"))
+            cached = get_cached_response(key, ttl_seconds=cache_ttl_seconds)
+            if cached is not None:
+                results[request["custom_id"]] = {
+                    "content": cached["content"],
+                    "usage": log_token_usage(
+                        model=request["model"],
+                        prompt_tokens=0,
+                        completion_tokens=0,
+                        module=module,
+                        operation=f"{request.get('operation', 'general')}_cache_hit"
+                    )
+                }
+                continue
+            cache_keys[request["custom_id"]] = key
+        pending_requests.append(request)
+    
+    if not pending_requests:
+        return results
+    
+    async def run_all():
+        rate_limiter = RateLimiter(max_requests_per_minute, max_tokens_per_minute)
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=max_concurrent)
+        ) as http_client:
+            client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=http_client, max_retries=0)
+            
+            async def run_one(request):
+                async with semaphore:
+                    return await call_openai_api_async(
+                        client,
+                        messages=request["messages"],
+                        model=request["model"],
+                        temperature=request["temperature"],
+                        max_tokens=request["max_tokens"],
+                        module=module,
+                        operation=request.get("operation", "general"),
+                        rate_limiter=rate_limiter,
+                        response_format=request.get("response_format"),
+                        stream=request.get("stream", False)
+                    )
+            
+            responses = await asyncio.gather(*[run_one(request) for request in pending_requests])
+        
+        return {request["custom_id"]: response for request, response in zip(pending_requests, responses)}
+    
+    responses = asyncio.run(run_all())
+    
+    # Only cache successful responses
+    for custom_id, response in responses.items():
+        if (custom_id in cache_keys and response["content"] and not response["content"].startswith("Error:")
+                and response.get("finish_reason") != "length"):
+            save_cached_response(cache_keys[custom_id], {
+                "content": response["content"],
+                "model": request_models[custom_id],
+                "tokens": response["usage"]["completion_tokens"]
+            })
+    
+    results.update(responses)
+    return results
+
+def call_openai_batch(
+    batch_requests: List[Dict[str, Any]],
+    module: str = "general",
+    poll_interval: int = 30,
+    completion_window: str = "24h"
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run chat completion requests through the OpenAI Batch API.
+    
+    Batch jobs are billed at half the synchronous rate and are not subject to
+    per-minute rate limits, which makes them a good fit for large offline runs.
+    This call blocks, polling until the batch finishes.
+    
+    Args:
+        batch_requests: Requests with custom_id, messages, model, temperature,
+            max_tokens and operation keys, plus an optional response_format
+        module: Pipeline module for token tracking
+        poll_interval: Seconds between batch status checks
+        completion_window: Batch completion window accepted by the API
+        
+    Returns:
+        Dictionary mapping custom_id to a {"content", "usage", "finish_reason"} response
+    """
+    client = get_openai_client()
+    
+    # Assemble the JSONL input file, remembering model/operation for usage logging
+    request_info = {}
+    lines = []
+    for request in batch_requests:
+        request_info[request["custom_id"]] = (request["model"], request.get("operation", "general"))
+        lines.append(_json_dumps({
+            "custom_id": request["custom_id"],
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": request["model"],
+                "messages": request["messages"],
+                "temperature": request["temperature"],
+                "max_tokens": request["max_tokens"],
+                **completion_options(request.get("response_format"))
+            }
+        }))
+    
+    try:
+        input_file = client.files.create(
+            file=("batch_input.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=completion_window
+        )
+        print(f"Submitted OpenAI batch {batch.id} with {len(batch_requests)} requests")
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise Exception(f"Batch {batch.id} finished with status {batch.status}")
+        
+        output = client.files.content(batch.output_file_id).text
+    except Exception as e:
+        print(f"Failed to run OpenAI batch: {str(e)}")
+        return {}
+    
+    # Map each output line back to its request
+    results = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        
+        record = _json_loads(line)
+        custom_id = record["custom_id"]
+        model, operation = request_info.get(custom_id, ("gpt-4-turbo", "general"))
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        
+        if response.get("status_code") != 200 or not body.get("choices"):
+            error = record.get("error") or body.get("error")
+            results[custom_id] = {
+                "content": f"Error: {error}",
+                "usage": log_token_usage(
+                    model=model,
+                    prompt_tokens=0,
+                    completion_tokens=0,
+                    module=module,
+                    operation=f"error_{operation}"
+                )
+            }
+            continue
+        
+        usage_data = body.get("usage", {})
+        results[custom_id] = {
+            "content": body["choices"][0]["message"]["content"] or "",
+            "finish_reason": body["choices"][0].get("finish_reason"),
+            "usage": log_token_usage(
+                model=model,
+                prompt_tokens=usage_data.get("prompt_tokens", 0),
+                completion_tokens=usage_data.get("completion_tokens", 0),
+                module=module,
+                operation=operation,
+                cached_tokens=(usage_data.get("prompt_tokens_details") or {}).get("cached_tokens", 0),
+                price_multiplier=BATCH_PRICE_MULTIPLIER
+            )
+        }
+    
+    return results
+
 def call_claude_api(
     messages: List[Dict[str, str]],
     model: str = "claude-3-opus",
@@ -205,7 +814,7 @@ def query_perplexity(
     
     for attempt in range(max_retries):
         try:
-            response = requests.post(
+            response = _HTTP_CLIENT.post(
                 "https://api.perplexity.ai/search",
                 headers=headers,
                 json=data
@@ -228,15 +837,20 @@ def query_perplexity(
                     "usage": usage
                 }
             else:
-                raise Exception(f"Perplexity API returned status code {response.status_code}: {response.text}")
+                error = Exception(f"Perplexity API returned status code {response.status_code}: {response.text}")
+                error.status_code = response.status_code
+                raise error
         
         except Exception as e:
-            if attempt < max_retries - 1:
+            # Client errors such as a bad API key will fail the same way again
+            status_code = getattr(e, "status_code", None)
+            retryable = status_code is None or status_code in RETRYABLE_STATUS_CODES
+            if retryable and attempt < max_retries - 1:
                 print(f"Error calling Perplexity API: {str(e)}. Retrying in {retry_delay} seconds...")
                 time.sleep(retry_delay)
                 retry_delay *= 2
             else:
-                print(f"Failed to query Perplexity API after {max_retries} attempts: {str(e)}")
+                print(f"Failed to query Perplexity API after {attempt + 1} attempts: {str(e)}")
                 # Return fallback response
                 return {
                     "content": f"Error: {str(e)}",
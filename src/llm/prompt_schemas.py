@@ -0,0 +1,117 @@
+"""
+Structured Output Schemas for DuPont Tedlar Lead Generation System.
+
+This module defines a JSON Schema for each prompt template that expects a JSON
+response. Models that support Structured Outputs enforce the schema while
+decoding, so responses parse on the first try without markdown fences or
+prose wrappers; older models fall back to JSON mode.
+"""
+
+from typing import Dict, Any
+
+# Model families that accept response_format={"type": "json_schema"}
+STRUCTURED_OUTPUT_MODELS = ("gpt-4o",)
+
+def _strict_object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build an object schema with every property required, as strict mode expects.
+    """
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+SCORED_CRITERION_SCHEMA = _strict_object({
+    "score": {"type": "number"},
+    "justification": {"type": "string"}
+})
+
+STRING_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+
+EVENT_QUALIFICATION_SCHEMA = _strict_object({
+    "attendee_alignment": SCORED_CRITERION_SCHEMA,
+    "use_case_relevance": SCORED_CRITERION_SCHEMA,
+    "competitive_environment": SCORED_CRITERION_SCHEMA,
+    "lead_generation_potential": SCORED_CRITERION_SCHEMA,
+    "overall_event_priority": _strict_object({
+        "score": {"type": "number"},
+        "justification": {"type": "string"},
+        "priority": {"type": "string", "enum": ["high", "medium", "low"]}
+    })
+})
+
+_COMPANY_QUALIFICATION_PROPERTIES = {
+    "industry_relevance": SCORED_CRITERION_SCHEMA,
+    "product_fit": SCORED_CRITERION_SCHEMA,
+    "decision_maker_access": SCORED_CRITERION_SCHEMA,
+    "current_engagement": SCORED_CRITERION_SCHEMA,
+    "market_presence": SCORED_CRITERION_SCHEMA,
+    "use_cases": STRING_LIST_SCHEMA,
+    "pain_points": STRING_LIST_SCHEMA
+}
+
+COMPANY_QUALIFICATION_SCHEMA = _strict_object(_COMPANY_QUALIFICATION_PROPERTIES)
+
+COMPANY_QUALIFICATION_BATCH_SCHEMA = _strict_object({
+    "qualifications": {
+        "type": "array",
+        "items": _strict_object({"id": {"type": "integer"}, **_COMPANY_QUALIFICATION_PROPERTIES})
+    }
+})
+
+STAKEHOLDER_IDENTIFICATION_SCHEMA = _strict_object({
+    "stakeholders": {
+        "type": "array",
+        "items": _strict_object({
+            "name": {"type": "string"},
+            "title": {"type": "string"},
+            "department": {"type": "string"},
+            "decision_maker_score": {"type": "number"},
+            "rationale": {"type": "string"},
+            "linkedin_url": {"type": "string"},
+            "responsibilities": STRING_LIST_SCHEMA,
+            "influence": {"type": "string"},
+            "relevant_benefits": STRING_LIST_SCHEMA,
+            "priority": {"type": "string", "enum": ["high", "medium", "low"]}
+        })
+    }
+})
+
+LINKEDIN_BATCH_QUERY_SCHEMA = _strict_object({
+    "queries": {
+        "type": "array",
+        "items": _strict_object({
+            "id": {"type": "integer"},
+            "query": {"type": "string"}
+        })
+    }
+})
+
+OUTREACH_MESSAGE_SCHEMA = _strict_object({
+    "subject": {"type": "string"},
+    "message_body": {"type": "string"},
+    "value_propositions": STRING_LIST_SCHEMA,
+    "call_to_action": {"type": "string"}
+})
+
+def response_format_for(model: str, name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the response_format for a model and response schema.
+
+    Args:
+        model: Model name
+        name: Schema name reported to the API
+        schema: JSON Schema for the response
+
+    Returns:
+        A strict json_schema format for models with Structured Outputs,
+        otherwise JSON mode
+    """
+    if model.startswith(STRUCTURED_OUTPUT_MODELS):
+        return {
+            "type": "json_schema",
+            "json_schema": {"name": name, "strict": True, "schema": schema}
+        }
+    return {"type": "json_object"}
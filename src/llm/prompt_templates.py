@@ -10,13 +10,22 @@ lead generation pipeline, optimized for:
 """
 
 from config.config import TEDLAR_CONTEXT, LEAD_SCORING
+from typing import Dict, List, FrozenSet, Tuple, Any
+from functools import lru_cache
+import re
+import sys
 import json
 
-# Base context for all prompts - reduces redundant information in each prompt
-BASE_TEDLAR_CONTEXT = f"""
-You are assisting with lead generation for DuPont Tedlar's Graphics & Signage team.
+# Scoring criteria rendered once and embedded in the static system prompts
+# that need them (never substituted per call); sorted keys keep the bytes
+# identical across runs for provider prompt caching
+LEAD_SCORING_JSON = json.dumps(LEAD_SCORING, indent=2, sort_keys=True)
 
-PRODUCT INFORMATION:
+# Context sections, kept separate so prompts that only need part of the
+# catalog (e.g. Sales Navigator queries) can send just the relevant slice
+ROLE_CONTEXT = """You are assisting with lead generation for DuPont Tedlar's Graphics & Signage team."""
+
+PRODUCT_CONTEXT = """PRODUCT INFORMATION:
 DuPont Tedlar produces premium polyvinyl fluoride (PVF) protective films with over 60 years of technology development. 
 These films extend the life of graphics applications in challenging environments by 5-7 years longer than standard laminates.
 
@@ -32,9 +41,9 @@ Key performance capabilities:
 - Exceptional color retention (<3 Delta E shift after 10 years)
 - Chemical resistance to 300+ substances
 - Temperature range from -70°F to 302°F
-- Anti-delamination technology preventing edge lifting and peeling
+- Anti-delamination technology preventing edge lifting and peeling"""
 
-IDEAL CUSTOMER SEGMENTS:
+SEGMENT_CONTEXT = """IDEAL CUSTOMER SEGMENTS:
 1. Large Format Print Providers ($5M-$50M revenue, 50-250 employees)
    - Pain points: Premature graphic failure, warranty claims, color fading
    - Decision makers: Operations Directors, Production Managers, R&D Directors
@@ -55,24 +64,44 @@ IDEAL CUSTOMER SEGMENTS:
    - Pain points: UV degradation, color consistency, delamination
    - Decision makers: Production Managers, Technical Directors
 
-COMPETITIVE POSITIONING:
+6. Material Distributors & Converters ($10M-$200M revenue, 50-300 employees)
+   - Pain points: Product differentiation, competitive advantages, specialized applications
+   - Decision makers: Product Line Managers, Business Development Directors"""
+
+COMPETITIVE_CONTEXT = """COMPETITIVE POSITIONING:
 Despite being priced 15-30% higher than standard protective films, Tedlar delivers 30-40% lower lifetime costs
 through superior durability, outperforming competitors like 3M Scotchcal, Avery Dennison MPI, and ORAFOL Oraguard
-in accelerated weathering tests by 30-50%.
+in accelerated weathering tests by 30-50%."""
 
-KEY INDUSTRY ASSOCIATIONS:
+ASSOCIATION_CONTEXT = """KEY INDUSTRY ASSOCIATIONS:
 - International Sign Association (ISA): 2,300+ sign and graphics companies
 - PRINTING United Alliance: 7,000+ companies across printing technologies
 - FESPA: Global federation with strong European presence
 - Society for Experiential Graphic Design (SEGD): Focus on architectural and wayfinding graphics
-- National Association of Sign Supply Distributors (NASSD): Key distributors of sign materials
-"""
+- National Association of Sign Supply Distributors (NASSD): Key distributors of sign materials"""
+
+# Base context for all prompts - reduces redundant information in each prompt.
+# Each task prompt is split into a static system prompt (fixed instructions)
+# and a user prompt holding every variable detail. Task prompts hold only their
+# own instructions; this context is sent once ahead of them as its own system
+# message, so it is an identical prefix that provider prompt caching can reuse
+# and is not copied into every template at import. It is interned so every
+# reference shares one object and equality checks short-circuit on identity.
+BASE_TEDLAR_CONTEXT = sys.intern("\n" + "\n\n".join([
+    ROLE_CONTEXT, PRODUCT_CONTEXT, SEGMENT_CONTEXT, COMPETITIVE_CONTEXT, ASSOCIATION_CONTEXT
+]) + "\n")
+
+# Stakeholder identification and outreach draw on products and segments but
+# not competitive positioning or association listings
+TEDLAR_CORE_CONTEXT = sys.intern("\n" + "\n\n".join([ROLE_CONTEXT, PRODUCT_CONTEXT, SEGMENT_CONTEXT]) + "\n")
+
+# Sales Navigator queries only need the customer segments and their
+# decision-maker roles, not product specs or competitive positioning
+SALES_NAVIGATOR_CONTEXT = sys.intern("\n" + "\n\n".join([ROLE_CONTEXT, SEGMENT_CONTEXT]) + "\n")
 
 # EVENT RESEARCH PROMPTS
 
-EVENT_DISCOVERY_PROMPT = f"""
-{BASE_TEDLAR_CONTEXT}
-
+EVENT_DISCOVERY_PROMPT = """
 TASK: Identify the most relevant upcoming industry events where DuPont Tedlar's target customers 
 are likely to attend.
 
@@ -105,13 +134,8 @@ For each event, provide:
 FORMAT YOUR RESPONSE AS JSON with an array of event objects.
 """
 
-EVENT_QUALIFICATION_PROMPT = f"""
-{BASE_TEDLAR_CONTEXT}
-
-TASK: Analyze the following event to determine its relevance for DuPont Tedlar lead generation.
-
-EVENT DETAILS:
-{{event_details}}
+EVENT_QUALIFICATION_SYSTEM_PROMPT = """
+TASK: Analyze the event described in the user message to determine its relevance for DuPont Tedlar lead generation.
 
 Evaluate this event on the following criteria:
 1. Attendee alignment with Tedlar's specific customer segments (0-10)
@@ -134,28 +158,30 @@ Evaluate this event on the following criteria:
    - Provide a weighted final score
    - Recommend whether this should be a high, medium, or low priority event
 
-For each criterion, provide a score AND a detailed justification with specific references to Tedlar's
-product benefits, customer segments, and qualification factors.
+For each criterion, provide a score AND a justification (40 words or fewer) with specific references to
+Tedlar's product benefits, customer segments, and qualification factors.
 
-FORMAT YOUR RESPONSE AS JSON with scores and detailed justifications.
+FORMAT YOUR RESPONSE AS JSON with the keys attendee_alignment, use_case_relevance, competitive_environment,
+lead_generation_potential and overall_event_priority. Each is an object with a score and a justification;
+overall_event_priority also has a priority of high, medium or low.
 """
 
-# COMPANY ANALYSIS PROMPTS
+EVENT_QUALIFICATION_USER_PROMPT = """
+EVENT DETAILS:
+{event_details}
+"""
 
-COMPANY_DISCOVERY_PROMPT = f"""
-{BASE_TEDLAR_CONTEXT}
+# COMPANY ANALYSIS PROMPTS
 
-TASK: Identify companies likely to attend the following event that match 
+COMPANY_DISCOVERY_SYSTEM_PROMPT = """
+TASK: Identify companies likely to attend the event described in the user message that match 
 DuPont Tedlar's ideal customer profile.
 
-EVENT: {{event_name}}
-DETAILS: {{event_details}}
-
 Focus on companies that:
 1. Match one of Tedlar's 6 specific customer segments
 2. Experience the pain points Tedlar addresses (degradation, fading, chemical damage)
 3. Would benefit from Tedlar's specific product lines and performance characteristics
-4. Have the appropriate decision-maker roles (e.g., Production Directors, Materials Engineering Directors)
+4. Have the decision-maker roles listed for their segment under IDEAL CUSTOMER SEGMENTS above
 
 For each potential company, provide:
 - Company name
@@ -174,17 +200,17 @@ strong prospects for Tedlar's protective films.
 FORMAT YOUR RESPONSE AS JSON with an array of company objects.
 """
 
-COMPANY_QUALIFICATION_PROMPT = f"""
-{BASE_TEDLAR_CONTEXT}
+COMPANY_DISCOVERY_USER_PROMPT = """
+EVENT: {event_name}
+DETAILS: {event_details}
+"""
 
-TASK: Perform an in-depth qualification analysis of the following company 
+COMPANY_QUALIFICATION_SYSTEM_PROMPT = f"""
+TASK: Perform an in-depth qualification analysis of the company described in the user message 
 as a potential customer for DuPont Tedlar protective films.
 
-COMPANY: {{company_name}}
-DETAILS: {{company_details}}
-
 Evaluate this company against our lead scoring criteria:
-{LEAD_SCORING}
+{LEAD_SCORING_JSON}
 
 For each criterion:
 
@@ -215,40 +241,65 @@ For each criterion:
 
 For each criterion:
 1. Assign a score (0-10)
-2. Provide detailed justification with specific references to the company
+2. Provide a justification (40 words or fewer) with specific references to the company
 3. Identify specific use cases for Tedlar products
 4. Outline potential pain points that Tedlar can address
 
-Calculate a weighted qualification score and provide a comprehensive qualification rationale.
 Focus on conversion potential rather than general awareness.
 
-FORMAT YOUR RESPONSE AS JSON with scores, justifications, and detailed analysis.
+FORMAT YOUR RESPONSE AS JSON with the keys industry_relevance, product_fit, decision_maker_access,
+current_engagement and market_presence, each an object with a score and a justification, plus
+use_cases and pain_points as lists of strings.
 """
 
-# STAKEHOLDER IDENTIFICATION PROMPTS
+COMPANY_QUALIFICATION_USER_PROMPT = """
+COMPANY: {company_name}
+DETAILS: {company_details}
+"""
 
-STAKEHOLDER_IDENTIFICATION_PROMPT = f"""
-{BASE_TEDLAR_CONTEXT}
+COMPANY_QUALIFICATION_BATCH_SYSTEM_PROMPT = f"""
+TASK: Perform a qualification analysis of EACH company in the JSON array in the user message
+as a potential customer for DuPont Tedlar protective films.
 
-TASK: Identify key decision-makers at the following company who would be involved in 
-purchasing protective films for graphics and signage applications.
+Evaluate every company independently against our lead scoring criteria:
+{LEAD_SCORING_JSON}
+
+For each company, score these criteria from 0-10 with a one or two sentence justification
+that references the company specifically:
+1. industry_relevance (30% weight) - fit with Tedlar's 6 target segments and need for extreme durability
+2. product_fit (25% weight) - which Tedlar products (CLR, TWH, TMT, etc.) address their likely challenges
+3. decision_maker_access (20% weight) - purchasing roles and purchase process complexity
+4. current_engagement (15% weight) - presence at industry events and associations
+5. market_presence (10% weight) - influence, size relative to Tedlar's targets, growth trajectory
+
+Also list specific use cases for Tedlar products and pain points Tedlar can address.
+Focus on conversion potential rather than general awareness.
 
-COMPANY: {{company_name}}
-DETAILS: {{company_details}}
-CUSTOMER SEGMENT: {{customer_segment}}
+FORMAT YOUR RESPONSE AS JSON: {{"qualifications": [{{"id": <company id>,
+"industry_relevance": {{"score": <0-10>, "justification": "..."}}, "product_fit": {{...}},
+"decision_maker_access": {{...}}, "current_engagement": {{...}}, "market_presence": {{...}},
+"use_cases": ["..."], "pain_points": ["..."]}}]}}
+with exactly one entry per company ID in the user message.
+"""
+
+COMPANY_QUALIFICATION_BATCH_USER_PROMPT = """
+COMPANIES:
+{companies_json}
+"""
+
+# STAKEHOLDER IDENTIFICATION PROMPTS
+
+STAKEHOLDER_IDENTIFICATION_SYSTEM_PROMPT = """
+TASK: Identify key decision-makers at the company described in the user message who would be involved in 
+purchasing protective films for graphics and signage applications.
 
 Based on the company's customer segment, identify the specific decision-maker roles that 
 would be involved in evaluating and purchasing Tedlar protective films.
 
 For each potential stakeholder:
 
-1. Identify the exact job title based on the company's customer segment:
-   - For Large Format Print Providers: Target Operations Directors, Production Managers, R&D Directors
-   - For Fleet Graphics Specialists: Target Fleet Graphics Directors, Product Development Managers
-   - For Architectural Graphics: Target VP of Product Development, Materials Engineering Directors
-   - For Outdoor Advertising: Target Production Directors, Materials Procurement Managers
-   - For Sign Manufacturing: Target Production Managers, Technical Directors
-   - For Material Distributors: Target Product Line Managers, Business Development Directors
+1. Identify the exact job title, using the decision-maker roles listed for the company's
+   customer segment under IDEAL CUSTOMER SEGMENTS above
 
 2. For each identified role:
    - Explain their likely responsibilities related to protective films
@@ -256,7 +307,7 @@ For each potential stakeholder:
    - Identify specific Tedlar benefits that would resonate with their role
    - Explain how Tedlar addresses their specific job challenges
    - Assign a decision-maker score (1-10)
-   - Provide a detailed rationale for this score
+   - Provide a rationale for this score (40 words or fewer)
 
 3. Prioritize stakeholders based on:
    - Decision-making authority
@@ -267,88 +318,97 @@ For each potential stakeholder:
 Focus on 2-3 high-value stakeholders rather than an exhaustive list.
 Consider both technical decision-makers and financial/business approvers.
 
-FORMAT YOUR RESPONSE AS JSON with stakeholder details and decision-making assessment.
-Include a priority ranking of which stakeholders to contact first.
+FORMAT YOUR RESPONSE AS JSON with stakeholder details and decision-making assessment,
+giving each stakeholder a contact priority of high, medium or low.
 """
 
-LINKEDIN_QUERY_TEMPLATE = f"""
-{BASE_TEDLAR_CONTEXT}
-
-TASK: Create a LinkedIn Sales Navigator search query to find decision-makers at 
-the following company who would be interested in protective films for graphics applications.
-
-COMPANY: {{company_name}}
-DETAILS: {{company_details}}
-CUSTOMER SEGMENT: {{customer_segment}}
+STAKEHOLDER_IDENTIFICATION_USER_PROMPT = """
+COMPANY: {company_name}
+DETAILS: {company_details}
+CUSTOMER SEGMENT: {customer_segment}
+"""
 
-Based on the company's customer segment, create targeted Sales Navigator search queries
-that will find the exact decision-maker roles we need to reach.
+LINKEDIN_BATCH_QUERY_SYSTEM_PROMPT = f"""
+TASK: Create a LinkedIn Sales Navigator search query for EACH of the stakeholders listed in
+the user message, so sales teams can find each person or someone in that role at the company.
 
-Generate:
+For each stakeholder, create a targeted query with these parameters:
+1. Company name: Exact company name
+2. Title keywords: Include variations of the stakeholder's title
+3. Industry-specific keywords related to this role
+4. Function/department filters appropriate for this role
+5. Seniority levels: Appropriate for the role and company size
 
-1. Primary search query for technical decision-makers:
-   - Use the exact job titles from our customer segment research
-   - Include industry-specific keywords related to materials, production, or R&D
-   - Add function/department filters to narrow results
-   - Include appropriate seniority levels (Director and above for larger companies)
+Each query should be structured so it can be directly copied into Sales Navigator's
+search fields, with a brief explanation of why each parameter was chosen.
 
-2. Secondary search query for business approvers:
-   - Focus on roles with purchasing or budget authority
-   - Include procurement, operations, or business development keywords
-   - Add appropriate seniority filters
+FORMAT YOUR RESPONSE AS JSON: {{"queries": [{{"id": <stakeholder id>, "query": "<query with explanations>"}}]}}
+with exactly one entry per stakeholder ID in the user message.
+"""
 
-For each query, provide:
-- The exact Sales Navigator search syntax
-- Explanation of why each parameter was chosen
-- How to refine the search if it returns too many/few results
+LINKEDIN_BATCH_QUERY_USER_PROMPT = """
+COMPANY: {company_name}
+DETAILS: {company_details}
+CUSTOMER SEGMENT: {customer_segment}
 
-FORMAT YOUR RESPONSE AS STRUCTURED SEARCH QUERIES with explanations for each parameter.
+STAKEHOLDERS:
+{stakeholder_list}
 """
 
 # OUTREACH GENERATION PROMPTS
 
-OUTREACH_MESSAGE_PROMPT = f"""
-{BASE_TEDLAR_CONTEXT}
-
-TASK: Create a highly personalized outreach message to the following stakeholder 
-at a qualified company, emphasizing Tedlar's value proposition for their specific needs.
-
-STAKEHOLDER: {{stakeholder_name}}, {{stakeholder_title}}
-COMPANY: {{company_name}}
-COMPANY DETAILS: {{company_details}}
-CUSTOMER SEGMENT: {{customer_segment}}
-EVENT CONTEXT: {{event_name}}
-QUALIFICATION RATIONALE: {{qualification_rationale}}
-
-Create a personalized outreach message that:
+OUTREACH_MESSAGE_SYSTEM_PROMPT = """
+TASK: Write a personalized 150-200 word outreach email to the stakeholder in the user message,
+emphasizing Tedlar's value for their specific needs.
 
-1. References the specific industry event as a conversation starter
-   - Be specific about the event rather than generic
+The email must cover, in order:
+- event_ref: the specific event as a conversation starter
+- segment_pain: the exact pain points of their customer segment, in their role's terminology
+- quant_benefit: 2-3 quantified Tedlar benefits (technical roles: performance metrics such as
+  <3 Delta E shift; business roles: 30-40% lower lifetime cost despite premium pricing)
+- app_example: a Tedlar use case matching their business
+- cta: a low-friction call to action on a specific topic
 
-2. Demonstrates understanding of their specific industry challenges
-   - Reference the exact pain points from their customer segment
-   - Use industry-specific terminology familiar to their role
+FORMAT YOUR RESPONSE AS JSON with the keys subject, message_body, value_propositions
+(a list of the benefits used) and call_to_action.
+"""
 
-3. Highlights 2-3 Tedlar benefits with quantified performance data
-   - For technical roles: Focus on specific performance metrics (e.g., <3 Delta E color shift, temperature range)
-   - For business roles: Emphasize TCO (30-40% lower lifetime costs despite 15-20% premium pricing)
+OUTREACH_MESSAGE_USER_PROMPT = """
+STAKEHOLDER: {stakeholder_name}, {stakeholder_title}
+COMPANY: {company_name}
+COMPANY DETAILS: {company_details}
+CUSTOMER SEGMENT: {customer_segment}
+EVENT CONTEXT: {event_name}
+QUALIFICATION RATIONALE: {qualification_rationale}
+"""
 
-4. References a relevant application example
-   - Choose from Tedlar's specific use cases that match their business
-   - Be specific about how Tedlar solves their particular challenge
+class PromptKeyError(KeyError):
+    """
+    Raised when a prompt template is rendered without values for all its placeholders.
+    """
+    def __init__(self, missing: List[str]):
+        super().__init__(f"Missing keys in prompt template: {', '.join(missing)}")
+        self.missing = missing
 
-5. Includes a clear, low-friction call to action
-   - Suggest a specific topic for discussion
-   - Offer to share relevant case studies or technical information
+# Placeholders are bare {name} fields; any other braces (e.g. JSON examples) are literal text
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
 
-The message should be concise (150-200 words), conversion-focused, and demonstrate deep
-understanding of both their business and how Tedlar specifically addresses their needs.
+@lru_cache(maxsize=None)
+def compile_template(prompt_template: str) -> Tuple[str, ...]:
+    """
+    Split a prompt template into alternating literal text and placeholder names.
+    
+    Templates are module-level constants, so each one is split once and
+    rendering only walks its placeholders instead of rescanning the text.
+    """
+    return tuple(_PLACEHOLDER_RE.split(prompt_template))
 
-FORMAT YOUR RESPONSE WITH:
-- Email subject line (compelling, specific to their needs)
-- Message body (personalized, value-focused)
-- List of personalization elements used
-"""
+@lru_cache(maxsize=None)
+def template_fields(prompt_template: str) -> FrozenSet[str]:
+    """
+    Get the placeholder names in a prompt template.
+    """
+    return frozenset(compile_template(prompt_template)[1::2])
 
 # Helper function to customize prompts with specific details
 def customize_prompt(prompt_template: str, **kwargs) -> str:
@@ -356,17 +416,59 @@ def customize_prompt(prompt_template: str, **kwargs) -> str:
     Customize a prompt template with specific details.
     
     This function allows efficient reuse of prompt templates while
-    inserting context-specific information.
-    """
-    # Add any missing keys that might be in the template
-    if "'criteria'" in prompt_template or "{criteria}" in prompt_template:
-        kwargs["criteria"] = json.dumps(LEAD_SCORING, indent=2)
+    inserting context-specific information. Identical substitutions (e.g. the
+    same company details for several stakeholders) are served from a cache.
     
+    Raises:
+        PromptKeyError: If a placeholder in the template has no value
+    """
     try:
-        return prompt_template.format(**kwargs)
-    except KeyError as e:
-        print(f"Warning: Missing key in prompt template: {e}")
-        # Add the missing key with a placeholder value
-        key = str(e).strip("'")
-        kwargs[key] = f"<{key} not provided>"
-        return prompt_template.format(**kwargs)
\ No newline at end of file
+        return _customize_prompt_cached(prompt_template, tuple(sorted(kwargs.items())))
+    except TypeError:
+        # Unhashable values can't be cached; render them directly
+        return render_prompt(prompt_template, kwargs)
+
+# Sized for every user template across the companies in a typical run, since
+# stakeholder and Sales Navigator prompts for one company share their details
+@lru_cache(maxsize=512)
+def _customize_prompt_cached(prompt_template: str, items: Tuple[Tuple[str, Any], ...]) -> str:
+    return render_prompt(prompt_template, dict(items))
+
+def render_prompt(prompt_template: str, kwargs: Dict[str, Any]) -> str:
+    """
+    Fill a prompt template.
+    
+    Raises:
+        PromptKeyError: If a placeholder in the template has no value
+    """
+    fields = template_fields(prompt_template)
+    
+    missing = fields.difference(kwargs)
+    if missing:
+        raise PromptKeyError(sorted(missing))
+    
+    pieces = compile_template(prompt_template)
+    parts = list(pieces)
+    parts[1::2] = [str(kwargs[field_name]) for field_name in pieces[1::2]]
+    return "".join(parts)
+
+def build_prompt_messages(
+    system_prompt: str,
+    user_template: str,
+    base_context: str = BASE_TEDLAR_CONTEXT,
+    **kwargs
+) -> List[Dict[str, str]]:
+    """
+    Build chat messages from a static system prompt and a customized user prompt.
+    
+    The shared Tedlar context (or a narrower slice of it, such as
+    SALES_NAVIGATOR_CONTEXT) leads as its own system message, followed by the
+    task instructions. Every variable detail goes in the trailing user message,
+    so both system messages stay byte-identical across calls and provider
+    prompt caching can reuse them.
+    """
+    return [
+        {"role": "system", "content": base_context},
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": customize_prompt(user_template, **kwargs)}
+    ]
@@ -0,0 +1,124 @@
+"""
+LLM Response Cache for DuPont Tedlar Lead Generation System.
+
+This module stores LLM responses on disk keyed by a hash of the request, so
+re-running the pipeline on unchanged inputs does not pay for identical calls
+again. Entries live in a single SQLite database in WAL mode, so readers never
+block on a concurrent write.
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Any, List, Optional
+from config.config import LLM_CACHE_DB
+
+# Responses sampled above this temperature are meant to vary between calls
+CACHE_MAX_TEMPERATURE = 0.3
+
+_connection = None
+_lock = threading.Lock()
+
+def _get_connection() -> sqlite3.Connection:
+    """
+    Open the cache database on first use.
+    """
+    global _connection
+    if _connection is None:
+        LLM_CACHE_DB.parent.mkdir(exist_ok=True)
+        _connection = sqlite3.connect(LLM_CACHE_DB, check_same_thread=False)
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "hash TEXT PRIMARY KEY, content TEXT, model TEXT, tokens INTEGER, ts REAL)"
+        )
+        _connection.commit()
+    return _connection
+
+def is_cacheable(temperature: float, max_temperature: float = CACHE_MAX_TEMPERATURE) -> bool:
+    """
+    Check whether responses at a sampling temperature should be cached.
+
+    Args:
+        temperature: Sampling temperature
+        max_temperature: Highest temperature whose responses may be reused
+
+    Returns:
+        True if the temperature is low enough for responses to be reused
+    """
+    return temperature <= max_temperature
+
+def make_cache_key(
+    model: str,
+    temperature: float,
+    messages: List[Dict[str, str]],
+    response_format: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Compute a stable cache key for a chat completion request.
+
+    Args:
+        model: Model name
+        temperature: Sampling temperature
+        messages: Chat messages sent to the model
+        response_format: Optional response format requested from the model
+
+    Returns:
+        BLAKE2b hex digest of the canonical request
+    """
+    request = {"model": model, "temperature": temperature, "messages": messages}
+    # Only include the format when set, so requests without one keep their keys
+    if response_format is not None:
+        request["response_format"] = response_format
+    canonical = json.dumps(request, sort_keys=True)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=32).hexdigest()
+
+def get_cached_response(key: str, ttl_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached response.
+
+    Args:
+        key: Cache key from make_cache_key
+        ttl_seconds: Optional maximum age of the entry
+
+    Returns:
+        Cached response dictionary, or None on a miss or expired entry
+    """
+    try:
+        with _lock:
+            row = _get_connection().execute(
+                "SELECT content, model, tokens, ts FROM responses WHERE hash = ?", (key,)
+            ).fetchone()
+    except Exception as e:
+        print(f"Error reading LLM cache entry {key}: {str(e)}")
+        return None
+
+    if row is None:
+        return None
+
+    content, model, tokens, ts = row
+    if ttl_seconds is not None and time.time() - ts > ttl_seconds:
+        return None
+
+    return {"content": content, "model": model, "tokens": tokens}
+
+def save_cached_response(key: str, response: Dict[str, Any]):
+    """
+    Store a response in the cache.
+
+    Args:
+        key: Cache key from make_cache_key
+        response: Response dictionary with content, model and optional tokens
+    """
+    try:
+        with _lock:
+            connection = _get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (hash, content, model, tokens, ts) VALUES (?, ?, ?, ?, ?)",
+                (key, response["content"], response.get("model", ""), response.get("tokens", 0), time.time())
+            )
+            connection.commit()
+    except Exception as e:
+        print(f"Error writing LLM cache entry {key}: {str(e)}")
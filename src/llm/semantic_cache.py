@@ -0,0 +1,159 @@
+"""
+Semantic LLM Response Cache for DuPont Tedlar Lead Generation System.
+
+This module complements the exact-match response cache by reusing responses
+for near-duplicate inputs - e.g. companies in the same customer segment with
+very similar descriptions. Inputs are embedded once and compared by cosine
+similarity against previously cached entries.
+
+Entries are persisted as a raw float32 file of normalized embeddings plus a
+JSON Lines metadata file, both appended to on every put, which is plenty fast
+for the few thousand entries this pipeline produces.
+"""
+
+import os
+import json
+import logging
+import numpy as np
+from typing import Optional
+from config.config import LLM_CACHE_DIR
+from src.llm.llm_client import get_embedding
+
+logger = logging.getLogger(__name__)
+
+# Prefer orjson for the metadata file (falls back to stdlib json if unavailable)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+SEMANTIC_CACHE_DIR = LLM_CACHE_DIR / "semantic"
+VECTORS_FILE = SEMANTIC_CACHE_DIR / "vectors.f32"
+META_FILE = SEMANTIC_CACHE_DIR / "meta.jsonl"
+
+# Minimum cosine similarity for a cached response to be reused
+SIMILARITY_THRESHOLD = 0.92
+
+_vectors = None
+_entries = None
+_embedding_memo = {}
+
+def _load():
+    global _vectors, _entries
+    if _entries is not None:
+        return
+    
+    _entries = []
+    _vectors = np.zeros((0, 0), dtype=np.float32)
+    if VECTORS_FILE.exists() and META_FILE.exists():
+        try:
+            with open(META_FILE, "rb") as f:
+                entries = [_json_loads(line) for line in f if line.strip()]
+            raw = np.fromfile(VECTORS_FILE, dtype=np.float32)
+            if entries:
+                dim = entries[0]["dim"]
+                # An interrupted put can leave one file ahead of the other; keep
+                # only the rows present in both and trim the files to match
+                rows = min(len(entries), raw.size // dim)
+                _vectors = raw[:rows * dim].reshape(rows, dim)
+                _entries = entries[:rows]
+                if raw.size != rows * dim or len(entries) != rows:
+                    _rewrite()
+        except Exception as e:
+            logger.error("Error loading semantic cache: %s", e)
+            _entries = []
+            _vectors = np.zeros((0, 0), dtype=np.float32)
+
+def _rewrite():
+    """
+    Replace both cache files with the in-memory entries.
+    """
+    for path, data in (
+        (VECTORS_FILE, _vectors.tobytes()),
+        (META_FILE, b"".join(_json_dumps(entry) + b"\n" for entry in _entries))
+    ):
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+def _embed(text: str, module: str) -> np.ndarray:
+    if text not in _embedding_memo:
+        vector = np.asarray(get_embedding(text, module=module, operation="semantic_cache_embedding"), dtype=np.float32)
+        _embedding_memo[text] = vector / (np.linalg.norm(vector) or 1.0)
+    return _embedding_memo[text]
+
+def get(
+    text: str,
+    namespace: str = "default",
+    threshold: float = SIMILARITY_THRESHOLD,
+    module: str = "general"
+) -> Optional[str]:
+    """
+    Look up a cached response for text similar to the given input.
+    
+    Args:
+        text: Input text identifying the request (without shared boilerplate)
+        namespace: Cache partition, e.g. model or operation name
+        threshold: Minimum cosine similarity for a hit
+        module: Pipeline module the embedding cost is tracked under
+        
+    Returns:
+        Cached response content, or None if no sufficiently similar entry exists
+    """
+    _load()
+    if not _entries:
+        return None
+    
+    query = _embed(text, module)
+    if query.size == 0 or _vectors.shape[1] != query.shape[0]:
+        return None
+    
+    similarities = _vectors @ query
+    candidates = [i for i, entry in enumerate(_entries) if entry["namespace"] == namespace]
+    if not candidates:
+        return None
+    
+    best = max(candidates, key=lambda i: similarities[i])
+    if similarities[best] < threshold:
+        return None
+    
+    logger.debug("Semantic cache hit (similarity %.3f)", similarities[best])
+    return _entries[best]["response"]
+
+def put(text: str, response: str, namespace: str = "default", module: str = "general"):
+    """
+    Add a response to the semantic cache and persist it.
+    
+    Args:
+        text: Input text identifying the request (without shared boilerplate)
+        response: Response content to cache
+        namespace: Cache partition, e.g. model or operation name
+        module: Pipeline module the embedding cost is tracked under
+    """
+    global _vectors
+    _load()
+    
+    vector = _embed(text, module)
+    if vector.size == 0 or (_vectors.size and _vectors.shape[1] != vector.shape[0]):
+        return
+    
+    if _vectors.size == 0:
+        _vectors = vector.reshape(1, -1)
+    else:
+        _vectors = np.vstack([_vectors, vector])
+    _entries.append({"namespace": namespace, "text": text, "response": response, "dim": int(vector.shape[0])})
+    
+    # Append the vector before its metadata line, so the metadata never refers
+    # to a missing row; _load trims whatever an interrupted put leaves behind
+    try:
+        SEMANTIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(VECTORS_FILE, "ab") as f:
+            f.write(vector.tobytes())
+        with open(META_FILE, "ab") as f:
+            f.write(_json_dumps(_entries[-1]) + b"\n")
+    except Exception as e:
+        logger.error("Error saving semantic cache: %s", e)
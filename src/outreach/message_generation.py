@@ -11,19 +11,147 @@ Tedlar benefits relevant to each stakeholder's role and company needs.
 """
 
 import os
+import re
 import json
-import time
 import uuid
-from pathlib import Path
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple, BinaryIO
 
-from config.config import TEDLAR_CONTEXT, LLM_CONFIG, DATA_DIR
-from src.llm.llm_client import call_openai_api
-from src.llm.prompt_templates import BASE_TEDLAR_CONTEXT, OUTREACH_MESSAGE_PROMPT
+from config.config import TEDLAR_CONTEXT, LLM_CONFIG, DATA_DIR, OUTREACH_JSONL
+from src.llm.llm_client import call_openai_api, call_openai_batch, call_openai_concurrent
+from src.llm.prompt_schemas import OUTREACH_MESSAGE_SCHEMA, response_format_for
+from src.llm.prompt_templates import BASE_TEDLAR_CONTEXT, OUTREACH_MESSAGE_SYSTEM_PROMPT, OUTREACH_MESSAGE_USER_PROMPT, TEDLAR_CORE_CONTEXT, build_prompt_messages
 from src.utils.cost_tracker import is_budget_available, log_usage_report
 from src.utils.data_models import OutreachMessage
 
+# Prefer orjson for stakeholder/company files and saved messages (falls back to stdlib json if unavailable)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# Data directories as plain strings, so per-file lookups skip Path construction
+_STAKEHOLDERS_DIR = str(DATA_DIR / "stakeholders")
+_COMPANIES_DIR = str(DATA_DIR / "companies")
+
+# Outreach order: high-priority stakeholders first, then medium, then the rest
+PRIORITY_RANK = {"high": 0, "medium": 1}
+
+# Title keywords that mark a stakeholder as a technical contact
+TECHNICAL_ROLE_KEYWORDS = ("technical", "engineer", "director", "r&d")
+
+def classify_stakeholder_role(title: str) -> str:
+    """
+    Classify a stakeholder as a technical or business contact from their title.
+    
+    Args:
+        title: Job title
+        
+    Returns:
+        "technical" or "business"
+    """
+    title_lower = title.lower()
+    return "technical" if any(keyword in title_lower for keyword in TECHNICAL_ROLE_KEYWORDS) else "business"
+
+# Text responses are parsed with these patterns, compiled once at import
+_SUBJECT_RE = re.compile(r"Subject(?: Line)?:([^\n]+)\n")
+_SECTION_RE = re.compile(r"(Personalization elements|Value propositions|Call to action):")
+_BULLET_RE = re.compile(r'\n[-*•]?\s*(.*?)(?=\n[-*•]|\n\n|$)')
+
+def split_outreach_sections(content: str) -> Dict[str, str]:
+    """
+    Find the labelled sections of a text outreach response in one pass.
+    
+    Args:
+        content: Raw response content
+        
+    Returns:
+        Dictionary mapping each section label to the text after its first
+        occurrence, up to the next blank line
+    """
+    sections = {}
+    for match in _SECTION_RE.finditer(content):
+        label = match.group(1)
+        if label not in sections:
+            sections[label] = content[match.end():].split("\n\n", 1)[0]
+    return sections
+
+def extract_bullets(section: str) -> List[str]:
+    """
+    Extract bullet points or numbered items from a response section.
+    """
+    return [item.strip() for item in _BULLET_RE.findall(section) if item.strip()]
+
+# A 150-200 word message plus its subject line, JSON fields and escaping, with
+# headroom so the JSON object is not cut off before it closes
+OUTREACH_MAX_TOKENS = 800
+
+# Body used when the response was cut off before a complete JSON object
+TRUNCATED_MESSAGE_BODY = "Message generation was cut off before completion; regenerate this draft before sending."
+
+# Model tiers: premium model (GPT-4 Turbo) for high-priority stakeholders,
+# cost-effective model (GPT-3.5 Turbo) for everyone else
+_TIER_CONFIG = {
+    "high_quality": {
+        "model_config": {
+            "model": "gpt-4-turbo",
+            "temperature": 0.7,  # Higher temperature for creative messaging
+            "max_tokens": OUTREACH_MAX_TOKENS,
+        },
+        "operation": "premium_outreach_generation",
+        "estimated_cost": 0.05
+    },
+    "standard": {
+        "model_config": {
+            "model": "gpt-3.5-turbo",
+            "temperature": 0.6,
+            "max_tokens": OUTREACH_MAX_TOKENS,
+        },
+        "operation": "standard_outreach_generation",
+        "estimated_cost": 0.02
+    }
+}
+
+def outreach_tier(stakeholder: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the model tier settings for a stakeholder.
+    
+    Args:
+        stakeholder: Stakeholder information
+        
+    Returns:
+        Tier settings with model_config, operation and estimated_cost
+    """
+    return _TIER_CONFIG["high_quality" if stakeholder.get("priority") == "high" else "standard"]
+
+# Formatted company details blocks by company ID
+_company_details_cache: Dict[str, str] = {}
+
+# Drafts are reviewed before sending, so re-runs on unchanged inputs may reuse a
+# cached draft even though it was sampled at a creative temperature
+OUTREACH_CACHE_MAX_TEMPERATURE = 1.0
+
+def parse_outreach_json(content: str) -> Dict[str, Any]:
+    """
+    Parse a structured outreach response.
+    
+    Args:
+        content: Raw response content
+        
+    Returns:
+        Parsed fields, or an empty dictionary if the response is not a JSON object
+    """
+    try:
+        parsed = _json_loads(content)
+    except (ValueError, TypeError):
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
 def load_prioritized_stakeholders() -> List[Dict[str, Any]]:
     """
     Load stakeholders identified in the previous step.
@@ -39,42 +167,81 @@ def load_prioritized_stakeholders() -> List[Dict[str, Any]]:
     stakeholders = []
     
     # Load stakeholders
-    stakeholders_dir = DATA_DIR / "stakeholders"
-    if stakeholders_dir.exists():
-        for stakeholder_file in stakeholders_dir.glob("*.json"):
+    if os.path.isdir(_STAKEHOLDERS_DIR):
+        # scandir yields names without a stat per entry, unlike Path.glob
+        with os.scandir(_STAKEHOLDERS_DIR) as entries:
+            stakeholder_files = [entry.path for entry in entries if entry.name.endswith(".json")]
+        
+        for stakeholder_file in stakeholder_files:
             try:
-                with open(stakeholder_file, "r") as f:
-                    stakeholder_data = json.load(f)
-                    
-                    # Skip stakeholders from companies with generated names
-                    if stakeholder_data.get("company_name", "").startswith("Company-") or \
-                       stakeholder_data.get("company_name", "") == "Unknown Company":
-                        print(f"Skipping stakeholder from {stakeholder_data.get('company_name')} (invalid company name)")
-                        continue
-                    
-                    # Skip stakeholders with Unknown title/position
-                    if stakeholder_data.get("title", "") == "Unknown":
-                        print(f"Skipping stakeholder {stakeholder_data.get('name')} (unknown position)")
-                        continue
-                    
-                    stakeholders.append(stakeholder_data)
+                with open(stakeholder_file, "rb") as f:
+                    stakeholder_data = _json_loads(f.read())
+                
+                # Skip stakeholders from companies with generated names
+                if stakeholder_data.get("company_name", "").startswith("Company-") or \
+                   stakeholder_data.get("company_name", "") == "Unknown Company":
+                    print(f"Skipping stakeholder from {stakeholder_data.get('company_name')} (invalid company name)")
+                    continue
+                
+                # Skip stakeholders with Unknown title/position
+                if stakeholder_data.get("title", "") == "Unknown":
+                    print(f"Skipping stakeholder {stakeholder_data.get('name')} (unknown position)")
+                    continue
+                
+                # Classify once here rather than on every message built for them
+                stakeholder_data["stakeholder_role"] = classify_stakeholder_role(stakeholder_data.get("title", ""))
+                stakeholders.append(stakeholder_data)
             except Exception as e:
                 print(f"Error loading stakeholder data from {stakeholder_file}: {str(e)}")
     
     # Sort by priority and decision_maker_score
-    stakeholders = sorted(stakeholders, key=lambda s: (
-        0 if s.get("priority") == "high" else (1 if s.get("priority") == "medium" else 2),
+    stakeholders.sort(key=lambda s: (
+        PRIORITY_RANK.get(s.get("priority"), 2),
         -float(s.get("decision_maker_score", 0))
     ))
     
+    priority_counts = Counter(s.get("priority") for s in stakeholders)
+    
     print(f"Loaded {len(stakeholders)} prioritized stakeholders:")
-    print(f"- High priority: {sum(1 for s in stakeholders if s.get('priority') == 'high')}")
-    print(f"- Medium priority: {sum(1 for s in stakeholders if s.get('priority') == 'medium')}")
-    print(f"- Low priority: {sum(1 for s in stakeholders if s.get('priority') == 'low')}")
+    print(f"- High priority: {priority_counts['high']}")
+    print(f"- Medium priority: {priority_counts['medium']}")
+    print(f"- Low priority: {priority_counts['low']}")
     
     return stakeholders
 
-def get_company_details(stakeholder: Dict[str, Any]) -> Dict[str, Any]:
+def load_companies(company_ids: Set[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Load company data for a set of company IDs in one pass over the companies directory.
+    
+    Args:
+        company_ids: IDs of the companies to load
+        
+    Returns:
+        Dictionary mapping company ID to company data
+    """
+    companies_by_id = {}
+    if not os.path.isdir(_COMPANIES_DIR):
+        return companies_by_id
+    
+    with os.scandir(_COMPANIES_DIR) as entries:
+        company_files = [
+            (entry.name[:-5], entry.path) for entry in entries
+            if entry.name.endswith(".json") and entry.name[:-5] in company_ids
+        ]
+    
+    for company_id, company_file in company_files:
+        try:
+            with open(company_file, "rb") as f:
+                companies_by_id[company_id] = _json_loads(f.read())
+        except Exception as e:
+            print(f"Error loading company data from {company_file}: {str(e)}")
+    
+    return companies_by_id
+
+def get_company_details(
+    stakeholder: Dict[str, Any],
+    companies_by_id: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Any]:
     """
     Get detailed company information for a stakeholder.
     
@@ -83,6 +250,8 @@ def get_company_details(stakeholder: Dict[str, Any]) -> Dict[str, Any]:
     
     Args:
         stakeholder: Stakeholder information
+        companies_by_id: Optional companies preloaded with load_companies;
+            without it the company file is read from disk
         
     Returns:
         Company details dictionary
@@ -92,13 +261,17 @@ def get_company_details(stakeholder: Dict[str, Any]) -> Dict[str, Any]:
         return {}
     
     # Attempt to load company data
-    company_file = DATA_DIR / "companies" / f"{company_id}.json"
-    if company_file.exists():
-        try:
-            with open(company_file, "r") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading company data for {stakeholder.get('company_name', 'Unknown')}: {str(e)}")
+    if companies_by_id is not None:
+        if company_id in companies_by_id:
+            return companies_by_id[company_id]
+    else:
+        company_file = os.path.join(_COMPANIES_DIR, f"{company_id}.json")
+        if os.path.exists(company_file):
+            try:
+                with open(company_file, "rb") as f:
+                    return _json_loads(f.read())
+            except Exception as e:
+                print(f"Error loading company data for {stakeholder.get('company_name', 'Unknown')}: {str(e)}")
     
     # If company file not found or error loading, create minimal company data from stakeholder
     return {
@@ -138,38 +311,44 @@ def get_event_context(company: Dict[str, Any]) -> str:
     
     return source_gathering
 
-def generate_outreach_message(stakeholder: Dict[str, Any], company: Dict[str, Any]) -> Dict[str, Any]:
+def budget_fallback_message(stakeholder: Dict[str, Any], company: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Generate a personalized outreach message for a stakeholder.
-    
-    This function implements a tiered approach based on stakeholder priority:
-    - Premium model (GPT-4 Turbo) for high-priority stakeholders
-    - Standard model (GPT-3.5 Turbo) for other stakeholders
+    Build the placeholder message used when the outreach budget is exhausted.
     
     Args:
         stakeholder: Stakeholder information
         company: Company information
         
     Returns:
-        Outreach message with subject and body
+        Outreach message with a generic subject and body
     """
-    print(f"Generating outreach message for: {stakeholder['name']} ({stakeholder['title']}) at {stakeholder['company_name']}...")
+    return {
+        "stakeholder_id": stakeholder["id"],
+        "company_id": company["id"],
+        "subject": f"Enhancing your signage durability with DuPont Tedlar",
+        "message_body": "Insufficient budget for personalized message generation.",
+        "personalization_factors": [],
+        "value_propositions": [],
+        "call_to_action": "Request more information"
+    }
+
+def format_company_details(company: Dict[str, Any]) -> str:
+    """
+    Format the company details block of the outreach prompt.
     
-    # Budget check - critical for not exceeding our $200 allocation
-    estimated_cost = 0.05 if stakeholder.get("priority") == "high" else 0.02
-    if not is_budget_available("outreach_generation", estimated_cost):
-        print(f"WARNING: Insufficient budget for outreach message generation.")
-        return {
-            "stakeholder_id": stakeholder["id"],
-            "company_id": company["id"],
-            "subject": f"Enhancing your signage durability with DuPont Tedlar",
-            "message_body": "Insufficient budget for personalized message generation.",
-            "personalization_factors": [],
-            "value_propositions": [],
-            "call_to_action": "Request more information"
-        }
+    Stakeholders at the same company share one company record, so the block
+    is built once per company ID and reused.
+    
+    Args:
+        company: Company information
+        
+    Returns:
+        Company details text for the prompt
+    """
+    company_id = company.get("id")
+    if company_id and company_id in _company_details_cache:
+        return _company_details_cache[company_id]
     
-    # Format company details for the prompt
     company_details = f"""
     Company Name: {company['name']}
     Industry: {company.get('industry', 'Graphics & Signage')}
@@ -182,22 +361,45 @@ def generate_outreach_message(stakeholder: Dict[str, Any], company: Dict[str, An
     - Use Cases: {', '.join(company.get('detailed_qualification', {}).get('use_cases', []))}
     """
     
+    if company_id:
+        _company_details_cache[company_id] = company_details
+    return company_details
+
+def build_outreach_messages(
+    stakeholder: Dict[str, Any],
+    company: Dict[str, Any],
+    event_name: str
+) -> Tuple[List[Dict[str, str]], Dict[str, Any], str]:
+    """
+    Build the outreach messages and model settings for a stakeholder.
+    
+    High-priority stakeholders get the premium model (GPT-4 Turbo), everyone
+    else the standard model (GPT-3.5 Turbo).
+    
+    Args:
+        stakeholder: Stakeholder information
+        company: Company information
+        event_name: Event used as the conversation starter
+        
+    Returns:
+        Tuple of (chat messages, model configuration, operation name)
+    """
+    # Format company details for the prompt
+    company_details = format_company_details(company)
+    
     # Get stakeholder-specific details
     stakeholder_name = stakeholder["name"]
     stakeholder_title = stakeholder["title"]
-    stakeholder_role = "technical" if any(role in stakeholder_title.lower() for role in ["technical", "engineer", "director", "r&d"]) else "business"
-    
-    # Get event context
-    event_name = get_event_context(company)
     
     # Get qualification rationale
     qualification_rationale = company.get("qualification_rationale", "")
     
     # Direct prompt construction or use template if available
-    if OUTREACH_MESSAGE_PROMPT:
-        from src.llm.prompt_templates import customize_prompt
-        prompt = customize_prompt(
-            OUTREACH_MESSAGE_PROMPT,
+    if OUTREACH_MESSAGE_SYSTEM_PROMPT:
+        messages = build_prompt_messages(
+            OUTREACH_MESSAGE_SYSTEM_PROMPT,
+            OUTREACH_MESSAGE_USER_PROMPT,
+            base_context=TEDLAR_CORE_CONTEXT,
             stakeholder_name=stakeholder_name,
             stakeholder_title=stakeholder_title,
             company_name=company['name'],
@@ -245,63 +447,66 @@ def generate_outreach_message(stakeholder: Dict[str, Any], company: Dict[str, An
         The message should be concise (150-200 words), conversion-focused, and demonstrate deep
         understanding of both their business and how Tedlar specifically addresses their needs.
 
-        FORMAT YOUR RESPONSE WITH:
-        - Email subject line (compelling, specific to their needs)
-        - Message body (personalized, value-focused)
-        - List of personalization elements used
+        FORMAT YOUR RESPONSE AS JSON with the keys subject, message_body, value_propositions
+        (a list of the benefits used) and call_to_action.
         """
+        messages = [{"role": "system", "content": prompt}]
     
     # Use appropriate model based on stakeholder priority
-    model_tier = "high_quality" if stakeholder.get("priority") == "high" else "standard"
+    tier = outreach_tier(stakeholder)
     
-    if model_tier == "high_quality":
-        # Use premium model for high-priority stakeholders
-        model_config = {
-            "model": "gpt-4-turbo",
-            "temperature": 0.7,  # Higher temperature for creative messaging
-            "max_tokens": 1000,
-        }
-        operation = "premium_outreach_generation"
-    else:
-        # Use cost-effective model for standard stakeholders
-        model_config = {
-            "model": "gpt-3.5-turbo",
-            "temperature": 0.6,
-            "max_tokens": 800,
-        }
-        operation = "standard_outreach_generation"
-    
-    response = call_openai_api(
-        messages=[{"role": "system", "content": prompt}],
-        model=model_config["model"],
-        temperature=model_config["temperature"],
-        max_tokens=model_config["max_tokens"],
-        module="outreach_generation",
-        operation=operation
-    )
-    
-    # Parse the response
-    content = response["content"]
+    return messages, tier["model_config"], tier["operation"]
+
+def parse_outreach_message(
+    stakeholder: Dict[str, Any],
+    company: Dict[str, Any],
+    content: str,
+    event_name: str,
+    finish_reason: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Turn an outreach response into an outreach message record.
     
-    # Extract subject and message body
-    subject = ""
-    message_body = ""
+    Args:
+        stakeholder: Stakeholder information
+        company: Company information
+        content: Raw response content
+        event_name: Event used as the conversation starter
+        finish_reason: Finish reason reported for the response, if any
+        
+    Returns:
+        Outreach message with subject, body and supporting details
+    """
+    stakeholder_title = stakeholder["title"]
+    stakeholder_role = stakeholder.get("stakeholder_role") or classify_stakeholder_role(stakeholder_title)
+    
+    # Structured responses carry each field directly; text parsing below only
+    # fills in whatever they are missing
+    structured = parse_outreach_json(content)
+    subject = structured.get("subject", "")
+    message_body = structured.get("message_body", "")
+    
+    # Outreach calls always request JSON, so a response that does not parse was
+    # cut off; scraping it would pick the greeting out of the raw JSON payload
+    if finish_reason == "length" or (not structured and content.strip() and not content.startswith("Error:")):
+        print(f"WARNING: Outreach message for {stakeholder['name']} was truncated; using a placeholder body.")
+        structured, content = {}, ""
+        subject = ""
+        message_body = TRUNCATED_MESSAGE_BODY
     personalization_factors = []
-    value_propositions = []
-    call_to_action = ""
+    value_propositions = structured.get("value_propositions", [])
+    call_to_action = structured.get("call_to_action", "")
+    
+    sections = split_outreach_sections(content)
     
     # Extract subject line (usually the first line after "Subject:" or similar)
-    subject_markers = ["Subject:", "Subject Line:", "Email Subject:"]
-    for marker in subject_markers:
-        if marker in content:
-            subject_start = content.index(marker) + len(marker)
-            subject_end = content.find("\n", subject_start)
-            if subject_end > subject_start:
-                subject = content[subject_start:subject_end].strip()
-                break
+    if not subject:
+        subject_match = _SUBJECT_RE.search(content)
+        if subject_match:
+            subject = subject_match.group(1).strip()
     
     # If no explicit subject marker, use the first line if it's short enough
-    if not subject and "\n" in content:
+    if not subject and not structured and "\n" in content:
         first_line = content.split("\n")[0].strip()
         if len(first_line) < 100 and not first_line.startswith("Dear") and not first_line.startswith("Hello"):
             subject = first_line
@@ -316,6 +521,8 @@ def generate_outreach_message(stakeholder: Dict[str, Any], company: Dict[str, An
     # Extract message body
     body_indicators = ["Dear", "Hello", "Hi ", "Greetings", "Good"]
     for indicator in body_indicators:
+        if message_body:
+            break
         if indicator in content:
             message_start = content.find(indicator)
             message_body = content[message_start:].strip()
@@ -326,24 +533,17 @@ def generate_outreach_message(stakeholder: Dict[str, Any], company: Dict[str, An
         message_start = content.find(subject) + len(subject)
         message_body = content[message_start:].strip()
         # Remove any section starts that might be part of the API response
-        for section in ["Personalization elements:", "Value propositions:", "Call to action:"]:
-            if section in message_body:
-                message_body = message_body[:message_body.find(section)].strip()
+        section_match = _SECTION_RE.search(message_body)
+        if section_match:
+            message_body = message_body[:section_match.start()].strip()
     
     # If still no message body, use the entire content (fallback)
     if not message_body:
         message_body = content.strip()
     
     # Extract personalization elements if listed
-    if "Personalization elements:" in content:
-        personalization_section = content.split("Personalization elements:")[1]
-        if "\n\n" in personalization_section:
-            personalization_section = personalization_section.split("\n\n")[0]
-        
-        # Extract bullet points or numbered items
-        import re
-        personalization_factors = re.findall(r'\n[-*•]?\s*(.*?)(?=\n[-*•]|\n\n|$)', personalization_section)
-        personalization_factors = [p.strip() for p in personalization_factors if p.strip()]
+    if "Personalization elements" in sections:
+        personalization_factors = extract_bullets(sections["Personalization elements"])
     
     # If no personalization elements extracted, create defaults
     if not personalization_factors:
@@ -354,15 +554,8 @@ def generate_outreach_message(stakeholder: Dict[str, Any], company: Dict[str, An
         ]
     
     # Extract value propositions if listed
-    if "Value propositions:" in content:
-        value_section = content.split("Value propositions:")[1]
-        if "\n\n" in value_section:
-            value_section = value_section.split("\n\n")[0]
-        
-        # Extract bullet points or numbered items
-        import re
-        value_propositions = re.findall(r'\n[-*•]?\s*(.*?)(?=\n[-*•]|\n\n|$)', value_section)
-        value_propositions = [v.strip() for v in value_propositions if v.strip()]
+    if not value_propositions and "Value propositions" in sections:
+        value_propositions = extract_bullets(sections["Value propositions"])
     
     # If no value propositions extracted, create defaults
     if not value_propositions:
@@ -380,11 +573,8 @@ def generate_outreach_message(stakeholder: Dict[str, Any], company: Dict[str, An
             ]
     
     # Extract call to action
-    if "Call to action:" in content:
-        cta_section = content.split("Call to action:")[1]
-        if "\n\n" in cta_section:
-            cta_section = cta_section.split("\n\n")[0]
-        call_to_action = cta_section.strip()
+    if not call_to_action and "Call to action" in sections:
+        call_to_action = sections["Call to action"].strip()
     
     # If no call to action extracted, create a default one
     if not call_to_action:
@@ -412,28 +602,193 @@ def generate_outreach_message(stakeholder: Dict[str, Any], company: Dict[str, An
     
     return outreach_message
 
-def save_outreach_message(message: Dict[str, Any]):
+def generate_outreach_message(stakeholder: Dict[str, Any], company: Dict[str, Any], use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Generate a personalized outreach message for a stakeholder.
+    
+    This function implements a tiered approach based on stakeholder priority:
+    - Premium model (GPT-4 Turbo) for high-priority stakeholders
+    - Standard model (GPT-3.5 Turbo) for other stakeholders
+    
+    Args:
+        stakeholder: Stakeholder information
+        company: Company information
+        use_cache: Whether to reuse the cached draft for an identical prompt
+        
+    Returns:
+        Outreach message with subject and body
+    """
+    print(f"Generating outreach message for: {stakeholder['name']} ({stakeholder['title']}) at {stakeholder['company_name']}...")
+    
+    # Budget check - critical for not exceeding our $200 allocation
+    if not is_budget_available("outreach_generation", outreach_tier(stakeholder)["estimated_cost"]):
+        print(f"WARNING: Insufficient budget for outreach message generation.")
+        return budget_fallback_message(stakeholder, company)
+    
+    # Get event context
+    event_name = get_event_context(company)
+    
+    messages, model_config, operation = build_outreach_messages(stakeholder, company, event_name)
+    
+    response = call_openai_api(
+        messages=messages,
+        model=model_config["model"],
+        temperature=model_config["temperature"],
+        max_tokens=model_config["max_tokens"],
+        module="outreach_generation",
+        operation=operation,
+        response_format=response_format_for(model_config["model"], "outreach_message", OUTREACH_MESSAGE_SCHEMA),
+        use_cache=use_cache,
+        stream=True,
+        cache_max_temperature=OUTREACH_CACHE_MAX_TEMPERATURE
+    )
+    
+    return parse_outreach_message(stakeholder, company, response["content"], event_name, response.get("finish_reason"))
+
+def build_outreach_requests(
+    targets: List[Tuple[Dict[str, Any], Dict[str, Any]]]
+) -> Tuple[List[Dict[str, Any]], List[Optional[Dict[str, Any]]], Dict[str, str]]:
+    """
+    Build outreach requests for many stakeholders.
+    
+    Stakeholders without remaining budget get the placeholder message instead
+    of a request. No cost is logged until the requests run, so each queued
+    request reserves its estimated cost and later budget checks include it.
+    
+    Args:
+        targets: (stakeholder, company) pairs to write messages for
+        
+    Returns:
+        Tuple of (requests keyed by the target's index as custom_id, outreach
+        messages with placeholders already filled in, event name per custom_id)
+    """
+    outreach_messages = [None] * len(targets)
+    outreach_requests = []
+    event_names = {}
+    reserved = 0.0
+    for idx, (stakeholder, company) in enumerate(targets):
+        print(f"Generating outreach message for: {stakeholder['name']} ({stakeholder['title']}) at {stakeholder['company_name']}...")
+        
+        estimated_cost = outreach_tier(stakeholder)["estimated_cost"]
+        if not is_budget_available("outreach_generation", reserved + estimated_cost):
+            print(f"WARNING: Insufficient budget for outreach message generation.")
+            outreach_messages[idx] = budget_fallback_message(stakeholder, company)
+            continue
+        reserved += estimated_cost
+        
+        custom_id = str(idx)
+        event_names[custom_id] = get_event_context(company)
+        messages, model_config, operation = build_outreach_messages(stakeholder, company, event_names[custom_id])
+        outreach_requests.append({
+            "custom_id": custom_id,
+            "messages": messages,
+            "model": model_config["model"],
+            "temperature": model_config["temperature"],
+            "max_tokens": model_config["max_tokens"],
+            "operation": operation,
+            "response_format": response_format_for(model_config["model"], "outreach_message", OUTREACH_MESSAGE_SCHEMA),
+            "stream": True
+        })
+    
+    return outreach_requests, outreach_messages, event_names
+
+def apply_outreach_responses(
+    targets: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    outreach_requests: List[Dict[str, Any]],
+    outreach_messages: List[Optional[Dict[str, Any]]],
+    event_names: Dict[str, str],
+    responses: Dict[str, Dict[str, Any]]
+) -> List[Dict[str, Any]]:
     """
-    Save outreach message to JSON file.
+    Parse responses to outreach requests into their slots in outreach_messages.
+    
+    Args:
+        targets: (stakeholder, company) pairs the requests were built for
+        outreach_requests: Requests from build_outreach_requests
+        outreach_messages: Messages from build_outreach_requests
+        event_names: Event name per custom_id from build_outreach_requests
+        responses: Dictionary mapping custom_id to a {"content", "usage", "finish_reason"} response
+        
+    Returns:
+        Outreach messages in the same order as targets
+    """
+    for request in outreach_requests:
+        custom_id = request["custom_id"]
+        stakeholder, company = targets[int(custom_id)]
+        response = responses.get(custom_id, {"content": ""})
+        outreach_messages[int(custom_id)] = parse_outreach_message(
+            stakeholder, company, response["content"], event_names[custom_id], response.get("finish_reason")
+        )
+    
+    return outreach_messages
+
+def generate_outreach_messages_concurrent(
+    targets: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    max_concurrent: int = 8,
+    use_cache: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Generate outreach messages for many stakeholders with concurrent API calls.
+    
+    Requests run in parallel with bounded concurrency and rate limiting, so
+    wall-clock time scales with rate-limit headroom rather than stakeholder count.
+    
+    Args:
+        targets: (stakeholder, company) pairs to write messages for
+        max_concurrent: Maximum number of in-flight requests
+        use_cache: Whether to reuse cached drafts for identical prompts
+        
+    Returns:
+        Outreach messages in the same order as targets
+    """
+    outreach_requests, outreach_messages, event_names = build_outreach_requests(targets)
+    responses = call_openai_concurrent(
+        outreach_requests,
+        module="outreach_generation",
+        max_concurrent=max_concurrent,
+        use_cache=use_cache,
+        cache_max_temperature=OUTREACH_CACHE_MAX_TEMPERATURE
+    ) if outreach_requests else {}
+    
+    return apply_outreach_responses(targets, outreach_requests, outreach_messages, event_names, responses)
+
+def generate_outreach_messages_batch(targets: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Generate outreach messages for many stakeholders through the OpenAI Batch API.
+    
+    Outreach drafts are reviewed before sending, so they can wait for a batch
+    job, which halves token cost and draws on a separate rate-limit pool.
+    
+    Args:
+        targets: (stakeholder, company) pairs to write messages for
+        
+    Returns:
+        Outreach messages in the same order as targets
+    """
+    print(f"Submitting batch outreach generation for {len(targets)} stakeholders...")
+    
+    outreach_requests, outreach_messages, event_names = build_outreach_requests(targets)
+    for request in outreach_requests:
+        request["operation"] = f"batch_{request['operation']}"
+    
+    responses = call_openai_batch(outreach_requests, module="outreach_generation") if outreach_requests else {}
+    
+    return apply_outreach_responses(targets, outreach_requests, outreach_messages, event_names, responses)
+
+def save_outreach_message(message: Dict[str, Any], jsonl_file: BinaryIO) -> bool:
+    """
+    Append an outreach message to the outreach JSONL file.
     
     This function stores the generated outreach message for later display
     in the dashboard and for potential integration with email systems.
     
     Args:
         message: Outreach message to save
+        jsonl_file: OUTREACH_JSONL opened for binary append
+        
+    Returns:
+        True if the message was saved
     """
-    outreach_dir = DATA_DIR / "outreach"
-    outreach_dir.mkdir(exist_ok=True)
-    
-    # Custom JSON encoder to handle various data types
-    class CustomEncoder(json.JSONEncoder):
-        def default(self, obj):
-            if isinstance(obj, uuid.UUID):
-                return str(obj)
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            return super().default(obj)
-    
     try:
         # Create OutreachMessage object for validation
         outreach_obj = OutreachMessage(
@@ -445,8 +800,8 @@ def save_outreach_message(message: Dict[str, Any]):
             call_to_action=message["call_to_action"]
         )
         
-        # Convert to dictionary for saving
-        outreach_dict = outreach_obj.model_dump()
+        # Convert to a JSON-compatible dictionary (UUIDs as strings) for saving
+        outreach_dict = outreach_obj.model_dump(mode="json")
         
         # Add additional fields
         outreach_dict["stakeholder_name"] = message["stakeholder_name"]
@@ -456,10 +811,7 @@ def save_outreach_message(message: Dict[str, Any]):
         outreach_dict["value_propositions"] = message["value_propositions"]
         outreach_dict["stakeholder_role"] = message["stakeholder_role"]
         
-        # Save to file
-        outreach_file = outreach_dir / f"{message['id']}.json"
-        with open(outreach_file, "w") as f:
-            json.dump(outreach_dict, f, indent=2, cls=CustomEncoder)
+        jsonl_file.write(_json_dumps(outreach_dict) + b"\n")
             
         print(f"Saved outreach message for: {message['stakeholder_name']} at {message['company_name']}")
         return True
@@ -467,7 +819,7 @@ def save_outreach_message(message: Dict[str, Any]):
         print(f"Error saving outreach message for {message.get('stakeholder_name', 'unknown')}: {str(e)}")
         return False
 
-def run_outreach_generation(limit_stakeholders=None, debug=False):
+def run_outreach_generation(limit_stakeholders=None, debug=False, max_concurrent=8, use_batch=False, use_cache=True):
     """
     Run the complete outreach message generation process:
     1. Load prioritized stakeholders from prior analysis
@@ -481,6 +833,9 @@ def run_outreach_generation(limit_stakeholders=None, debug=False):
     Args:
         limit_stakeholders: Optional limit on number of stakeholders to process
         debug: Whether to print debug information
+        max_concurrent: Number of concurrent API requests (1 runs sequentially)
+        use_batch: Whether to generate messages through the OpenAI Batch API
+        use_cache: Whether to reuse cached drafts for identical prompts
     """
     print("Starting outreach message generation process...")
     
@@ -496,35 +851,42 @@ def run_outreach_generation(limit_stakeholders=None, debug=False):
         stakeholders = stakeholders[:limit_stakeholders]
         print(f"Limiting generation to {limit_stakeholders} stakeholders.")
     
-    # Step 2 & 3: Generate outreach messages for each stakeholder
-    outreach_messages = []
+    # Step 2: Get company details for each stakeholder
+    targets = []
+    # Read every needed company file in one directory pass before any API calls
+    companies_by_id = load_companies({stakeholder.get("company_id", "") for stakeholder in stakeholders})
     for stakeholder in stakeholders:
         # Get company details
-        company = get_company_details(stakeholder)
+        company = get_company_details(stakeholder, companies_by_id)
         
         # Skip if company is unknown or has issues
         if not company or company.get("name", "") == "Unknown Company":
             print(f"Skipping outreach for {stakeholder['name']} (company data unavailable)")
             continue
         
-        # Generate personalized message
-        message = generate_outreach_message(stakeholder, company)
-        outreach_messages.append(message)
-        
+        targets.append((stakeholder, company))
+    
+    # Step 3: Generate personalized messages
+    if use_batch:
+        outreach_messages = generate_outreach_messages_batch(targets)
+    elif max_concurrent > 1:
+        outreach_messages = generate_outreach_messages_concurrent(targets, max_concurrent, use_cache)
+    else:
+        outreach_messages = [generate_outreach_message(stakeholder, company, use_cache) for stakeholder, company in targets]
+    
+    for (stakeholder, company), message in zip(targets, outreach_messages):
         if debug:
             print(f"\nOutreach for {stakeholder['name']} at {company['name']}:")
             print(f"Subject: {message['subject']}")
             print(f"Personalization: {', '.join(message['personalization_factors'])}")
             print(f"Message: {message['message_body'][:100]}...")
-        
-        # Small delay to avoid API rate limits
-        time.sleep(0.5)
     
     # Step 4: Save outreach messages
     saved_count = 0
-    for message in outreach_messages:
-        if save_outreach_message(message):
-            saved_count += 1
+    with open(OUTREACH_JSONL, "ab") as jsonl_file:
+        for message in outreach_messages:
+            if save_outreach_message(message, jsonl_file):
+                saved_count += 1
     
     # Track budget usage
     log_usage_report()
@@ -548,11 +910,17 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description="DuPont Tedlar Outreach Message Generation Module")
     parser.add_argument("--limit", type=int, default=None, help="Limit the number of stakeholders to process")
     parser.add_argument("--debug", action="store_true", help="Enable debug output")
+    parser.add_argument("--batch", action="store_true", help="Generate messages through the OpenAI Batch API (50%% cheaper, slower)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of concurrent API requests (1 runs sequentially)")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the LLM instead of reusing cached drafts")
     return parser.parse_args()
 
 if __name__ == "__main__":
     args = parse_arguments()
     run_outreach_generation(
         limit_stakeholders=args.limit,
-        debug=args.debug
+        debug=args.debug,
+        max_concurrent=args.concurrency,
+        use_batch=args.batch,
+        use_cache=not args.no_cache
     )
\ No newline at end of file
@@ -6,14 +6,90 @@ allocation across the lead generation pipeline.
 """
 
 import json
-import pandas as pd
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from config.config import DATA_DIR, BUDGET_ALLOCATION
+from src.utils.usage_log import TOKEN_USAGE_FILE, flush_usage_log
 
-# Token usage file path
-TOKEN_USAGE_FILE = DATA_DIR / "token_usage.json"
+# Prefer orjson for parsing usage records and writing reports (falls back to stdlib json if unavailable)
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# Running totals over the usage file, advanced by reading only the records
+# appended since the last check, so budget checks don't rescan the whole file
+_usage_totals = None
+_usage_offset = 0
+_usage_lock = threading.Lock()
+
+def _empty_usage_totals() -> Dict[str, Any]:
+    return {"total_cost_usd": 0.0, "by_model": {}, "by_module": {}}
+
+def _add_usage_record(totals: Dict[str, Any], record: Dict[str, Any]):
+    """
+    Add one usage record to the running totals.
+    """
+    cost = record.get("total_cost_usd", 0.0)
+    totals["total_cost_usd"] += cost
+    
+    model_usage = totals["by_model"].setdefault(record.get("model"), {
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+        "total_cost_usd": 0.0
+    })
+    model_usage["prompt_tokens"] += record.get("prompt_tokens", 0)
+    model_usage["completion_tokens"] += record.get("completion_tokens", 0)
+    model_usage["total_tokens"] += record.get("total_tokens", 0)
+    model_usage["total_cost_usd"] += cost
+    
+    module_usage = totals["by_module"].setdefault(record.get("module"), {
+        "total_tokens": 0,
+        "total_cost_usd": 0.0
+    })
+    module_usage["total_tokens"] += record.get("total_tokens", 0)
+    module_usage["total_cost_usd"] += cost
+
+def _refresh_usage_totals() -> Dict[str, Any]:
+    """
+    Bring the running totals up to date with the token usage file.
+    
+    Only bytes appended since the last refresh are read, which also picks up
+    records written by other processes. A file that shrank (e.g. was reset)
+    is read again from the start.
+    """
+    global _usage_totals, _usage_offset
+    # Make records still buffered by this process visible to the read below
+    flush_usage_log()
+    
+    with _usage_lock:
+        size = TOKEN_USAGE_FILE.stat().st_size if TOKEN_USAGE_FILE.exists() else 0
+        if _usage_totals is None or size < _usage_offset:
+            _usage_totals = _empty_usage_totals()
+            _usage_offset = 0
+        
+        if size > _usage_offset:
+            with open(TOKEN_USAGE_FILE, "rb") as f:
+                f.seek(_usage_offset)
+                data = f.read(size - _usage_offset)
+            # Leave a partially written trailing record for the next refresh
+            complete = data.rfind(b"\n") + 1
+            for line in data[:complete].splitlines():
+                if line.strip():
+                    _add_usage_record(_usage_totals, _json_loads(line))
+            _usage_offset += complete
+        
+        return _usage_totals
 
 def get_current_usage() -> Dict[str, Any]:
     """
@@ -25,49 +101,16 @@ def get_current_usage() -> Dict[str, Any]:
     Returns:
         Dictionary with usage statistics and remaining budget
     """
-    if not TOKEN_USAGE_FILE.exists():
-        return {
-            "total_cost_usd": 0.0,
-            "budget_used_percentage": 0.0,
-            "budget_remaining_usd": 200.0,
-            "usage_by_model": {},
-            "usage_by_module": {}
-        }
-    
-    # Read token usage records
-    with open(TOKEN_USAGE_FILE, "r") as f:
-        usage_records = [json.loads(line) for line in f if line.strip()]
-    
-    if not usage_records:
-        return {
-            "total_cost_usd": 0.0,
-            "budget_used_percentage": 0.0,
-            "budget_remaining_usd": 200.0,
-            "usage_by_model": {},
-            "usage_by_module": {}
-        }
-    
-    # Convert to DataFrame for analysis
-    df = pd.DataFrame(usage_records)
+    totals = _refresh_usage_totals()
     
     # Calculate total cost
-    total_cost = df["total_cost_usd"].sum()
+    total_cost = totals["total_cost_usd"]
     budget_remaining = 200.0 - total_cost
     budget_used_percentage = (total_cost / 200.0) * 100
     
-    # Group by model
-    model_usage = df.groupby("model").agg({
-        "prompt_tokens": "sum",
-        "completion_tokens": "sum",
-        "total_tokens": "sum",
-        "total_cost_usd": "sum"
-    }).to_dict("index")
-    
-    # Group by module
-    module_usage = df.groupby("module").agg({
-        "total_tokens": "sum",
-        "total_cost_usd": "sum"
-    }).to_dict("index")
+    # Copy the totals so callers can't mutate the running state
+    model_usage = {model: dict(usage) for model, usage in totals["by_model"].items()}
+    module_usage = {module: dict(usage) for module, usage in totals["by_module"].items()}
     
     # Calculate budget allocation vs actual
     module_budget_allocation = {
@@ -123,8 +166,8 @@ def log_usage_report() -> Dict[str, Any]:
     reports_dir.mkdir(exist_ok=True)
     
     report_file = reports_dir / f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(report_file, "w") as f:
-        json.dump(report, f, indent=2)
+    with open(report_file, "wb") as f:
+        f.write(_json_dumps_pretty(report))
     
     return report
 
@@ -5,12 +5,31 @@ This module defines the core data structures used throughout the application,
 establishing relationships between events, companies, stakeholders, and outreach messages.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from uuid import uuid4, UUID
 
-class Event(BaseModel):
+class TrustedModel(BaseModel):
+    """
+    Base model for pipeline records that can be rebuilt from trusted data.
+    
+    Records are validated once, when first created from LLM or API output.
+    Callers reading them back from the pipeline's own validated JSON files
+    should use fast_make, which skips validation.
+    """
+    
+    @classmethod
+    def fast_make(cls, **data):
+        """
+        Build a model from already-validated data without running validation.
+        
+        Defaults are still applied to missing fields, but values are not
+        checked or coerced, so never pass external input here.
+        """
+        return cls.model_construct(**data)
+
+class Event(TrustedModel):
     """
     Represents an industry event relevant to DuPont Tedlar's target market.
     
@@ -33,10 +52,9 @@ class Event(BaseModel):
     source: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.now)
     
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
-class Company(BaseModel):
+class Company(TrustedModel):
     """
     Represents a potential customer company for DuPont Tedlar products.
     
@@ -72,10 +90,10 @@ class Company(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     last_updated: datetime = Field(default_factory=datetime.now)
     
-    class Config:
-        arbitrary_types_allowed = True
+    # Records are validated once and then only read, never mutated
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
-class Stakeholder(BaseModel):
+class Stakeholder(TrustedModel):
     """
     Represents a decision-maker at a target company who influences
     purchasing decisions relevant to DuPont Tedlar products.
@@ -98,18 +116,26 @@ class Stakeholder(BaseModel):
     # Role-specific data for personalization
     responsibilities: List[str] = []
     interests: List[str] = []
+    influence: Optional[str] = None
+    relevant_benefits: List[str] = []
+    
+    # Pipeline context carried through to outreach generation
+    company_name: Optional[str] = None
+    customer_segment: Optional[str] = None
+    priority: Optional[str] = None
     
     # API integration placeholders
     sales_navigator_url: Optional[str] = None
+    sales_navigator_query: Optional[Any] = None
     clay_api_identifier: Optional[str] = None
     
     # Metadata
     created_at: datetime = Field(default_factory=datetime.now)
     
-    class Config:
-        arbitrary_types_allowed = True
+    # Records are validated once and then only read, never mutated
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
-class OutreachMessage(BaseModel):
+class OutreachMessage(TrustedModel):
     """
     Represents a personalized outreach message for a specific stakeholder.
     
@@ -133,8 +159,7 @@ class OutreachMessage(BaseModel):
     # Metadata
     created_at: datetime = Field(default_factory=datetime.now)
     
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 class TokenUsage(BaseModel):
     """
@@ -153,5 +178,4 @@ class TokenUsage(BaseModel):
     operation: str  # Specific operation performed
     timestamp: datetime = Field(default_factory=datetime.now)
     
-    class Config:
-        arbitrary_types_allowed = True
\ No newline at end of file
+    model_config = ConfigDict(arbitrary_types_allowed=True)
\ No newline at end of file
@@ -5,83 +5,57 @@ This module implements a multi-criteria scoring system to identify and prioritiz
 high-quality leads based on DuPont Tedlar's preference for conversion-focused leads.
 """
 
+import numpy as np
 from typing import Dict, Any, List, Optional
-from config.config import LEAD_SCORING
+from src.utils.lead_scoring_core import (
+    CRITERION_WEIGHTS, CRITERION_TITLES, PRIORITY_TITLES,
+    calculate_lead_score, get_lead_priority, should_use_premium_model
+)
 
-def calculate_lead_score(scores: Dict[str, float]) -> float:
-    """
-    Calculate weighted lead score based on multiple criteria.
-    
-    This weighted approach ensures that the most important factors
-    (industry relevance and product fit) have greater influence on
-    the final qualification score.
-    
-    Args:
-        scores: Dictionary of criterion scores (0-10 scale)
-        
-    Returns:
-        Weighted score on 0-10 scale
-    """
-    # Extract weights from configuration
-    weights = {
-        criterion: data["weight"] 
-        for criterion, data in LEAD_SCORING["criteria"].items()
-    }
-    
-    # Calculate weighted score
-    weighted_score = 0.0
-    total_weight_applied = 0.0
-    
-    for criterion, weight in weights.items():
-        if criterion in scores:
-            weighted_score += scores[criterion] * weight
-            total_weight_applied += weight
-    
-    # Normalize if not all criteria were provided
-    if total_weight_applied > 0:
-        weighted_score = weighted_score / total_weight_applied * 10.0
-    
-    return round(weighted_score, 1)
+# Column order of the score matrices accepted by calculate_lead_scores_batch
+SCORING_CRITERIA = tuple(criterion for criterion, _ in CRITERION_WEIGHTS)
+_W = np.asarray([weight for _, weight in CRITERION_WEIGHTS], dtype=np.float64)
 
-def get_lead_priority(score: float) -> str:
+def calculate_lead_scores_batch(scores_matrix: np.ndarray) -> np.ndarray:
     """
-    Determine lead priority based on qualification score.
+    Calculate weighted lead scores for many leads at once.
     
-    This function determines how much attention and resource 
-    should be allocated to a particular lead.
+    Vectorized equivalent of calculate_lead_score: each row is weighted with
+    one matrix-vector product, and rows with missing criteria (NaN) are
+    normalized over the criteria they do have.
     
     Args:
-        score: Lead qualification score (0-10)
+        scores_matrix: (N, k) array of criterion scores (0-10 scale), columns
+            in SCORING_CRITERIA order, NaN for criteria not provided
         
     Returns:
-        Priority level string
+        Array of N weighted scores on 0-10 scale
     """
-    thresholds = LEAD_SCORING["thresholds"]
+    scores_matrix = np.asarray(scores_matrix, dtype=np.float64)
+    present = ~np.isnan(scores_matrix)
+    weighted_scores = np.where(present, scores_matrix, 0.0) @ _W
+    total_weight_applied = present @ _W
     
-    if score >= thresholds["exceptional"]:
-        return "exceptional"
-    elif score >= thresholds["high_priority"]:
-        return "high_priority"
-    elif score >= thresholds["minimum_qualification"]:
-        return "qualified"
-    else:
-        return "unqualified"
+    # Normalize if not all criteria were provided
+    normalized = np.divide(
+        weighted_scores,
+        total_weight_applied,
+        out=np.zeros_like(weighted_scores),
+        where=total_weight_applied > 0
+    ) * 10.0
+    return np.round(normalized, 1)
 
-def should_use_premium_model(score: float) -> bool:
-    """
-    Determine if a premium LLM model should be used for this lead.
-    
-    This function helps optimize the $200 budget by reserving premium
-    models for high-potential leads.
-    
-    Args:
-        score: Lead qualification score (0-10)
-        
-    Returns:
-        Boolean indicating whether to use premium model
-    """
-    # Use premium models only for high priority and exceptional leads
-    return score >= LEAD_SCORING["thresholds"]["high_priority"]
+# Recommendation text by lead priority
+_RECOMMENDATIONS = {
+    "exceptional": "**Recommendation:** High-priority target for immediate outreach. "
+                   "Use premium resources for personalized engagement.",
+    "high_priority": "**Recommendation:** Strong prospect for focused outreach. "
+                     "Allocate resources for detailed personalization.",
+    "qualified": "**Recommendation:** Qualified lead worth pursuing. "
+                 "Standard outreach approach recommended.",
+    "unqualified": "**Recommendation:** Below qualification threshold. "
+                   "Consider for awareness campaigns only."
+}
 
 def generate_qualification_rationale(
     company_name: str,
@@ -109,41 +83,30 @@ def generate_qualification_rationale(
     overall_score = calculate_lead_score(scores)
     priority = get_lead_priority(overall_score)
     
-    # Format the rationale
-    rationale = f"## Qualification Rationale for {company_name}\n\n"
-    rationale += f"**Overall Score:** {overall_score}/10 ({priority.replace('_', ' ').title()})\n\n"
+    # Format the rationale, collecting sections and joining them once
+    parts = [f"## Qualification Rationale for {company_name}\n\n"]
+    parts.append(f"**Overall Score:** {overall_score}/10 ({PRIORITY_TITLES[priority]})\n\n")
     
-    rationale += "### Scoring Breakdown\n\n"
+    parts.append("### Scoring Breakdown\n\n")
     for criterion, score in scores.items():
-        criterion_name = criterion.replace('_', ' ').title()
-        rationale += f"**{criterion_name}:** {score}/10\n"
+        criterion_name = CRITERION_TITLES.get(criterion) or criterion.replace('_', ' ').title()
+        parts.append(f"**{criterion_name}:** {score}/10\n")
         if criterion in justifications:
-            rationale += f"- {justifications[criterion]}\n\n"
+            parts.append(f"- {justifications[criterion]}\n\n")
     
     if use_cases:
-        rationale += "### Potential Use Cases\n\n"
+        parts.append("### Potential Use Cases\n\n")
         for use_case in use_cases:
-            rationale += f"- {use_case}\n"
-        rationale += "\n"
+            parts.append(f"- {use_case}\n")
+        parts.append("\n")
     
     if pain_points:
-        rationale += "### Addressable Pain Points\n\n"
+        parts.append("### Addressable Pain Points\n\n")
         for pain_point in pain_points:
-            rationale += f"- {pain_point}\n"
-        rationale += "\n"
+            parts.append(f"- {pain_point}\n")
+        parts.append("\n")
     
     # Add recommendation based on priority
-    if priority == "exceptional":
-        rationale += "**Recommendation:** High-priority target for immediate outreach. "
-        rationale += "Use premium resources for personalized engagement."
-    elif priority == "high_priority":
-        rationale += "**Recommendation:** Strong prospect for focused outreach. "
-        rationale += "Allocate resources for detailed personalization."
-    elif priority == "qualified":
-        rationale += "**Recommendation:** Qualified lead worth pursuing. "
-        rationale += "Standard outreach approach recommended."
-    else:
-        rationale += "**Recommendation:** Below qualification threshold. "
-        rationale += "Consider for awareness campaigns only."
+    parts.append(_RECOMMENDATIONS[priority])
     
-    return rationale
\ No newline at end of file
+    return "".join(parts)
\ No newline at end of file
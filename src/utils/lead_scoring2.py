@@ -5,84 +5,42 @@ This module implements a multi-criteria scoring system to identify and prioritiz
 high-quality leads based on DuPont Tedlar's preference for conversion-focused leads.
 """
 
-from typing import Dict, Any, List, Optional
-from config.config import LEAD_SCORING, TEDLAR_CONTEXT
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from config.config import TEDLAR_CONTEXT
+from src.utils.lead_scoring_core import (
+    CRITERION_TITLES, PRIORITY_TITLES,
+    calculate_lead_score, get_lead_priority, should_use_premium_model
+)
 
-def calculate_lead_score(scores: Dict[str, float]) -> float:
-    """
-    Calculate weighted lead score based on multiple criteria.
-    
-    This weighted approach ensures that the most important factors
-    (industry relevance and product fit) have greater influence on
-    the final qualification score.
-    
-    Args:
-        scores: Dictionary of criterion scores (0-10 scale)
-        
-    Returns:
-        Weighted score on 0-10 scale
-    """
-    # Extract weights from configuration
-    weights = {
-        criterion: data["weight"] 
-        for criterion, data in LEAD_SCORING["criteria"].items()
-    }
-    
-    # Calculate weighted score
-    weighted_score = 0.0
-    total_weight_applied = 0.0
-    
-    for criterion, weight in weights.items():
-        if criterion in scores:
-            weighted_score += scores[criterion] * weight
-            total_weight_applied += weight
-    
-    # Normalize if not all criteria were provided
-    if total_weight_applied > 0:
-        weighted_score = weighted_score / total_weight_applied * 10.0
-    
-    return round(weighted_score, 1)
+# Lowercase keywords that point to each customer segment
+_SEGMENT_KEYWORDS = {
+    "Large Format Print Providers": ["large format", "print", "printing", "wide format", "banner"],
+    "Fleet Graphics Specialists": ["fleet", "vehicle", "wrap", "automotive", "transit"],
+    "Architectural Graphics Manufacturers": ["architectural", "building", "facade", "interior", "wayfinding"],
+    "Outdoor Advertising Companies": ["billboard", "outdoor advertising", "signage", "out-of-home"],
+    "Sign Manufacturing Companies": ["sign", "signage", "display", "visual communication"],
+    "Material Distributors & Converters": ["distributor", "converter", "reseller", "supplier"]
+}
 
-def get_lead_priority(score: float) -> str:
-    """
-    Determine lead priority based on qualification score.
-    
-    This function determines how much attention and resource 
-    should be allocated to a particular lead.
-    
-    Args:
-        score: Lead qualification score (0-10)
-        
-    Returns:
-        Priority level string
-    """
-    thresholds = LEAD_SCORING["thresholds"]
-    
-    if score >= thresholds["exceptional"]:
-        return "exceptional"
-    elif score >= thresholds["high_priority"]:
-        return "high_priority"
-    elif score >= thresholds["minimum_qualification"]:
-        return "qualified"
-    else:
-        return "unqualified"
+# Flat (keyword, segment) pairs, so keyword checks run in a single loop
+_SEGMENT_PAIRS = tuple((keyword, segment) for segment, keywords in _SEGMENT_KEYWORDS.items() for keyword in keywords)
 
-def should_use_premium_model(score: float) -> bool:
-    """
-    Determine if a premium LLM model should be used for this lead.
-    
-    This function helps optimize the $200 budget by reserving premium
-    models for high-potential leads.
-    
-    Args:
-        score: Lead qualification score (0-10)
-        
-    Returns:
-        Boolean indicating whether to use premium model
-    """
-    # Use premium models only for high priority and exceptional leads
-    return score >= LEAD_SCORING["thresholds"]["high_priority"]
+# Match every segment keyword in one pass with an Aho-Corasick automaton when
+# pyahocorasick is available (falls back to per-keyword substring checks)
+try:
+    import ahocorasick
+    
+    _SEGMENT_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _ in _SEGMENT_PAIRS:
+        _SEGMENT_AUTOMATON.add_word(_keyword, _keyword)
+    _SEGMENT_AUTOMATON.make_automaton()
+except ImportError:
+    _SEGMENT_AUTOMATON = None
 
+@lru_cache(maxsize=1024)
 def identify_customer_segment(company_description: str) -> str:
     """
     Identify which of Tedlar's customer segments a company belongs to.
@@ -96,35 +54,35 @@ def identify_customer_segment(company_description: str) -> str:
     Returns:
         Name of the most likely customer segment
     """
-    segments = TEDLAR_CONTEXT["target_customer_segments"]
-    segment_keywords = {
-        "Large Format Print Providers": ["large format", "print", "printing", "wide format", "banner"],
-        "Fleet Graphics Specialists": ["fleet", "vehicle", "wrap", "automotive", "transit"],
-        "Architectural Graphics Manufacturers": ["architectural", "building", "facade", "interior", "wayfinding"],
-        "Outdoor Advertising Companies": ["billboard", "outdoor advertising", "signage", "out-of-home"],
-        "Sign Manufacturing Companies": ["sign", "signage", "display", "visual communication"],
-        "Material Distributors & Converters": ["distributor", "converter", "reseller", "supplier"]
-    }
-    
-    # Count keyword matches for each segment
-    match_counts = {segment: 0 for segment in segment_keywords}
     company_description_lower = company_description.lower()
     
-    for segment, keywords in segment_keywords.items():
-        for keyword in keywords:
-            if keyword.lower() in company_description_lower:
-                match_counts[segment] += 1
+    # Count matched keywords for each segment (each keyword counts once). Counts
+    # are built in segment order so most_common breaks ties toward the first
+    # segment listed.
+    if _SEGMENT_AUTOMATON is not None:
+        matched_keywords = {keyword for _, keyword in _SEGMENT_AUTOMATON.iter(company_description_lower)}
+        match_counts = Counter(segment for keyword, segment in _SEGMENT_PAIRS if keyword in matched_keywords)
+    else:
+        match_counts = Counter(segment for keyword, segment in _SEGMENT_PAIRS if keyword in company_description_lower)
     
     # Find segment with highest match count
-    best_segment = max(match_counts.items(), key=lambda x: x[1])
+    top = match_counts.most_common(1)
     
     # If no matches, return default
-    if best_segment[1] == 0:
+    if not top:
         return "Unknown"
     
-    return best_segment[0]
+    return top[0][0]
 
-def get_segment_decision_makers(segment: str) -> List[str]:
+# Decision makers and pain points by segment name, with generic defaults for
+# segments not found
+_SEGMENTS = TEDLAR_CONTEXT["target_customer_segments"]
+_SEGMENT_DM = {segment_info["segment"]: tuple(segment_info["decision_makers"]) for segment_info in _SEGMENTS}
+_SEGMENT_PP = {segment_info["segment"]: tuple(segment_info["pain_points"]) for segment_info in _SEGMENTS}
+_DEFAULT_DM = ("Production Manager", "Operations Director", "Purchasing Manager")
+_DEFAULT_PP = ("Premature graphic failure", "Warranty claims", "Color fading")
+
+def get_segment_decision_makers(segment: str) -> Tuple[str, ...]:
     """
     Get the typical decision-maker roles for a specific customer segment.
     
@@ -132,16 +90,11 @@ def get_segment_decision_makers(segment: str) -> List[str]:
         segment: Name of the customer segment
         
     Returns:
-        List of typical decision-maker job titles for that segment
+        Typical decision-maker job titles for that segment
     """
-    for segment_info in TEDLAR_CONTEXT["target_customer_segments"]:
-        if segment_info["segment"] == segment:
-            return segment_info["decision_makers"]
-    
-    # Default generic decision makers if segment not found
-    return ["Production Manager", "Operations Director", "Purchasing Manager"]
+    return _SEGMENT_DM.get(segment, _DEFAULT_DM)
 
-def get_segment_pain_points(segment: str) -> List[str]:
+def get_segment_pain_points(segment: str) -> Tuple[str, ...]:
     """
     Get the typical pain points for a specific customer segment.
     
@@ -149,50 +102,72 @@ def get_segment_pain_points(segment: str) -> List[str]:
         segment: Name of the customer segment
         
     Returns:
-        List of typical pain points for that segment
+        Typical pain points for that segment
     """
-    for segment_info in TEDLAR_CONTEXT["target_customer_segments"]:
-        if segment_info["segment"] == segment:
-            return segment_info["pain_points"]
-    
-    # Default generic pain points if segment not found
-    return ["Premature graphic failure", "Warranty claims", "Color fading"]
+    return _SEGMENT_PP.get(segment, _DEFAULT_PP)
+
+# Use case keywords for each product line, compiled into one alternation per product
+_PRODUCT_KEYWORDS = {
+    "Tedlar CLR": ["clear", "transparency", "color", "visibility"],
+    "Tedlar TWH": ["white", "backlit", "illuminated", "light", "bright"],
+    "Tedlar TMT": ["matte", "glare", "reflection", "non-reflective"],
+    "Tedlar TCW": ["wide", "large", "custom width", "oversized"],
+    "Tedlar TAW": ["architectural", "building", "facade", "interior"]
+}
+_PRODUCT_PATTERNS = {
+    name: re.compile("|".join(re.escape(keyword) for keyword in keywords))
+    for name, keywords in _PRODUCT_KEYWORDS.items()
+}
 
-def identify_relevant_product_lines(use_cases: List[str]) -> List[Dict[str, str]]:
+@lru_cache(maxsize=1024)
+def identify_relevant_product_lines(use_cases: Tuple[str, ...]) -> Tuple[Dict[str, str], ...]:
     """
     Identify which Tedlar product lines are most relevant based on use cases.
     
+    Results are memoized, so use cases are passed as a tuple and the
+    product lines come back as a tuple that callers must not modify.
+    
     Args:
-        use_cases: List of potential use cases for the lead
+        use_cases: Potential use cases for the lead
         
     Returns:
-        List of relevant Tedlar product lines with descriptions
+        Relevant Tedlar product lines with descriptions
     """
     product_lines = TEDLAR_CONTEXT["product_lines"]
-    use_cases_lower = [case.lower() for case in use_cases]
+    # Keywords never span a newline, so one search over the joined use cases
+    # matches exactly when some keyword appears in some use case
+    use_cases_lower = "\n".join(use_cases).lower()
     
     relevant_products = []
-    
-    # Map keywords to product lines
-    product_keywords = {
-        "Tedlar CLR": ["clear", "transparency", "color", "visibility"],
-        "Tedlar TWH": ["white", "backlit", "illuminated", "light", "bright"],
-        "Tedlar TMT": ["matte", "glare", "reflection", "non-reflective"],
-        "Tedlar TCW": ["wide", "large", "custom width", "oversized"],
-        "Tedlar TAW": ["architectural", "building", "facade", "interior"]
-    }
-    
     for product in product_lines:
-        for keyword in product_keywords.get(product["name"], []):
-            if any(keyword in case for case in use_cases_lower):
-                relevant_products.append(product)
-                break
+        pattern = _PRODUCT_PATTERNS.get(product["name"])
+        if pattern is not None and pattern.search(use_cases_lower):
+            relevant_products.append(product)
     
     # If no matches, return top 2 most versatile products
     if not relevant_products:
-        return [product_lines[0], product_lines[2]]
+        return (product_lines[0], product_lines[2])
     
-    return relevant_products
+    return tuple(relevant_products)
+
+# Recommendation templates by lead priority, filled with the lead's top pain
+# point, product line and use case
+_RECOMMENDATION_TEMPLATES = {
+    "exceptional": "**High-priority target for immediate outreach.** "
+                   "Use premium resources for personalized engagement with specific focus on addressing {pain_point}. "
+                   "Emphasize Tedlar's 30-40% lower lifetime costs despite premium pricing, with specific focus on the {product} product line.",
+    "high_priority": "**Strong prospect for focused outreach.** "
+                     "Allocate resources for detailed personalization. "
+                     "Focus messaging on {pain_point} and Tedlar's proven performance advantages.",
+    "qualified": "**Qualified lead worth pursuing.** "
+                 "Standard outreach approach recommended with segment-specific messaging. "
+                 "Highlight Tedlar's benefits for {use_case}.",
+    "unqualified": "**Below qualification threshold.** "
+                   "Consider for awareness campaigns only or revisit if circumstances change."
+}
+
+# Wording used in place of the top pain point when a lead has none
+_PAIN_POINT_FALLBACK = {"exceptional": "key pain points", "high_priority": "industry challenges"}
 
 def generate_qualification_rationale(
     company_name: str,
@@ -200,7 +175,8 @@ def generate_qualification_rationale(
     justifications: Dict[str, str],
     use_cases: List[str],
     pain_points: List[str],
-    customer_segment: Optional[str] = None
+    customer_segment: Optional[str] = None,
+    relevant_products: Optional[Sequence[Dict[str, str]]] = None
 ) -> str:
     """
     Generate a detailed qualification rationale for a lead.
@@ -215,6 +191,8 @@ def generate_qualification_rationale(
         use_cases: Potential use cases for Tedlar
         pain_points: Company pain points Tedlar can address
         customer_segment: Identified customer segment, if known
+        relevant_products: Relevant product lines, if already identified for
+            this company (e.g. when regenerating a rationale)
         
     Returns:
         Formatted qualification rationale
@@ -227,67 +205,58 @@ def generate_qualification_rationale(
         company_desc = " ".join(justifications.values())
         customer_segment = identify_customer_segment(company_desc)
     
-    # Get relevant product lines
-    relevant_products = identify_relevant_product_lines(use_cases)
+    # Get relevant product lines if not provided (the recommendation needs at least one)
+    if not relevant_products:
+        relevant_products = identify_relevant_product_lines(tuple(use_cases))
     
-    # Format the rationale
-    rationale = f"## Qualification Rationale for {company_name}\n\n"
+    # Format the rationale, collecting sections and joining them once
+    parts = [f"## Qualification Rationale for {company_name}\n\n"]
     
     if customer_segment != "Unknown":
-        rationale += f"**Customer Segment:** {customer_segment}\n"
+        parts.append(f"**Customer Segment:** {customer_segment}\n")
     
-    rationale += f"**Overall Score:** {overall_score}/10 ({priority.replace('_', ' ').title()})\n\n"
+    parts.append(f"**Overall Score:** {overall_score}/10 ({PRIORITY_TITLES[priority]})\n\n")
     
-    rationale += "### Scoring Breakdown\n\n"
+    parts.append("### Scoring Breakdown\n\n")
     for criterion, score in scores.items():
-        criterion_name = criterion.replace('_', ' ').title()
-        rationale += f"**{criterion_name}:** {score}/10\n"
+        criterion_name = CRITERION_TITLES.get(criterion) or criterion.replace('_', ' ').title()
+        parts.append(f"**{criterion_name}:** {score}/10\n")
         if criterion in justifications:
-            rationale += f"- {justifications[criterion]}\n\n"
+            parts.append(f"- {justifications[criterion]}\n\n")
     
     # Include relevant product lines
     if relevant_products:
-        rationale += "### Recommended Tedlar Products\n\n"
+        parts.append("### Recommended Tedlar Products\n\n")
         for product in relevant_products:
-            rationale += f"- **{product['name']}**: {product['description']}\n"
-        rationale += "\n"
+            parts.append(f"- **{product['name']}**: {product['description']}\n")
+        parts.append("\n")
     
     if use_cases:
-        rationale += "### Potential Use Cases\n\n"
+        parts.append("### Potential Use Cases\n\n")
         for use_case in use_cases:
-            rationale += f"- {use_case}\n"
-        rationale += "\n"
+            parts.append(f"- {use_case}\n")
+        parts.append("\n")
     
     if pain_points:
-        rationale += "### Addressable Pain Points\n\n"
+        parts.append("### Addressable Pain Points\n\n")
         for pain_point in pain_points:
-            rationale += f"- {pain_point}\n"
-        rationale += "\n"
+            parts.append(f"- {pain_point}\n")
+        parts.append("\n")
     
     # Get typical decision-makers for this segment
     decision_makers = get_segment_decision_makers(customer_segment)
     if decision_makers:
-        rationale += "### Target Decision Makers\n\n"
+        parts.append("### Target Decision Makers\n\n")
         for role in decision_makers:
-            rationale += f"- {role}\n"
-        rationale += "\n"
+            parts.append(f"- {role}\n")
+        parts.append("\n")
     
     # Add recommendation based on priority
-    rationale += "### Recommendation\n\n"
-    if priority == "exceptional":
-        rationale += "**High-priority target for immediate outreach.** "
-        rationale += f"Use premium resources for personalized engagement with specific focus on addressing {pain_points[0] if pain_points else 'key pain points'}. "
-        rationale += f"Emphasize Tedlar's 30-40% lower lifetime costs despite premium pricing, with specific focus on the {relevant_products[0]['name']} product line."
-    elif priority == "high_priority":
-        rationale += "**Strong prospect for focused outreach.** "
-        rationale += "Allocate resources for detailed personalization. "
-        rationale += f"Focus messaging on {pain_points[0] if pain_points else 'industry challenges'} and Tedlar's proven performance advantages."
-    elif priority == "qualified":
-        rationale += "**Qualified lead worth pursuing.** "
-        rationale += "Standard outreach approach recommended with segment-specific messaging. "
-        rationale += f"Highlight Tedlar's benefits for {use_cases[0] if use_cases else 'relevant applications'}."
-    else:
-        rationale += "**Below qualification threshold.** "
-        rationale += "Consider for awareness campaigns only or revisit if circumstances change."
-    
-    return rationale
\ No newline at end of file
+    parts.append("### Recommendation\n\n")
+    parts.append(_RECOMMENDATION_TEMPLATES[priority].format(
+        pain_point=pain_points[0] if pain_points else _PAIN_POINT_FALLBACK.get(priority, ""),
+        product=relevant_products[0]['name'],
+        use_case=use_cases[0] if use_cases else 'relevant applications'
+    ))
+    
+    return "".join(parts)
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Core Lead Scoring Rules for DuPont Tedlar.
+
+This module holds the weighted scoring and priority thresholds shared by the
+lead scoring modules, so the rules are defined (and read from configuration)
+in one place.
+"""
+
+from typing import Dict
+from config.config import LEAD_SCORING
+
+# Criterion weights are static configuration, so read them once at import
+CRITERION_WEIGHTS = tuple((criterion, data["weight"]) for criterion, data in LEAD_SCORING["criteria"].items())
+
+# Priority thresholds, bound once so priority checks are plain float compares
+_TH_EXC, _TH_HIGH, _TH_MIN = (
+    LEAD_SCORING["thresholds"][key] for key in ("exceptional", "high_priority", "minimum_qualification")
+)
+
+# Display names for criteria and priorities in qualification rationales
+CRITERION_TITLES = {criterion: criterion.replace('_', ' ').title() for criterion in LEAD_SCORING["criteria"]}
+PRIORITY_TITLES = {
+    priority: priority.replace('_', ' ').title()
+    for priority in ("exceptional", "high_priority", "qualified", "unqualified")
+}
+
+def calculate_lead_score(scores: Dict[str, float]) -> float:
+    """
+    Calculate weighted lead score based on multiple criteria.
+    
+    This weighted approach ensures that the most important factors
+    (industry relevance and product fit) have greater influence on
+    the final qualification score.
+    
+    Args:
+        scores: Dictionary of criterion scores (0-10 scale)
+        
+    Returns:
+        Weighted score on 0-10 scale
+    """
+    # Calculate weighted score
+    weighted_score = 0.0
+    total_weight_applied = 0.0
+    
+    for criterion, weight in CRITERION_WEIGHTS:
+        score = scores.get(criterion)
+        if score is not None:
+            weighted_score += score * weight
+            total_weight_applied += weight
+    
+    # Normalize if not all criteria were provided
+    if total_weight_applied > 0:
+        weighted_score = weighted_score / total_weight_applied * 10.0
+    
+    return round(weighted_score, 1)
+
+def get_lead_priority(score: float) -> str:
+    """
+    Determine lead priority based on qualification score.
+    
+    This function determines how much attention and resource 
+    should be allocated to a particular lead.
+    
+    Args:
+        score: Lead qualification score (0-10)
+        
+    Returns:
+        Priority level string
+    """
+    if score >= _TH_EXC:
+        return "exceptional"
+    elif score >= _TH_HIGH:
+        return "high_priority"
+    elif score >= _TH_MIN:
+        return "qualified"
+    else:
+        return "unqualified"
+
+def should_use_premium_model(score: float) -> bool:
+    """
+    Determine if a premium LLM model should be used for this lead.
+    
+    This function helps optimize the $200 budget by reserving premium
+    models for high-potential leads.
+    
+    Args:
+        score: Lead qualification score (0-10)
+        
+    Returns:
+        Boolean indicating whether to use premium model
+    """
+    # Use premium models only for high priority and exceptional leads
+    return score >= _TH_HIGH
@@ -0,0 +1,63 @@
+"""
+Token Usage Log Writer for DuPont Tedlar Lead Generation.
+
+This module owns the append-only token usage file. Records are written
+through one long-lived, buffered file handle instead of reopening the file
+for every LLM call; readers call flush_usage_log() first so budget checks
+always see every record logged so far.
+"""
+
+import json
+import atexit
+import threading
+from typing import Dict, Any
+from config.config import DATA_DIR
+
+# Prefer orjson for encoding records (falls back to stdlib json if unavailable)
+try:
+    import orjson
+
+    def _encode_record(record: Dict[str, Any]) -> bytes:
+        return orjson.dumps(record) + b"\n"
+except ImportError:
+    def _encode_record(record: Dict[str, Any]) -> bytes:
+        return (json.dumps(record) + "\n").encode("utf-8")
+
+# Token usage file path
+TOKEN_USAGE_FILE = DATA_DIR / "token_usage.json"
+
+_usage_file = None
+_usage_lock = threading.Lock()
+
+def append_usage_record(usage_record: Dict[str, Any]):
+    """
+    Append a usage record to the token usage file.
+
+    Args:
+        usage_record: Usage record to log
+    """
+    global _usage_file
+    line = _encode_record(usage_record)
+    with _usage_lock:
+        if _usage_file is None:
+            _usage_file = open(TOKEN_USAGE_FILE, "ab", buffering=1 << 16)
+            atexit.register(close_usage_log)
+        _usage_file.write(line)
+
+def flush_usage_log():
+    """
+    Flush buffered usage records to disk.
+    """
+    with _usage_lock:
+        if _usage_file is not None:
+            _usage_file.flush()
+
+def close_usage_log():
+    """
+    Flush and close the usage log file handle.
+    """
+    global _usage_file
+    with _usage_lock:
+        if _usage_file is not None:
+            _usage_file.close()
+            _usage_file = None